@@ -0,0 +1,9 @@
+"""
+Micro-benchmarks of page object operations, kept apart from the functional tests.
+
+Run with:
+    python -m selenium_tests.benchmarks.runner --standin --out results.json
+    python -m selenium_tests.benchmarks.scenarios --standin --users add_employee=4,filter_employees=4
+"""
+
+from .runner import Benchmark, measure, compare_results
@@ -0,0 +1,148 @@
+from selenium_tests.page_objects import EmployeeListPage, HomePage
+from selenium_tests.support.seeding import SeedingClient
+from selenium_tests.test_data import TestDataLoader, UniqueDataGenerator
+from .runner import Benchmark
+
+# Employees present for the list page benchmarks
+LIST_EMPLOYEES = 100
+
+class BenchmarkEnvironment:
+    """
+    The EMS the benchmarks run against and its data.
+    
+    With the stand-in, table sizes are set by writing to its store directly
+    (creating 10k employees over HTTP would take longer than the benchmarks)
+    and the data is reset between benchmarks. A live EMS keeps its own
+    employees: only the missing ones are created, and those are deleted again
+    when a smaller size is set and when the environment is closed.
+    """
+    
+    def __init__(self, ems_url=None):
+        """
+        Args:
+            ems_url (str, optional): Running EMS to use; starts the stand-in when None
+        """
+        self.server = None
+        if ems_url is None:
+            from selenium_tests.support.ems_standin import StandinServer
+            self.server = StandinServer().start()
+            self.server.snapshot()
+            ems_url = self.server.url
+        self.base_url = ems_url
+        self.seeder = SeedingClient(ems_url)
+        self.generator = UniqueDataGenerator(seed="benchmarks")
+        self.departments = TestDataLoader.get_department_names()
+        # Names of the employees set_employee_count created on a live EMS
+        self._created = []
+        if self.server is None:
+            self.seeder.ensure_departments(self.departments)
+    
+    def set_employee_count(self, count):
+        """
+        Make the application hold (at least) count employees.
+        
+        Args:
+            count (int): Number of employees
+        """
+        if self.server is None:
+            existing = len(self.seeder.get_employee_names())
+            while existing > count and self._created:
+                self.seeder.delete_employee(self._created.pop())
+                existing -= 1
+            for record in self.generator.employees(max(count - existing, 0), self.departments):
+                self.seeder.create_employee(record)
+                self._created.append(record["name"])
+            return
+        
+        records = self.generator.employees(count, self.departments)
+        self.server.restore()
+        self.seeder.reset()
+        store = self.server.store
+        for record in records:
+            store.save_employee(dict(record, department=str(store.find_department_id(record["department"])),
+                                     salary=str(record["salary"])))
+    
+    def new_employee(self):
+        """
+        Returns:
+            dict: Employee data for a form submission
+        """
+        return self.generator.employee(departments=self.departments)
+    
+    def delete_created_employees(self):
+        """Delete the employees set_employee_count created on a live EMS."""
+        while self._created:
+            self.seeder.delete_employee(self._created.pop())
+    
+    def close(self):
+        """Delete the created employees, close the seeding client and stop the stand-in."""
+        try:
+            self.delete_created_employees()
+        finally:
+            self.seeder.close()
+        if self.server is not None:
+            self.server.stop()
+
+def build_benchmarks(environment, table_sizes=(10, 1000, 10000)):
+    """
+    Build the page object benchmarks.
+    
+    Args:
+        environment (BenchmarkEnvironment): Application under test
+        table_sizes (list): Employee counts for the table read benchmarks
+        
+    Returns:
+        list: Benchmark objects in run order
+    """
+    def open_list(driver):
+        environment.set_employee_count(LIST_EMPLOYEES)
+        return EmployeeListPage(driver).open_employee_list()
+    
+    def open_search(driver):
+        list_page = open_list(driver)
+        return list_page, list_page.read_table().rows[LIST_EMPLOYEES // 2].name
+    
+    def open_home(driver):
+        return HomePage(driver).open_home_page()
+    
+    def new_employee_form(state):
+        state.update(employee=environment.new_employee(),
+                     form=EmployeeListPage(state["driver"]).open_employee_list().click_add_new_employee())
+        return state
+    
+    def open_employee_form(driver):
+        environment.set_employee_count(LIST_EMPLOYEES)
+        return new_employee_form({"driver": driver})
+    
+    def submit_employee_form(state):
+        state["form"].fill_employee_form(state["employee"]).submit_form()
+    
+    def next_employee_form(state):
+        # Keeps the employee count constant across repeats
+        environment.seeder.delete_employee(state["employee"]["name"])
+        new_employee_form(state)
+    
+    benchmarks = [
+        Benchmark("home.open_home_page", lambda home: home.open_home_page(), open_home),
+        Benchmark("home.navigate_to_employees",
+                  lambda home: home.open_home_page().navigate_to_employees().get_employee_count(), open_home),
+        Benchmark("employee_list.get_employee_count", lambda page: page.get_employee_count(), open_list),
+        Benchmark("employee_list.search_employee",
+                  lambda state: state[0].search_employee(state[1]).get_employee_count(), open_search),
+        Benchmark("employee_list.filter_by_status",
+                  lambda page: page.filter_by_status("Inactive").get_employee_count(), open_list),
+        Benchmark("employee_form.fill_and_submit", submit_employee_form, open_employee_form,
+                  after_run=next_employee_form),
+    ]
+    
+    # A live EMS keeps its existing employees, so the table can be larger
+    # than the requested size; the rows actually read are reported
+    for size in table_sizes:
+        def open_table(driver, size=size):
+            environment.set_employee_count(size)
+            return EmployeeListPage(driver).open_employee_list()
+        
+        benchmarks.append(Benchmark(f"employee_list.read_table[{size}]", lambda page: page.read_table(), open_table,
+                                    describe=lambda page: {"rows": page.get_employee_count()}))
+    
+    return benchmarks
@@ -0,0 +1,247 @@
+"""
+Measure page object latency percentiles and throughput against a local EMS.
+
+Usage:
+    python -m selenium_tests.benchmarks.runner --standin --out results.json
+    python -m selenium_tests.benchmarks.runner --standin --compare baseline.json --only table
+    python -m selenium_tests.benchmarks.runner --ems-url http://127.0.0.1:8000 --repeat 50
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from selenium_tests.support.driver_factory import DEFAULT_BASE_URL, create_chrome_driver
+from selenium_tests.support.instrumentation import StepRecorder
+
+class Benchmark:
+    """
+    One timed operation.
+    
+    setup(driver) runs once before warmup and returns the state passed to
+    every run(state) call; only run is timed. after_run(state) runs untimed
+    after every run, e.g. to delete what the run created and return to the
+    starting page. describe(state) can add facts about what was measured to
+    the results, e.g. the actual table size.
+    """
+    
+    def __init__(self, name, run, setup=None, describe=None, after_run=None):
+        """
+        Args:
+            name (str): Benchmark name, e.g. 'employee_list.search_employee'
+            run (callable): Operation to time, called with the setup result
+            setup (callable, optional): Called with the driver before the measurements
+            describe (callable, optional): Called with the setup result, returns
+                                           a dict added to the results
+            after_run (callable, optional): Called with the setup result after every run
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.describe = describe
+        self.after_run = after_run
+
+def percentile(samples, fraction):
+    """
+    Percentile of samples with linear interpolation between closest ranks.
+    
+    Args:
+        samples (list): Measurements
+        fraction (float): Percentile as a fraction, e.g. 0.9
+        
+    Returns:
+        float: Interpolated percentile
+    """
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+def measure(benchmark, driver, warmup=3, repeat=20):
+    """
+    Run a benchmark and summarize its timings.
+    
+    Args:
+        benchmark (Benchmark): Benchmark to run
+        driver (WebDriver): Driver created by create_chrome_driver
+        warmup (int): Untimed runs before measuring
+        repeat (int): Timed runs
+        
+    Returns:
+        dict: Latency statistics in milliseconds, throughput in operations
+              per second and WebDriver commands per operation
+              
+    Raises:
+        ValueError: If repeat is less than 1
+    """
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat}")
+    state = benchmark.setup(driver) if benchmark.setup else driver
+    for _ in range(warmup):
+        benchmark.run(state)
+        if benchmark.after_run:
+            benchmark.after_run(state)
+    
+    recorder = StepRecorder()
+    samples = []
+    try:
+        for _ in range(repeat):
+            driver.step_recorder = recorder
+            start = time.perf_counter()
+            benchmark.run(state)
+            samples.append((time.perf_counter() - start) * 1000)
+            # The clean-up's commands are not part of the operation
+            driver.step_recorder = None
+            if benchmark.after_run:
+                benchmark.after_run(state)
+    finally:
+        driver.step_recorder = None
+    
+    facts = benchmark.describe(state) if benchmark.describe else {}
+    return {
+        **facts,
+        "repeat": repeat,
+        "mean_ms": statistics.fmean(samples),
+        "stdev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min_ms": min(samples),
+        "p50_ms": percentile(samples, 0.5),
+        "p90_ms": percentile(samples, 0.9),
+        "p99_ms": percentile(samples, 0.99),
+        "max_ms": max(samples),
+        "ops_per_sec": 1000 * len(samples) / sum(samples),
+        "commands_per_op": recorder.commands / repeat,
+    }
+
+def compare_results(current, baseline, threshold=0.1):
+    """
+    Compare the median latency of two runs.
+    
+    Args:
+        current (dict): Results of this run by benchmark name
+        baseline (dict): Results of an earlier run by benchmark name
+        threshold (float): Relative change reported as a regression or improvement
+        
+    Returns:
+        list: (name, baseline p50, current p50, relative change, verdict) for
+              every benchmark in both runs
+    """
+    comparison = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["p50_ms"], result["p50_ms"]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            verdict = "slower"
+        elif change < -threshold:
+            verdict = "faster"
+        else:
+            verdict = "same"
+        comparison.append((name, before, after, change, verdict))
+    return comparison
+
+def format_results(results):
+    """
+    Format results as a text table.
+    
+    Args:
+        results (dict): Results by benchmark name
+        
+    Returns:
+        str: Report text
+    """
+    lines = [f"{'benchmark':<40} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'ops/s':>8} {'cmds':>6} {'rows':>6}"]
+    for name, result in results.items():
+        rows = result.get("rows", "")
+        lines.append(f"{name:<40} {result['p50_ms']:>9.2f} {result['p90_ms']:>9.2f} {result['p99_ms']:>9.2f} "
+                     f"{result['ops_per_sec']:>8.1f} {result['commands_per_op']:>6.1f} {rows:>6}")
+    return "\n".join(lines)
+
+def format_comparison(comparison):
+    """
+    Format a compare_results() list as a text table.
+    
+    Args:
+        comparison (list): Rows from compare_results()
+        
+    Returns:
+        str: Report text
+    """
+    lines = [f"{'benchmark':<40} {'before':>9} {'after':>9} {'change':>8}"]
+    for name, before, after, change, verdict in comparison:
+        lines.append(f"{name:<40} {before:>9.2f} {after:>9.2f} {change:>+8.1%}  {verdict}")
+    return "\n".join(lines)
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ems-url", default=DEFAULT_BASE_URL, help="Base URL of a running EMS")
+    parser.add_argument("--standin", action="store_true",
+                        help="Start the stand-in EMS instead of using --ems-url")
+    parser.add_argument("--chromedriver", default=None, help="Path to the chromedriver executable")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed runs before measuring")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs per benchmark")
+    parser.add_argument("--only", default=None, help="Only run benchmarks whose name contains this text")
+    parser.add_argument("--table-sizes", default="10,1000,10000",
+                        help="Comma-separated employee counts for the table read benchmarks")
+    parser.add_argument("--out", default=None, help="Write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Compare against results from an earlier --out")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="Relative p50 change reported as slower/faster (default 0.1)")
+    parser.add_argument("--fail-on-regression", action="store_true",
+                        help="Exit with status 1 when a benchmark is slower than --compare")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup cannot be negative")
+    
+    from .page_benchmarks import BenchmarkEnvironment, build_benchmarks
+    
+    environment = BenchmarkEnvironment(None if args.standin else args.ems_url.rstrip("/"))
+    driver = create_chrome_driver(base_url=environment.base_url, driver_path=args.chromedriver)
+    results = {}
+    try:
+        table_sizes = [int(size) for size in args.table_sizes.split(",") if size]
+        for benchmark in build_benchmarks(environment, table_sizes):
+            if args.only and args.only not in benchmark.name:
+                continue
+            print(f"Running {benchmark.name}", file=sys.stderr)
+            results[benchmark.name] = measure(benchmark, driver, warmup=args.warmup, repeat=args.repeat)
+    finally:
+        driver.quit()
+        environment.close()
+    
+    print(format_results(results))
+    if args.out:
+        with open(args.out, 'w') as output_file:
+            json.dump({
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "warmup": args.warmup,
+                "results": results,
+            }, output_file, indent=2)
+    
+    if args.compare:
+        with open(args.compare, 'r') as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        comparison = compare_results(results, baseline, args.threshold)
+        print()
+        print(format_comparison(comparison))
+        if args.fail_on_regression and any(row[4] == "slower" for row in comparison):
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,310 @@
+"""
+Run page object flows for many concurrent users against one EMS and report latency and throughput.
+
+Usage:
+    python -m selenium_tests.benchmarks.scenarios --standin --users add_employee=4,filter_employees=4
+    python -m selenium_tests.benchmarks.scenarios --standin --driver http --users add_employee=20 --duration 30
+    python -m selenium_tests.benchmarks.scenarios --ems-url http://127.0.0.1:8000 --max-sessions 4 --out load.json
+"""
+
+import argparse
+import asyncio
+import functools
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from selenium_tests.page_objects import EmployeeListPage
+from selenium_tests.support.driver_factory import DEFAULT_BASE_URL, create_chrome_driver
+from selenium_tests.support.driver_pool import DriverPool
+from .runner import _git_commit, percentile
+
+class Flow:
+    """
+    A user scenario made of page object calls.
+    
+    run(driver, iteration) drives one session through the scenario once and
+    is called from a worker thread; it raises to report a failed iteration.
+    """
+    
+    def __init__(self, name, run):
+        """
+        Args:
+            name (str): Flow name, e.g. 'add_employee'
+            run (callable): Called with a driver and the user's iteration number
+        """
+        self.name = name
+        self.run = run
+
+def build_flows(environment):
+    """
+    Build the concurrent user flows.
+    
+    Args:
+        environment (BenchmarkEnvironment): Application under test
+        
+    Returns:
+        dict: Flow objects by name
+    """
+    def add_employee(driver, iteration):
+        result = (EmployeeListPage(driver).open_employee_list().click_add_new_employee()
+                  .fill_employee_form(environment.new_employee()).submit_form())
+        if not isinstance(result, EmployeeListPage):
+            raise AssertionError(f"Employee form was not accepted, landed on {driver.current_url}")
+    
+    def filter_employees(driver, iteration):
+        status = "Active" if iteration % 2 == 0 else "Inactive"
+        EmployeeListPage(driver).open_employee_list().filter_by_status(status).get_employee_count()
+    
+    def read_employees(driver, iteration):
+        EmployeeListPage(driver).open_employee_list().read_table()
+    
+    flows = [
+        Flow("add_employee", add_employee),
+        Flow("filter_employees", filter_employees),
+        Flow("read_employees", read_employees),
+    ]
+    return {flow.name: flow for flow in flows}
+
+class Orchestrator:
+    """
+    Drives many WebDriver sessions from one process with asyncio.
+    
+    Every simulated user is a task that repeats its flow; the blocking
+    page object calls run on a thread pool so the sessions proceed in
+    parallel. A user keeps one browser from a DriverPool for all its
+    iterations, so its session carries over between them like a real
+    user's. At most max_sessions browser commands run at once, so the users
+    of all flows take turns. A user whose browser fails to launch is
+    reported as an error of its flow without stopping the others.
+    """
+    
+    def __init__(self, driver_factory, max_sessions=4):
+        """
+        Args:
+            driver_factory (callable): Zero-argument callable returning a new driver
+            max_sessions (int): Maximum number of sessions driven at once
+        """
+        self.driver_factory = driver_factory
+        self.max_sessions = max_sessions
+    
+    def run(self, users, iterations=5, duration=None):
+        """
+        Run the users to completion.
+        
+        Args:
+            users (list): (Flow, number of users) pairs
+            iterations (int): Flow runs per user
+            duration (float, optional): Stop starting new iterations after this
+                                        many seconds instead of counting iterations
+                                        
+        Returns:
+            dict: Per flow latency statistics and the run's total throughput
+        """
+        return asyncio.run(self.run_async(users, iterations, duration))
+    
+    async def run_async(self, users, iterations=5, duration=None):
+        """
+        Coroutine version of run() for callers that already have an event loop.
+        
+        Args:
+            users (list): (Flow, number of users) pairs
+            iterations (int): Flow runs per user
+            duration (float, optional): Time limit in seconds instead of iterations
+            
+        Returns:
+            dict: Same as run()
+        """
+        loop = asyncio.get_running_loop()
+        sessions = asyncio.Semaphore(self.max_sessions)
+        pool = DriverPool(self.driver_factory, size=self.max_sessions)
+        samples = {flow.name: [] for flow, _ in users}
+        errors = {flow.name: [] for flow, _ in users}
+        start = time.perf_counter()
+        deadline = start + duration if duration is not None else None
+        
+        def keep_going(iteration):
+            if deadline is not None:
+                return time.perf_counter() < deadline
+            return iteration < iterations
+        
+        async def user(flow):
+            try:
+                async with sessions:
+                    driver = await loop.run_in_executor(executor, pool.acquire)
+            except Exception as error:
+                errors[flow.name].append(f"{type(error).__name__}: {error}")
+                return
+            
+            try:
+                iteration = 0
+                while keep_going(iteration):
+                    async with sessions:
+                        try:
+                            began = time.perf_counter()
+                            await loop.run_in_executor(executor, flow.run, driver, iteration)
+                            samples[flow.name].append((time.perf_counter() - began) * 1000)
+                        except Exception as error:
+                            errors[flow.name].append(f"{type(error).__name__}: {error}")
+                    iteration += 1
+            finally:
+                async with sessions:
+                    await loop.run_in_executor(executor, pool.release, driver)
+        
+        with ThreadPoolExecutor(max_workers=self.max_sessions, thread_name_prefix="ems-user") as executor:
+            try:
+                await asyncio.gather(*(user(flow) for flow, count in users for _ in range(count)))
+            finally:
+                await loop.run_in_executor(executor, pool.close)
+        
+        wall_seconds = time.perf_counter() - start
+        for name, timings in samples.items():
+            if not timings and not errors[name]:
+                errors[name].append("No iteration completed")
+        return summarize(samples, errors, wall_seconds)
+
+def summarize(samples, errors, wall_seconds):
+    """
+    Summarize the timings of a run.
+    
+    Args:
+        samples (dict): Successful iteration latencies in milliseconds by flow name
+        errors (dict): Error messages by flow name
+        wall_seconds (float): Duration of the whole run
+        
+    Returns:
+        dict: 'flows' with count, errors and latency percentiles per flow,
+              and 'total' with operations, errors, seconds and ops_per_sec
+    """
+    flows = {}
+    for name, timings in samples.items():
+        flows[name] = {
+            "count": len(timings),
+            "errors": len(errors[name]),
+            "first_error": errors[name][0] if errors[name] else None,
+            "mean_ms": statistics.fmean(timings) if timings else None,
+            "p50_ms": percentile(timings, 0.5) if timings else None,
+            "p90_ms": percentile(timings, 0.9) if timings else None,
+            "p99_ms": percentile(timings, 0.99) if timings else None,
+            "max_ms": max(timings) if timings else None,
+            "ops_per_sec": len(timings) / wall_seconds if wall_seconds else 0.0,
+        }
+    operations = sum(flow["count"] for flow in flows.values())
+    return {
+        "flows": flows,
+        "total": {
+            "operations": operations,
+            "errors": sum(flow["errors"] for flow in flows.values()),
+            "seconds": wall_seconds,
+            "ops_per_sec": operations / wall_seconds if wall_seconds else 0.0,
+        },
+    }
+
+def format_summary(summary):
+    """
+    Format a summarize() result as a text table.
+    
+    Args:
+        summary (dict): Result of Orchestrator.run()
+        
+    Returns:
+        str: Report text
+    """
+    def ms(value):
+        return f"{value:>9.2f}" if value is not None else f"{'-':>9}"
+    
+    lines = [f"{'flow':<20} {'runs':>6} {'errors':>6} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'ops/s':>8}"]
+    for name, flow in summary["flows"].items():
+        lines.append(f"{name:<20} {flow['count']:>6} {flow['errors']:>6} {ms(flow['p50_ms'])} "
+                     f"{ms(flow['p90_ms'])} {ms(flow['p99_ms'])} {flow['ops_per_sec']:>8.1f}")
+    total = summary["total"]
+    lines.append(f"{'total':<20} {total['operations']:>6} {total['errors']:>6} "
+                 f"{total['seconds']:>8.1f}s {'':>19} {total['ops_per_sec']:>8.1f}")
+    for name, flow in summary["flows"].items():
+        if flow["first_error"]:
+            lines.append(f"{name} first error: {flow['first_error']}")
+    return "\n".join(lines)
+
+def parse_users(text, flows):
+    """
+    Parse a --users value.
+    
+    Args:
+        text (str): Comma-separated flow=count pairs, e.g. 'add_employee=4,filter_employees=2'
+        flows (dict): Known flows by name
+        
+    Returns:
+        list: (Flow, count) pairs
+        
+    Raises:
+        ValueError: If a flow is unknown or a count is not a positive integer
+    """
+    users = []
+    for item in text.split(","):
+        name, _, count = item.strip().partition("=")
+        if name not in flows:
+            raise ValueError(f"Unknown flow '{name}', expected one of {sorted(flows)}")
+        if not count.isdigit() or int(count) < 1:
+            raise ValueError(f"User count for '{name}' must be a positive integer, got '{count}'")
+        users.append((flows[name], int(count)))
+    return users
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ems-url", default=DEFAULT_BASE_URL, help="Base URL of a running EMS")
+    parser.add_argument("--standin", action="store_true",
+                        help="Start the stand-in EMS instead of using --ems-url")
+    parser.add_argument("--driver", choices=("chrome", "http"), default="chrome",
+                        help="Browser to drive; 'http' needs no Chrome (server-rendered flows only)")
+    parser.add_argument("--chromedriver", default=None, help="Path to the chromedriver executable")
+    parser.add_argument("--users", default="add_employee=4,filter_employees=4",
+                        help="Comma-separated flow=count pairs (default add_employee=4,filter_employees=4)")
+    parser.add_argument("--max-sessions", type=int, default=4,
+                        help="Maximum number of browser sessions driven at once (default 4)")
+    parser.add_argument("--iterations", type=int, default=5, help="Flow runs per user (default 5)")
+    parser.add_argument("--duration", type=float, default=None,
+                        help="Run each user for this many seconds instead of --iterations")
+    parser.add_argument("--employees", type=int, default=100,
+                        help="Employees present before the users start (default 100)")
+    parser.add_argument("--out", default=None, help="Write the results to this JSON file")
+    args = parser.parse_args(argv)
+    
+    from .page_benchmarks import BenchmarkEnvironment
+    
+    environment = BenchmarkEnvironment(None if args.standin else args.ems_url.rstrip("/"))
+    try:
+        users = parse_users(args.users, build_flows(environment))
+        environment.set_employee_count(args.employees)
+        if args.driver == "http":
+            from selenium_tests.support.http_driver import HttpDriver
+            driver_factory = functools.partial(HttpDriver, environment.base_url)
+        else:
+            driver_path = args.chromedriver
+            if driver_path is None:
+                # Resolve once instead of in every thread that launches a browser
+                from selenium_tests.support.driver_factory import DEFAULT_CACHE_DIR
+                from selenium_tests.support.driver_resolver import ChromeDriverResolver
+                driver_path = ChromeDriverResolver(DEFAULT_CACHE_DIR).resolve()
+            driver_factory = functools.partial(create_chrome_driver, base_url=environment.base_url,
+                                               driver_path=driver_path)
+        
+        orchestrator = Orchestrator(driver_factory, max_sessions=args.max_sessions)
+        summary = orchestrator.run(users, iterations=args.iterations, duration=args.duration)
+    finally:
+        environment.close()
+    
+    print(format_summary(summary))
+    if args.out:
+        with open(args.out, 'w') as output_file:
+            json.dump({
+                "commit": _git_commit(),
+                "users": args.users,
+                "max_sessions": args.max_sessions,
+                "summary": summary,
+            }, output_file, indent=2)
+    return 1 if summary["total"]["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,31 +1,429 @@
+import functools
+import os
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
+from selenium_tests.support.driver_factory import DEFAULT_BASE_URL, DEFAULT_CACHE_DIR, create_chrome_driver
+from selenium_tests.support.driver_pool import DriverPool
+from selenium_tests.support.driver_resolver import ChromeDriverResolver
+from selenium_tests.support.django_instance import DjangoInstance
+from selenium_tests.support.ems_standin import StandinServer
+from selenium_tests.support.request_filter import RequestCountPlugin, RequestPolicy, collect_request_counts
+from selenium_tests.support.instrumentation import StepRecorder, StepTimingPlugin, set_recorder
+from selenium_tests.support.seeding import SeedingClient
+from selenium_tests.support.sharding import load_durations, parse_shard, plan_shards
+from selenium_tests.test_data import TestDataLoader, UniqueDataGenerator, RowRef, get_data_source, set_generator
+from selenium_tests.test_data.data_stream import parse_slice
+from selenium_tests.test_data.test_data_loader import DATA_DIR
+
+def pytest_addoption(parser):
+    """Register command line options for the test run."""
+    group = parser.getgroup("ems", "Employee Management System tests")
+    group.addoption("--ems-url", default=DEFAULT_BASE_URL,
+                    help="Base URL of the Employee Management System under test")
+    group.addoption("--ems-server", default="external", choices=["external", "standin", "django"],
+                    help="'external' tests the server at --ems-url; 'standin' starts the "
+                         "in-process stand-in EMS with in-memory data on a free port; 'django' "
+                         "starts a private EMS server per xdist worker on its own database copy")
+    group.addoption("--ems-project", default=None,
+                    help="EMS Django project directory for --ems-server=django (default: ../ems)")
+    group.addoption("--ems-settings", default="ems.settings",
+                    help="Settings module of the EMS project for --ems-server=django")
+    group.addoption("--ems-template-db", default=None,
+                    help="Migrated SQLite database copied for every worker "
+                         "(default: db.sqlite3 in the EMS project)")
+    group.addoption("--db-restore", default="test", choices=["none", "test", "module"],
+                    help="When a started EMS server's data is reset to the session snapshot: "
+                         "after every test, after every module, or never")
+    group.addoption("--data-seed", default="0",
+                    help="Seed for generated test data; each test derives its own RNG from it "
+                         "and its test id, so data is reproducible per test")
+    group.addoption("--data-slice", default=None,
+                    help="Rows of data_source files to run, as start:stop[:step]")
+    group.addoption("--data-sample", type=int, default=None,
+                    help="Run only this many rows of each data_source file, "
+                         "picked reproducibly from --data-seed")
+    group.addoption("--test-scheduling", default="history", choices=["history", "default"],
+                    help="With pytest-xdist -n: 'history' hands out the slowest tests first using "
+                         "durations recorded in earlier runs; 'default' keeps xdist's load scheduling")
+    group.addoption("--shard", default=None,
+                    help="Run only shard i of N (e.g. 2/4); shards are balanced by --shard-durations")
+    group.addoption("--shard-durations", default=None,
+                    help="Durations file (from merge_reports --durations-out) for --shard; "
+                         "defaults to this machine's recorded durations")
+    group.addoption("--driver", default="chrome", choices=["chrome", "http"],
+                    help="Run page objects in headless Chrome, or in the browserless HTTP driver "
+                         "(server-rendered flows only, no JavaScript)")
+    group.addoption("--driver-pool-size", type=int, default=1,
+                    help="Number of browsers kept alive per worker and reused between tests "
+                         "(0 launches a new browser for every test)")
+    group.addoption("--chromedriver", default=None,
+                    help="Path to the chromedriver executable (defaults to CHROMEDRIVER_PATH, "
+                         "then PATH, then the per-Chrome-version cache)")
+    group.addoption("--chromedriver-offline", action="store_true", default=False,
+                    help="Never download chromedriver; fail if no local or cached driver is found")
+    group.addoption("--block-resources", default="",
+                    help="Comma-separated resource types the browser does not load: "
+                         "font, image, media, stylesheet, script")
+    group.addoption("--block-external", action="store_true", default=False,
+                    help="Fail requests to every host except the application's and --allow-host at once")
+    group.addoption("--allow-host", action="append", default=[],
+                    help="Host still reachable with --block-external, e.g. a CDN (repeatable)")
+    group.addoption("--asset-cache", default=None,
+                    help="Disk cache directory reused across runs (one subdirectory per browser), "
+                         "so static assets load once")
+    group.addoption("--page-load-strategy", default="normal", choices=["normal", "eager"],
+                    help="Wait for the full page load, or only until the DOM is ready (eager); "
+                         "page objects wait for the matching document.readyState after navigating")
+    group.addoption("--wait-timeout", type=float, default=10,
+                    help="Default timeout in seconds for page object waits")
+    group.addoption("--poll-frequency", type=float, default=0.1,
+                    help="Polling interval in seconds for page object waits")
+    group.addoption("--wait-backend", default="poll", choices=["poll", "observer"],
+                    help="How page objects wait for elements: WebDriverWait polling, or a "
+                         "MutationObserver script that answers as soon as the DOM matches")
+    group.addoption("--fill-strategy", default="keys", choices=["keys", "insertText", "js"],
+                    help="How page objects fill forms: per-key send_keys, DevTools "
+                         "Input.insertText, or a single execute_script")
+    group.addoption("--step-report", default=None,
+                    help="Write per-test page object step timings and WebDriver command counts to this JSON file")
+
+def pytest_configure(config):
+    """Register custom markers, step timing and the duration-based xdist scheduler."""
+    config.addinivalue_line(
+        "markers", "fresh_driver: run the test in a newly launched browser instead of a pooled one"
+    )
+    config.addinivalue_line(
+        "markers", "fill_strategy(name): form fill strategy for this test ('keys', 'insertText' or 'js')"
+    )
+    config.addinivalue_line(
+        "markers", "browser_only: the test needs JavaScript or DevTools, so it is skipped with --driver http"
+    )
+    config.addinivalue_line(
+        "markers", "read_only: the test does not change EMS data, so no database restore is needed after it"
+    )
+    config.addinivalue_line(
+        "markers", "command_budget(commands=None, seconds=None): fail the test if its body issues more "
+                   "WebDriver commands or runs longer than this"
+    )
+    config.addinivalue_line(
+        "markers", "data_source(file_name): run the test once per row of a CSV or JSONL file in "
+                   "test_data/; the test receives the row through the data_row fixture"
+    )
+    
+    # Bad option values are usage errors, not collection errors of the data tests
+    if config.getoption("data_slice"):
+        try:
+            parse_slice(config.getoption("data_slice"))
+        except ValueError as error:
+            raise pytest.UsageError(str(error))
+    
+    config.pluginmanager.register(StepTimingPlugin(config), "ems-step-timing")
+    if config.getoption("block_resources") or config.getoption("block_external") or config.getoption("asset_cache"):
+        config.pluginmanager.register(RequestCountPlugin(), "ems-request-counts")
+    
+    if config.getoption("test_scheduling") == "history" and config.pluginmanager.hasplugin("xdist") \
+            and getattr(config, "cache", None) is not None:
+        from selenium_tests.support.scheduling import DurationSchedulingPlugin
+        config.pluginmanager.register(DurationSchedulingPlugin(config), "ems-duration-scheduling")
+
+def pytest_generate_tests(metafunc):
+    """Parametrize data_source tests with one lightweight row reference per row."""
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None:
+        return
+    
+    config = metafunc.config
+    source = get_data_source(os.path.join(DATA_DIR, marker.args[0]))
+    data_slice = config.getoption("data_slice")
+    numbers = source.select(
+        data_slice=parse_slice(data_slice) if data_slice else None,
+        sample=config.getoption("data_sample"),
+        seed=config.getoption("data_seed"),
+    )
+    rows = [RowRef(source, number) for number in numbers]
+    metafunc.parametrize("data_row", rows, ids=[row.id for row in rows], indirect=True)
+
+def pytest_collection_modifyitems(config, items):
+    """Keep only this node's tests when --shard is given."""
+    shard = config.getoption("shard")
+    if not shard:
+        return
+    
+    try:
+        index, count = parse_shard(shard)
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+    
+    # Only a frozen durations file is guaranteed to be the same on every
+    # node; the local history differs per machine and changes with every
+    # run, which would let shards overlap or miss tests. Without one, every
+    # test weighs the same.
+    durations_file = config.getoption("shard_durations")
+    durations = load_durations(durations_file) if durations_file else {}
+    
+    selected = set(plan_shards([item.nodeid for item in items], durations, count)[index - 1])
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+def configure_driver(driver, request):
+    """
+    Apply the run's and the test's page object settings to a driver and
+    give it a fresh step recorder for the test.
+    
+    Args:
+        driver (WebDriver): Driver handed to a test
+        request: pytest request of the test
+    """
+    config = request.config
+    driver.wait_timeout = config.getoption("wait_timeout")
+    driver.poll_frequency = config.getoption("poll_frequency")
+    driver.wait_backend = config.getoption("wait_backend")
+    driver.page_ready_state = "interactive" if config.getoption("page_load_strategy") == "eager" else "complete"
+    
+    marker = request.node.get_closest_marker("fill_strategy")
+    driver.fill_strategy = marker.args[0] if marker else config.getoption("fill_strategy")
+    
+    driver.step_recorder = request.node.step_recorder = StepRecorder()
+    set_recorder(driver.step_recorder)
+
+def finish_driver(driver, request):
+    """
+    Detach a driver from its test before it is released or discarded.
+    
+    Session cleanup is not part of the test's steps; the browser's request
+    counts are recorded for the run summary when a request policy is active.
+    
+    Args:
+        driver (WebDriver): Driver handed to the test
+        request: pytest request of the test
+    """
+    driver.step_recorder = None
+    set_recorder(None)
+    # Element handles of this test's pages are no use to the next test
+    driver.element_cache = None
+    if getattr(driver, "request_policy", None) is not None:
+        request.node.user_properties.append((RequestCountPlugin.PROPERTY, collect_request_counts(driver)))
+
+@pytest.fixture(scope="session")
+def chromedriver_path(request):
+    """
+    Fixture resolving the chromedriver binary once per session.
+    
+    The resolver's cache lives in the pytest cache, or in the user cache
+    directory when the cache provider is disabled (-p no:cacheprovider).
+    
+    Returns:
+        str: Path to the chromedriver executable
+    """
+    cache = getattr(request.config, "cache", None)
+    resolver = ChromeDriverResolver(
+        cache.mkdir("chromedriver") if cache is not None else DEFAULT_CACHE_DIR,
+        explicit_path=request.config.getoption("chromedriver"),
+        allow_download=not request.config.getoption("chromedriver_offline"),
+    )
+    return resolver.resolve()
+
+@pytest.fixture(scope="session")
+def ems_server(request, tmp_path_factory):
+    """
+    Fixture starting this worker's own EMS server unless an external one is used.
+    
+    With --ems-server=standin the in-process stand-in is started; with
+    --ems-server=django a private Django server is started on a copy of the
+    template database. Each xdist worker runs this fixture in its own process,
+    so every worker gets its own server, port and data.
+    
+    Returns:
+        StandinServer or DjangoInstance: Running server, or None when testing an external server
+    """
+    mode = request.config.getoption("ems_server")
+    if mode == "standin":
+        server = StandinServer()
+    elif mode == "django":
+        project_dir = request.config.getoption("ems_project") or \
+            os.path.join(str(request.config.rootpath), "..", "ems")
+        template_db = request.config.getoption("ems_template_db") or \
+            os.path.join(project_dir, "db.sqlite3")
+        server = DjangoInstance(project_dir, template_db,
+                                tmp_path_factory.getbasetemp() / "ems",
+                                settings_module=request.config.getoption("ems_settings"))
+    else:
+        yield None
+        return
+    
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture(scope="session")
+def base_url(request, ems_server):
+    """
+    Fixture providing the base URL of the application under test.
+    
+    Returns:
+        str: Base URL without trailing slash
+    """
+    if ems_server is not None:
+        return ems_server.url
+    return request.config.getoption("ems_url").rstrip("/")
+
+@pytest.fixture(scope="session")
+def request_policy(request):
+    """
+    Fixture providing the run's request blocking and asset caching settings.
+    
+    Returns:
+        RequestPolicy: Policy applied to every browser
+    """
+    config = request.config
+    blocked_types = [kind.strip() for kind in config.getoption("block_resources").split(",") if kind.strip()]
+    try:
+        return RequestPolicy(blocked_types, block_external=config.getoption("block_external"),
+                             allowed_hosts=config.getoption("allow_host"),
+                             cache_dir=config.getoption("asset_cache"))
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+
+@pytest.fixture(scope="session")
+def driver_factory(request, base_url):
+    """
+    Fixture providing a callable that launches a new configured browser.
+    
+    Returns:
+        callable: Zero-argument driver factory
+    """
+    if request.config.getoption("driver") == "http":
+        from selenium_tests.support.http_driver import HttpDriver
+        return functools.partial(HttpDriver, base_url)
+    
+    chromedriver_path = request.getfixturevalue("chromedriver_path")
+    return functools.partial(create_chrome_driver, base_url=base_url, driver_path=chromedriver_path,
+                             request_policy=request.getfixturevalue("request_policy"),
+                             page_load_strategy=request.config.getoption("page_load_strategy"))
+
+@pytest.fixture(scope="session")
+def seeder(base_url):
+    """
+    Fixture providing an HTTP client for creating test preconditions
+    without going through the browser.
+    
+    Returns:
+        SeedingClient: Seeding client, closed at the end of the session
+    """
+    client = SeedingClient(base_url)
+    yield client
+    client.close()
+
+@pytest.fixture
+def data_row(request):
+    """
+    Fixture loading the current row of a data_source test from disk.
+    
+    Returns:
+        dict: Row data
+    """
+    return request.param.load()
+
+@pytest.fixture(scope="session")
+def _data_generator_base(request):
+    return UniqueDataGenerator(seed=request.config.getoption("data_seed"))
+
+@pytest.fixture(autouse=True)
+def unique_data(request, _data_generator_base):
+    """
+    Fixture providing this test's unique data generator.
+    
+    The generator is also installed as the one TestDataLoader uses, so data
+    generated anywhere during the test is unique across workers and runs and
+    reproducible from --data-seed.
+    
+    Returns:
+        UniqueDataGenerator: Generator for the current test
+    """
+    generator = _data_generator_base.for_test(request.node.nodeid)
+    set_generator(generator)
+    yield generator
+    set_generator(_data_generator_base)
+
+@pytest.fixture(scope="session")
+def db_snapshot(ems_server, seeder):
+    """
+    Fixture seeding the baseline departments and snapshotting the database once.
+    
+    Only servers started by the session can be snapshotted; with an external
+    server nothing is seeded or restored.
+    
+    Returns:
+        StandinServer or DjangoInstance: Server to restore, or None
+    """
+    if ems_server is None:
+        return None
+    seeder.ensure_departments(TestDataLoader.get_department_names())
+    ems_server.snapshot()
+    seeder.reset()
+    return ems_server
+
+def restore_database(server, seeder):
+    """
+    Reset a started server's data to the session snapshot.
+    
+    Args:
+        server (StandinServer or DjangoInstance): Server to restore, or None
+        seeder (SeedingClient): Seeding client whose cached form state is discarded
+    """
+    if server is not None:
+        server.restore()
+        seeder.reset()
+
+@pytest.fixture(scope="module", autouse=True)
+def _restore_database_per_module(request, db_snapshot, seeder):
+    yield
+    if request.config.getoption("db_restore") == "module":
+        restore_database(db_snapshot, seeder)
+
+@pytest.fixture(autouse=True)
+def _restore_database_per_test(request, db_snapshot, seeder):
+    yield
+    if request.config.getoption("db_restore") == "test" and not request.node.get_closest_marker("read_only"):
+        restore_database(db_snapshot, seeder)
+
+@pytest.fixture(scope="session")
+def driver_pool(request, driver_factory):
+    """
+    Fixture providing the pool of long-lived browsers for this worker.
+    
+    Returns:
+        DriverPool: Browser pool, closed at the end of the session
+    """
+    pool = DriverPool(driver_factory, size=request.config.getoption("driver_pool_size"))
+    yield pool
+    pool.close()
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_factory, driver_pool):
     """
     Fixture for setting up the WebDriver for tests.
     
+    Tests get a pooled browser with a clean session unless they are marked
+    with fresh_driver or pooling is disabled.
+    
     Returns:
         WebDriver: Chrome WebDriver instance
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run headless Chrome for CI/CD
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--window-size=1920,1080")
+    if request.config.getoption("driver") == "http" and request.node.get_closest_marker("browser_only"):
+        pytest.skip("needs a real browser (--driver chrome)")
     
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.implicitly_wait(10)
-    
-    # Set base URL - Django default
-    driver.base_url = "http://127.0.0.1:8000"
+    if driver_pool.size == 0 or request.node.get_closest_marker("fresh_driver"):
+        driver = driver_factory()
+        configure_driver(driver, request)
+        yield driver
+        finish_driver(driver, request)
+        driver_pool.discard(driver)
+        return
     
+    driver = driver_pool.acquire()
+    configure_driver(driver, request)
     yield driver
-    
-    # Cleanup
-    driver.quit()
+    finish_driver(driver, request)
+    driver_pool.release(driver)
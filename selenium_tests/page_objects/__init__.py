@@ -10,3 +10,6 @@ from .employee_delete_page import EmployeeDeletePage
 from .department_list_page import DepartmentListPage
 from .department_form_page import DepartmentFormPage
 from .department_delete_page import DepartmentDeletePage
+from .table_rows import EmployeeRow, DepartmentRow, TableSnapshot
+from .routes import page_class_for_url, page_for_url
+from .navigation import Navigator
@@ -1,18 +1,358 @@
+import functools
+import inspect
+import time
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+)
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.action_chains import ActionChains
 
+def step(method):
+    """
+    Record calls of a page object method as a step.
+    
+    Costs one attribute lookup unless the driver carries a step recorder
+    (see selenium_tests.support.instrumentation), which then collects the
+    step's wall time, wait time and WebDriver commands.
+    
+    Args:
+        method (function): Page object method
+        
+    Returns:
+        function: Wrapped method
+    """
+    if getattr(method, "is_step", False):
+        return method
+    
+    name = method.__qualname__
+    
+    @functools.wraps(method)
+    def recorded(self, *args, **kwargs):
+        recorder = getattr(self.driver, "step_recorder", None)
+        if recorder is None:
+            return method(self, *args, **kwargs)
+        with recorder.step(name):
+            return method(self, *args, **kwargs)
+    
+    recorded.is_step = True
+    return recorded
+
+class RecordedWait(WebDriverWait):
+    """WebDriverWait that reports the time spent waiting to the driver's step recorder."""
+    
+    def until(self, method, message=""):
+        return self._recorded(super().until, method, message)
+    
+    def until_not(self, method, message=""):
+        return self._recorded(super().until_not, method, message)
+    
+    def _recorded(self, wait, method, message):
+        recorder = getattr(self._driver, "step_recorder", None)
+        if recorder is None:
+            return wait(method, message)
+        start = time.perf_counter()
+        try:
+            return wait(method, message)
+        finally:
+            recorder.add_wait(time.perf_counter() - start)
+
+class _ElementChanged:
+    """
+    The element a locator matched when the watch began, and the polling
+    equivalent of the observer's 'changed' condition.
+    """
+    
+    def __init__(self, driver, locator):
+        self.locator = locator
+        elements = driver.find_elements(*locator)
+        self.initial = elements[0] if elements else None
+        self.initial_html = self.initial.get_attribute("outerHTML") if self.initial is not None else None
+    
+    def __call__(self, driver):
+        elements = driver.find_elements(*self.locator)
+        if self.initial is None:
+            return elements[0] if elements else False
+        if not elements or elements[0] != self.initial:
+            return elements[0] if elements else True
+        try:
+            return elements[0] if elements[0].get_attribute("outerHTML") != self.initial_html else False
+        except StaleElementReferenceException:
+            return True
+
+class ElementCache:
+    """
+    Element handles found on the current document, shared by all page objects of a driver.
+    
+    Handles are kept for one page load generation; navigating through a page
+    object starts a new generation and drops them. Handles that went stale
+    without a page object noticing (script changes to the DOM, navigation
+    done on the driver directly) are found again by BasePage when used.
+    """
+    
+    def __init__(self):
+        self.generation = 0
+        self.elements = {}
+    
+    def get(self, locator):
+        """
+        Args:
+            locator (tuple): Locator strategy and value
+            
+        Returns:
+            WebElement: Cached handle, or None
+        """
+        return self.elements.get(locator)
+    
+    def put(self, locator, element):
+        """
+        Args:
+            locator (tuple): Locator strategy and value
+            element (WebElement): Handle found for the locator on the current document
+        """
+        self.elements[locator] = element
+    
+    def discard(self, locator):
+        """
+        Args:
+            locator (tuple): Locator whose handle went stale
+        """
+        self.elements.pop(locator, None)
+    
+    def new_generation(self):
+        """Forget every handle; called whenever a new document is loaded."""
+        self.generation += 1
+        self.elements.clear()
+
 class BasePage:
     """
     Base class for all page objects in the application.
     Contains common methods used across all pages.
+    
+    All waiting goes through wait(); the driver must not use implicit waits,
+    otherwise every negative lookup would stack the implicit timeout on top.
+    
+    The actions below and every public method of a subclass are recorded as
+    steps when step timing is enabled.
+    
+    The locator based actions below reuse element handles within a page
+    load (see ElementCache), so repeated actions on a field cost one lookup;
+    a handle that has gone stale is found again. find_element() itself
+    always looks the element up, so callers never get a stale cached handle.
     """
     
+    # Defaults, overridden per run through driver.wait_timeout / driver.poll_frequency
+    DEFAULT_TIMEOUT = 10
+    POLL_FREQUENCY = 0.1
+    
+    # document.readyState values that count as loaded for each readiness
+    # level, overridden through driver.page_ready_state ('interactive' suits
+    # the eager page load strategy)
+    READY_STATES = {
+        "interactive": ("interactive", "complete"),
+        "complete": ("complete",),
+    }
+    DEFAULT_READY_STATE = "complete"
+    
+    READY_STATE_SCRIPT = "return document.readyState;"
+    
+    # How element waits are done, overridden through driver.wait_backend:
+    #   poll     - WebDriverWait polling every poll_frequency seconds
+    #   observer - one execute_async_script whose MutationObserver answers as
+    #              soon as the DOM matches (falls back to polling on errors,
+    #              e.g. when the page navigates away during the wait)
+    WAIT_BACKENDS = ("poll", "observer")
+    DEFAULT_WAIT_BACKEND = "poll"
+    
+    # chromedriver's default script timeout; observer waits raise it on the
+    # driver (driver.script_timeout) when they need longer
+    DEFAULT_SCRIPT_TIMEOUT = 30
+    
+    # Resolves with the result as soon as the condition holds for the locator,
+    # or with null after the timeout. Conditions: present (first match),
+    # visible (first visible match), invisible (true when nothing visible
+    # matches) and changed (the first match is no longer the element
+    # arguments[4] or its outerHTML differs from arguments[5], both captured
+    # by watch_element() before the action). The condition is checked on
+    # every DOM mutation and every arguments[6] ms, since visibility can
+    # also change through CSS or layout without a mutation.
+    OBSERVE_SCRIPT = """
+        var by = arguments[0], value = arguments[1], condition = arguments[2], timeoutMs = arguments[3];
+        var initial = arguments[4], initialHtml = arguments[5], recheckMs = arguments[6];
+        var done = arguments[arguments.length - 1];
+        function query() {
+            if (by === 'id') {
+                var byId = document.getElementById(value);
+                return byId ? [byId] : [];
+            }
+            if (by === 'name') {
+                return Array.prototype.slice.call(document.getElementsByName(value));
+            }
+            if (by === 'class name') {
+                return Array.prototype.slice.call(document.getElementsByClassName(value));
+            }
+            if (by === 'tag name') {
+                return Array.prototype.slice.call(document.getElementsByTagName(value));
+            }
+            if (by === 'xpath') {
+                var snapshot = document.evaluate(value, document, null,
+                                                 XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                var nodes = [];
+                for (var i = 0; i < snapshot.snapshotLength; i++) {
+                    nodes.push(snapshot.snapshotItem(i));
+                }
+                return nodes;
+            }
+            return Array.prototype.slice.call(document.querySelectorAll(value));
+        }
+        function isVisible(element) {
+            var style = window.getComputedStyle(element);
+            return style.visibility !== 'hidden' && style.display !== 'none'
+                && element.getClientRects().length > 0;
+        }
+        function check() {
+            var elements = query();
+            if (condition === 'present') {
+                return elements.length ? elements[0] : null;
+            }
+            if (condition === 'visible') {
+                return elements.find(isVisible) || null;
+            }
+            if (condition === 'invisible') {
+                return elements.some(isVisible) ? null : true;
+            }
+            if (!initial) {
+                return elements.length ? elements[0] : null;
+            }
+            if (elements[0] !== initial || initial.outerHTML !== initialHtml) {
+                return elements[0] || true;
+            }
+            return null;
+        }
+        var observer, timer, recheck;
+        function finish(result) {
+            if (observer) {
+                observer.disconnect();
+            }
+            clearTimeout(timer);
+            clearInterval(recheck);
+            done(result);
+        }
+        var result = check();
+        if (result !== null) {
+            done(result);
+            return;
+        }
+        function recheckCondition() {
+            var current = check();
+            if (current !== null) {
+                finish(current);
+            }
+        }
+        observer = new MutationObserver(recheckCondition);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        recheck = setInterval(recheckCondition, recheckMs);
+        timer = setTimeout(function () { finish(null); }, timeoutMs);
+    """
+    
+    # How fill_fields() enters values, overridden through driver.fill_strategy:
+    #   keys       - clear() and send_keys() per field (real key events)
+    #   insertText - bulk text insertion through Chrome DevTools Input.insertText
+    #   js         - set every field in one execute_script and fire input/change
+    FILL_STRATEGIES = ("keys", "insertText", "js")
+    DEFAULT_FILL_STRATEGY = "keys"
+    
+    # Clears a text field and gives it focus for Input.insertText
+    FOCUS_FIELD_SCRIPT = """
+        arguments[0].value = '';
+        arguments[0].focus();
+    """
+    
+    # Sets [by, value, kind, text] fields in one pass and returns the ones it
+    # could not resolve
+    FILL_FIELDS_SCRIPT = """
+        var missing = [];
+        arguments[0].forEach(function (field) {
+            var by = field[0], value = field[1], kind = field[2], text = field[3];
+            var element = null;
+            if (by === 'id') {
+                element = document.getElementById(value);
+            } else if (by === 'name') {
+                element = document.getElementsByName(value)[0];
+            } else if (by === 'css selector') {
+                element = document.querySelector(value);
+            } else if (by === 'xpath') {
+                element = document.evaluate(value, document, null,
+                                            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            if (!element) {
+                missing.push(value);
+                return;
+            }
+            if (kind === 'select') {
+                var option = Array.prototype.find.call(element.options, function (opt) {
+                    return opt.text.trim() === text;
+                });
+                if (!option) {
+                    missing.push(value + ' option ' + text);
+                    return;
+                }
+                element.value = option.value;
+            } else if (kind === 'check') {
+                element.checked = true;
+            } else {
+                element.value = text;
+            }
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        });
+        return missing;
+    """
+    
+    # Returns the trimmed text of every cell of every matched row, or null
+    # when no row matches yet
+    READ_TABLE_SCRIPT = """
+        var rows = [];
+        if (arguments[0] === 'xpath') {
+            var snapshot = document.evaluate(arguments[1], document, null,
+                                             XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                rows.push(snapshot.snapshotItem(i));
+            }
+        } else {
+            rows = Array.prototype.slice.call(document.querySelectorAll(arguments[1]));
+        }
+        if (!rows.length) {
+            return null;
+        }
+        return rows.map(function (row) {
+            return Array.prototype.map.call(row.cells, function (cell) {
+                return cell.innerText.trim();
+            });
+        });
+    """
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                setattr(cls, name, step(value))
+    
     def __init__(self, driver):
         self.driver = driver
         self.base_url = driver.base_url
+        self.timeout = getattr(driver, "wait_timeout", self.DEFAULT_TIMEOUT)
+        self.poll_frequency = getattr(driver, "poll_frequency", self.POLL_FREQUENCY)
+        self.fill_strategy = getattr(driver, "fill_strategy", self.DEFAULT_FILL_STRATEGY)
+        self.ready_state = getattr(driver, "page_ready_state", self.DEFAULT_READY_STATE)
+        self.wait_backend = getattr(driver, "wait_backend", self.DEFAULT_WAIT_BACKEND)
+        self.element_cache = getattr(driver, "element_cache", None)
+        if self.element_cache is None:
+            self.element_cache = driver.element_cache = ElementCache()
     
+    @step
     def open(self, url_path=""):
         """
         Open a page by appending url_path to the base URL.
@@ -21,14 +361,83 @@ class BasePage:
             url_path (str): Path to append to base URL
         """
         self.driver.get(f"{self.base_url}/{url_path}")
+        self.element_cache.new_generation()
+    
+    def wait(self, timeout=None):
+        """
+        Create an explicit wait using the configured timeout and polling interval.
+        
+        Args:
+            timeout (int, optional): Maximum time to wait, defaults to self.timeout
+            
+        Returns:
+            RecordedWait: Wait bound to this page's driver
+        """
+        if timeout is None:
+            timeout = self.timeout
+        return RecordedWait(self.driver, timeout, poll_frequency=self.poll_frequency)
+    
+    def wait_until(self, locator, condition, expected_condition, timeout=None, baseline=None):
+        """
+        Wait for a locator condition with the configured wait backend.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            condition (str): 'present', 'visible', 'invisible' or 'changed'
+                             (see OBSERVE_SCRIPT)
+            expected_condition (callable): Equivalent WebDriverWait condition,
+                                           used by the poll backend
+            timeout (int, optional): Maximum time to wait, defaults to self.timeout
+            baseline (tuple, optional): (element, outerHTML) the 'changed'
+                                        condition compares against
+            
+        Returns:
+            The condition's result (WebElement or True)
+            
+        Raises:
+            TimeoutException: If the condition does not hold within timeout
+        """
+        if self.wait_backend != "observer":
+            return self.wait(timeout).until(expected_condition)
+        
+        if timeout is None:
+            timeout = self.timeout
+        by, value = locator
+        initial, initial_html = baseline or (None, None)
+        # The script must be allowed to outlive the wait, or a long wait
+        # would end in a script timeout that reads as a failed wait
+        if timeout + 1 > getattr(self.driver, "script_timeout", self.DEFAULT_SCRIPT_TIMEOUT):
+            self.driver.set_script_timeout(timeout + 1)
+            self.driver.script_timeout = timeout + 1
+        recorder = getattr(self.driver, "step_recorder", None)
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(self.OBSERVE_SCRIPT, by, value, condition,
+                                                      int(timeout * 1000), initial, initial_html,
+                                                      max(int(self.poll_frequency * 1000), 50))
+        except TimeoutException:
+            result = None
+        except WebDriverException:
+            # The document went away mid-wait or before it (the baseline
+            # element is then stale), or it cannot run scripts; the poller
+            # copes with all of these
+            return self.wait(max(timeout - (time.perf_counter() - start), 0)).until(expected_condition)
+        finally:
+            if recorder is not None:
+                recorder.add_wait(time.perf_counter() - start)
+        
+        if result is None:
+            raise TimeoutException(f"{by}={value} not {condition} after {timeout}s")
+        return result
     
-    def find_element(self, locator, timeout=10):
+    @step
+    def find_element(self, locator, timeout=None):
         """
         Find an element with explicit wait.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Returns:
             WebElement: Found element
@@ -36,17 +445,42 @@ class BasePage:
         Raises:
             TimeoutException: If element not found within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located(locator)
-        )
+        element = self.wait_until(locator, "present", EC.presence_of_element_located(locator), timeout)
+        self.element_cache.put(locator, element)
+        return element
     
-    def find_elements(self, locator, timeout=10):
+    def _with_element(self, locator, action, timeout=None):
+        """
+        Run an action on the element a locator finds, reusing its cached handle.
+        
+        The cache cannot tell every page change (a plain click that
+        navigates, driver.back()), but handles from another document are
+        always stale, so a stale handle is simply found again.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            action (callable): Called with the WebElement
+            timeout (int, optional): Maximum time to wait for element
+            
+        Returns:
+            The action's result
+        """
+        element = self.element_cache.get(locator)
+        if element is not None:
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self.element_cache.discard(locator)
+        return action(self.find_element(locator, timeout))
+    
+    @step
+    def find_elements(self, locator, timeout=None):
         """
         Find elements with explicit wait.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for elements
+            timeout (int, optional): Maximum time to wait for elements
             
         Returns:
             list: List of found WebElements
@@ -54,65 +488,184 @@ class BasePage:
         Raises:
             TimeoutException: If no elements found within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
+        return self.wait(timeout).until(
             EC.presence_of_all_elements_located(locator)
         )
     
-    def click(self, locator, timeout=10):
+    @step
+    def click(self, locator, timeout=None):
         """
         Find element and click with explicit wait.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Raises:
             TimeoutException: If element not found or not clickable
         """
-        element = WebDriverWait(self.driver, timeout).until(
+        element = self.wait(timeout).until(
             EC.element_to_be_clickable(locator)
         )
         element.click()
     
-    def input_text(self, locator, text, timeout=10):
+    @step
+    def click_and_wait_for_change(self, locator, watched_locator, timeout=None):
+        """
+        Click an element that updates part of the page and wait for the update.
+        
+        Works whether the application updates the watched element in place
+        or loads the page again: the element is watched before the click,
+        and when the document was replaced the new one is waited for like
+        in click_and_navigate().
+        
+        Args:
+            locator (tuple): Locator of the button or link
+            watched_locator (tuple): Locator of the element the click updates, e.g. a table
+            timeout (int, optional): Maximum time to wait for the element and the update
+            
+        Returns:
+            BasePage: This page after an in-place update, otherwise the page
+                      object for the landing URL
+            
+        Raises:
+            TimeoutException: If the watched element does not change within timeout
+        """
+        old_document = self.driver.find_element(By.TAG_NAME, "html")
+        watch = self.watch_element(watched_locator)
+        self.click(locator, timeout)
+        self.wait_for_element_change(watch, timeout)
+        self.element_cache.new_generation()
+        
+        if not EC.staleness_of(old_document)(self.driver):
+            return self
+        ready_states = self.READY_STATES[self.ready_state]
+        self.wait(timeout).until(lambda driver: driver.execute_script(self.READY_STATE_SCRIPT) in ready_states)
+        
+        from .routes import page_for_url
+        return page_for_url(self.driver)
+    
+    @step
+    def click_and_navigate(self, locator, timeout=None):
+        """
+        Click an element that loads a new page and wait for that page.
+        
+        Waits until the current document has been replaced and the new one
+        has reached the configured ready state, then builds the page object
+        for the URL the browser landed on (see routes.py).
+        
+        Args:
+            locator (tuple): Locator of the link or submit button
+            timeout (int, optional): Maximum time to wait for the element and the new page
+            
+        Returns:
+            BasePage: Page object for the landing URL
+            
+        Raises:
+            TimeoutException: If no new page is ready within timeout
+        """
+        old_document = self.driver.find_element(By.TAG_NAME, "html")
+        self.click(locator, timeout)
+        
+        ready_states = self.READY_STATES[self.ready_state]
+        document_replaced = EC.staleness_of(old_document)
+        self.wait(timeout).until(
+            lambda driver: document_replaced(driver)
+            and driver.execute_script(self.READY_STATE_SCRIPT) in ready_states
+        )
+        self.element_cache.new_generation()
+        
+        from .routes import page_for_url
+        return page_for_url(self.driver)
+    
+    @step
+    def input_text(self, locator, text, timeout=None):
         """
         Find element, clear it, and send keys.
         
         Args:
             locator (tuple): Locator strategy and value
             text (str): Text to input
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Raises:
             TimeoutException: If element not found
         """
-        element = self.find_element(locator, timeout)
-        element.clear()
-        element.send_keys(text)
+        def enter(element):
+            element.clear()
+            element.send_keys(text)
+        
+        self._with_element(locator, enter, timeout)
     
-    def select_option_by_text(self, locator, option_text, timeout=10):
+    @step
+    def select_option_by_text(self, locator, option_text, timeout=None):
         """
         Select an option from a dropdown by visible text.
         
         Args:
             locator (tuple): Locator strategy and value
             option_text (str): Text of option to select
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Raises:
             TimeoutException: If element not found
         """
-        from selenium.webdriver.support.ui import Select
-        select = Select(self.find_element(locator, timeout))
-        select.select_by_visible_text(option_text)
+        self._with_element(locator, lambda element: Select(element).select_by_visible_text(option_text), timeout)
+    
+    @step
+    def fill_fields(self, fields, strategy=None, timeout=None):
+        """
+        Fill several form fields using a fill strategy.
+        
+        Args:
+            fields (list): (locator, value, kind) tuples, where kind is 'text',
+                           'select' (value is the option's visible text) or
+                           'check' (radio/checkbox, value is ignored)
+            strategy (str, optional): 'keys', 'insertText' or 'js',
+                                      defaults to self.fill_strategy
+            timeout (int, optional): Maximum time to wait for the fields
+            
+        Raises:
+            ValueError: If the strategy is unknown
+            TimeoutException: If a field is not found
+            NoSuchElementException: If the js strategy cannot resolve a field
+        """
+        strategy = strategy or self.fill_strategy
+        if strategy not in self.FILL_STRATEGIES:
+            raise ValueError(f"Unknown fill strategy '{strategy}', expected one of {self.FILL_STRATEGIES}")
+        
+        if strategy == "js":
+            if fields:
+                # Wait for the form once; the script then sets everything
+                self.find_element(fields[0][0], timeout)
+                payload = [[by, value, kind, "" if text is None else str(text)]
+                           for (by, value), text, kind in fields]
+                missing = self.driver.execute_script(self.FILL_FIELDS_SCRIPT, payload)
+                if missing:
+                    raise NoSuchElementException(f"Could not fill fields: {', '.join(missing)}")
+            return
+        
+        for locator, value, kind in fields:
+            if kind == "select":
+                self.select_option_by_text(locator, value, timeout)
+            elif kind == "check":
+                self.click(locator, timeout)
+            elif strategy == "insertText":
+                self._with_element(locator,
+                                   lambda element: self.driver.execute_script(self.FOCUS_FIELD_SCRIPT, element),
+                                   timeout)
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": str(value)})
+            else:
+                self.input_text(locator, value, timeout)
     
-    def get_text(self, locator, timeout=10):
+    @step
+    def get_text(self, locator, timeout=None):
         """
         Get text from an element.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Returns:
             str: Text of element
@@ -120,16 +673,51 @@ class BasePage:
         Raises:
             TimeoutException: If element not found
         """
-        element = self.find_element(locator, timeout)
-        return element.text
+        return self._with_element(locator, lambda element: element.text, timeout)
     
+    @step
+    def get_attribute(self, locator, name, timeout=None):
+        """
+        Get an attribute or property of an element.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            name (str): Attribute name, e.g. 'value'
+            timeout (int, optional): Maximum time to wait for element
+            
+        Returns:
+            str: Attribute value, None if not set
+            
+        Raises:
+            TimeoutException: If element not found
+        """
+        return self._with_element(locator, lambda element: element.get_attribute(name), timeout)
+    
+    @step
+    def is_selected(self, locator, timeout=None):
+        """
+        Check whether a checkbox, radio button or option is selected.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            timeout (int, optional): Maximum time to wait for element
+            
+        Returns:
+            bool: True if selected
+            
+        Raises:
+            TimeoutException: If element not found
+        """
+        return self._with_element(locator, lambda element: element.is_selected(), timeout)
+    
+    @step
     def is_element_present(self, locator, timeout=5):
         """
         Check if element is present.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Returns:
             bool: True if element is present, False otherwise
@@ -140,13 +728,60 @@ class BasePage:
         except (TimeoutException, NoSuchElementException):
             return False
     
-    def wait_for_element_visible(self, locator, timeout=10):
+    @step
+    def is_element_absent(self, locator, timeout=None):
+        """
+        Check if element is absent, waiting for it to disappear if necessary.
+        
+        Returns immediately when nothing matches, so absence checks do not
+        have to sit out a full timeout.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            timeout (int, optional): Maximum time to wait for element to disappear
+            
+        Returns:
+            bool: True if no element matches the locator, False otherwise
+        """
+        try:
+            self.wait(timeout).until(lambda driver: not driver.find_elements(*locator))
+            return True
+        except TimeoutException:
+            return False
+    
+    @step
+    def find_any_of(self, locators, timeout=None):
+        """
+        Wait until at least one of several locators matches, then report all of them.
+        
+        Presence and absence of every locator is settled in one bounded wait
+        instead of spending a separate timeout on each element that is missing.
+        
+        Args:
+            locators (list): Locator tuples to check
+            timeout (int, optional): Maximum time to wait for any match
+            
+        Returns:
+            dict: Maps every locator to its list of matching WebElements
+                  (empty list if the element is absent)
+            
+        Raises:
+            TimeoutException: If none of the locators match within timeout
+        """
+        def any_present(driver):
+            found = {locator: driver.find_elements(*locator) for locator in locators}
+            return found if any(found.values()) else False
+        
+        return self.wait(timeout).until(any_present)
+    
+    @step
+    def wait_for_element_visible(self, locator, timeout=None):
         """
         Wait for element to be visible.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Returns:
             WebElement: Visible element
@@ -154,17 +789,16 @@ class BasePage:
         Raises:
             TimeoutException: If element not visible within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        return self.wait_until(locator, "visible", EC.visibility_of_element_located(locator), timeout)
     
-    def wait_for_element_invisible(self, locator, timeout=10):
+    @step
+    def wait_for_element_invisible(self, locator, timeout=None):
         """
         Wait for element to be invisible.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
             
         Returns:
             bool: True if element is invisible
@@ -172,20 +806,76 @@ class BasePage:
         Raises:
             TimeoutException: If element still visible within timeout
         """
-        return WebDriverWait(self.driver, timeout).until(
-            EC.invisibility_of_element_located(locator)
-        )
+        return self.wait_until(locator, "invisible", EC.invisibility_of_element_located(locator), timeout)
+    
+    @step
+    def watch_element(self, locator):
+        """
+        Remember the element a locator matches now, for wait_for_element_change().
+        
+        Call it before the action whose effect is awaited, so a change that
+        happens before the wait starts is not missed.
+        
+        Args:
+            locator (tuple): Locator strategy and value
+            
+        Returns:
+            Watch to pass to wait_for_element_change()
+        """
+        return _ElementChanged(self.driver, locator)
     
-    def scroll_to_element(self, locator, timeout=10):
+    @step
+    def wait_for_element_change(self, watch, timeout=None):
+        """
+        Wait until a watched element is replaced or its content changes.
+        
+        Args:
+            watch: Result of watch_element(), taken before the action
+            timeout (int, optional): Maximum time to wait for the change
+            
+        Returns:
+            WebElement: The element now matching the locator (True if none does)
+            
+        Raises:
+            TimeoutException: If nothing changes within timeout
+        """
+        return self.wait_until(watch.locator, "changed", watch, timeout,
+                               baseline=(watch.initial, watch.initial_html))
+    
+    @step
+    def scroll_to_element(self, locator, timeout=None):
         """
         Scroll to an element.
         
         Args:
             locator (tuple): Locator strategy and value
-            timeout (int): Maximum time to wait for element
+            timeout (int, optional): Maximum time to wait for element
+        """
+        self._with_element(locator,
+                           lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element),
+                           timeout)
+    
+    @step
+    def read_table_cells(self, rows_locator, timeout=None):
+        """
+        Read the text of every cell of a table in a single WebDriver command.
+        
+        Args:
+            rows_locator (tuple): XPath or CSS locator matching the table rows
+            timeout (int, optional): Maximum time to wait for the rows
+            
+        Returns:
+            list: One list of cell texts per row
+            
+        Raises:
+            TimeoutException: If no rows are found within timeout
         """
-        element = self.find_element(locator, timeout)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        by, value = rows_locator
+        if by not in (By.XPATH, By.CSS_SELECTOR):
+            raise ValueError(f"read_table_cells needs an XPath or CSS locator, got {by}")
+        return self.wait(timeout).until(
+            lambda driver: driver.execute_script(self.READ_TABLE_SCRIPT, by, value)
+        )
     
     def get_page_title(self):
         """
@@ -199,10 +889,12 @@ class BasePage:
     def refresh_page(self):
         """Refresh the current page."""
         self.driver.refresh()
+        self.element_cache.new_generation()
     
     def go_back(self):
         """Navigate back to the previous page."""
         self.driver.back()
+        self.element_cache.new_generation()
     
     def get_current_url(self):
         """
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator
 
 class DepartmentFormPage(BasePage):
     """
@@ -8,24 +9,26 @@ class DepartmentFormPage(BasePage):
     """
     
     # Locators
-    PAGE_HEADER = (By.XPATH, "//h2[contains(text(), 'Department')]")
+    PAGE_HEADER = compile_locator(By.XPATH, "//h2[contains(text(), 'Department')]")
     NAME_INPUT = (By.ID, "id_name")
-    SUBMIT_BUTTON = (By.XPATH, "//button[@type='submit']")
+    SUBMIT_BUTTON = compile_locator(By.XPATH, "//button[@type='submit']")
     
     # Validation error messages
-    NAME_ERROR = (By.XPATH, "//input[@id='id_name']/following-sibling::div[@class='invalid-feedback']")
+    NAME_ERROR = compile_locator(By.XPATH, "//input[@id='id_name']/following-sibling::div[@class='invalid-feedback']")
     
     def __init__(self, driver):
         super().__init__(driver)
     
-    def fill_department_form(self, name):
+    def fill_department_form(self, name, strategy=None):
         """
         Fill the department form with the given name.
         
         Args:
             name (str): Department name
+            strategy (str, optional): Fill strategy ('keys', 'insertText' or 'js'),
+                                      defaults to the run's configured strategy
         """
-        self.input_text(self.NAME_INPUT, name)
+        self.fill_fields([(self.NAME_INPUT, name, 'text')], strategy)
         return self
     
     def submit_form(self):
@@ -34,17 +37,9 @@ class DepartmentFormPage(BasePage):
         
         Returns:
             DepartmentListPage: Department list page if submission successful
-            self: Current page if validation errors
+            DepartmentFormPage: The re-rendered form if there are validation errors
         """
-        self.click(self.SUBMIT_BUTTON)
-        
-        # Check if we were redirected to the department list page
-        if "departments/" in self.get_current_url() and not "/create/" in self.get_current_url() and not "/update/" in self.get_current_url():
-            from .department_list_page import DepartmentListPage
-            return DepartmentListPage(self.driver)
-        
-        # We're still on the form page (validation errors)
-        return self
+        return self.click_and_navigate(self.SUBMIT_BUTTON)
     
     def get_validation_errors(self):
         """
@@ -55,8 +50,9 @@ class DepartmentFormPage(BasePage):
         """
         errors = {}
         
-        if self.is_element_present(self.NAME_ERROR, 1):
-            errors['name'] = self.get_text(self.NAME_ERROR)
+        found = self.find_any_of([self.SUBMIT_BUTTON, self.NAME_ERROR])
+        if found[self.NAME_ERROR]:
+            errors['name'] = found[self.NAME_ERROR][0].text
         
         return errors
     
@@ -87,4 +83,4 @@ class DepartmentFormPage(BasePage):
         Returns:
             str: Current department name
         """
-        return self.find_element(self.NAME_INPUT).get_attribute("value")
+        return self.get_attribute(self.NAME_INPUT, "value")
@@ -1,5 +1,7 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator, LocatorTemplate
+from .table_rows import DepartmentRow, TableSnapshot
 
 class DepartmentListPage(BasePage):
     """
@@ -7,16 +9,16 @@ class DepartmentListPage(BasePage):
     """
     
     # Locators
-    PAGE_HEADER = (By.XPATH, "//h2[text()='Departments']")
-    ADD_DEPARTMENT_BUTTON = (By.XPATH, "//a[contains(@class, 'btn-primary') and text()='Add New Department']")
-    DEPARTMENT_TABLE = (By.XPATH, "//table[contains(@class, 'table')]")
-    TABLE_ROWS = (By.XPATH, "//table//tbody//tr")
-    NO_DEPARTMENTS_MESSAGE = (By.XPATH, "//td[text()='No departments found']")
+    PAGE_HEADER = compile_locator(By.XPATH, "//h2[text()='Departments']")
+    ADD_DEPARTMENT_BUTTON = compile_locator(By.XPATH, "//a[contains(@class, 'btn-primary') and text()='Add New Department']")
+    DEPARTMENT_TABLE = compile_locator(By.XPATH, "//table[contains(@class, 'table')]")
+    TABLE_ROWS = compile_locator(By.XPATH, "//table//tbody//tr")
+    NO_DEPARTMENTS_MESSAGE = compile_locator(By.XPATH, "//td[text()='No departments found']")
     
-    # Row-specific locators - to be used with format()
-    DEPARTMENT_ROW_BY_NAME = "//table//tbody//tr/td[text()='{}']/.."
-    EDIT_BUTTON_IN_ROW = "//table//tbody//tr/td[text()='{}']/../td//a[text()='Edit']"
-    DELETE_BUTTON_IN_ROW = "//table//tbody//tr/td[text()='{}']/../td//a[text()='Delete']"
+    # Row-specific locator templates - format() quotes and escapes the name
+    DEPARTMENT_ROW_BY_NAME = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]")
+    EDIT_BUTTON_IN_ROW = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]/td//a[text()='Edit']")
+    DELETE_BUTTON_IN_ROW = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]/td//a[text()='Delete']")
     
     def __init__(self, driver):
         super().__init__(driver)
@@ -33,9 +35,7 @@ class DepartmentListPage(BasePage):
         Returns:
             DepartmentFormPage: Department form page object
         """
-        self.click(self.ADD_DEPARTMENT_BUTTON)
-        from .department_form_page import DepartmentFormPage
-        return DepartmentFormPage(self.driver)
+        return self.click_and_navigate(self.ADD_DEPARTMENT_BUTTON)
     
     def get_department_count(self):
         """
@@ -44,10 +44,10 @@ class DepartmentListPage(BasePage):
         Returns:
             int: Number of department rows
         """
-        if self.is_element_present(self.NO_DEPARTMENTS_MESSAGE, 1):
+        found = self.find_any_of([self.NO_DEPARTMENTS_MESSAGE, self.TABLE_ROWS])
+        if found[self.NO_DEPARTMENTS_MESSAGE]:
             return 0
-        rows = self.find_elements(self.TABLE_ROWS)
-        return len(rows)
+        return len(found[self.TABLE_ROWS])
     
     def is_department_displayed(self, name):
         """
@@ -59,8 +59,7 @@ class DepartmentListPage(BasePage):
         Returns:
             bool: True if department is displayed
         """
-        department_row_locator = (By.XPATH, self.DEPARTMENT_ROW_BY_NAME.format(name))
-        return self.is_element_present(department_row_locator)
+        return self.read_table().find_by_name(name) is not None
     
     def edit_department(self, name):
         """
@@ -72,10 +71,8 @@ class DepartmentListPage(BasePage):
         Returns:
             DepartmentFormPage: Department form page object
         """
-        edit_button_locator = (By.XPATH, self.EDIT_BUTTON_IN_ROW.format(name))
-        self.click(edit_button_locator)
-        from .department_form_page import DepartmentFormPage
-        return DepartmentFormPage(self.driver)
+        edit_button_locator = self.EDIT_BUTTON_IN_ROW.format(name)
+        return self.click_and_navigate(edit_button_locator)
     
     def delete_department(self, name):
         """
@@ -87,10 +84,22 @@ class DepartmentListPage(BasePage):
         Returns:
             DepartmentDeletePage: Department delete page object
         """
-        delete_button_locator = (By.XPATH, self.DELETE_BUTTON_IN_ROW.format(name))
-        self.click(delete_button_locator)
-        from .department_delete_page import DepartmentDeletePage
-        return DepartmentDeletePage(self.driver)
+        delete_button_locator = self.DELETE_BUTTON_IN_ROW.format(name)
+        return self.click_and_navigate(delete_button_locator)
+    
+    def read_table(self):
+        """
+        Read the whole department table in one round trip.
+        
+        Returns:
+            TableSnapshot: DepartmentRow tuples indexed by name
+        """
+        rows = []
+        for cells in self.read_table_cells(self.TABLE_ROWS):
+            # Skips the 'No departments found' placeholder row
+            if cells and cells[0] != "No departments found":
+                rows.append(DepartmentRow(cells[0]))
+        return TableSnapshot(rows)
     
     def get_department_names(self):
         """
@@ -99,14 +108,4 @@ class DepartmentListPage(BasePage):
         Returns:
             list: List of department names
         """
-        if self.is_element_present(self.NO_DEPARTMENTS_MESSAGE, 1):
-            return []
-        
-        rows = self.find_elements(self.TABLE_ROWS)
-        names = []
-        
-        for row in rows:
-            name_cell = row.find_element(By.XPATH, "./td[1]")
-            names.append(name_cell.text)
-        
-        return names
+        return [row.name for row in self.read_table()]
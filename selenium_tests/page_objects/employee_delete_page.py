@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator
 
 class EmployeeDeletePage(BasePage):
     """
@@ -7,10 +8,10 @@ class EmployeeDeletePage(BasePage):
     """
     
     # Locators
-    CONFIRMATION_TEXT = (By.XPATH, "//p[contains(text(), 'Are you sure you want to delete')]")
-    EMPLOYEE_NAME = (By.XPATH, "//p/strong")
-    CONFIRM_DELETE_BUTTON = (By.XPATH, "//button[contains(@class, 'btn-danger') and text()='Confirm']")
-    CANCEL_BUTTON = (By.XPATH, "//a[contains(@class, 'btn-secondary') and text()='Cancel']")
+    CONFIRMATION_TEXT = compile_locator(By.XPATH, "//p[contains(text(), 'Are you sure you want to delete')]")
+    EMPLOYEE_NAME = compile_locator(By.XPATH, "//p/strong")
+    CONFIRM_DELETE_BUTTON = compile_locator(By.XPATH, "//button[contains(@class, 'btn-danger') and text()='Confirm']")
+    CANCEL_BUTTON = compile_locator(By.XPATH, "//a[contains(@class, 'btn-secondary') and text()='Cancel']")
     
     def __init__(self, driver):
         super().__init__(driver)
@@ -31,9 +32,7 @@ class EmployeeDeletePage(BasePage):
         Returns:
             EmployeeListPage: Employee list page
         """
-        self.click(self.CONFIRM_DELETE_BUTTON)
-        from .employee_list_page import EmployeeListPage
-        return EmployeeListPage(self.driver)
+        return self.click_and_navigate(self.CONFIRM_DELETE_BUTTON)
     
     def cancel_delete(self):
         """
@@ -42,9 +41,7 @@ class EmployeeDeletePage(BasePage):
         Returns:
             EmployeeListPage: Employee list page
         """
-        self.click(self.CANCEL_BUTTON)
-        from .employee_list_page import EmployeeListPage
-        return EmployeeListPage(self.driver)
+        return self.click_and_navigate(self.CANCEL_BUTTON)
     
     def is_on_delete_page(self):
         """
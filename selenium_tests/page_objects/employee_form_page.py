@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator
 
 class EmployeeFormPage(BasePage):
     """
@@ -8,50 +9,55 @@ class EmployeeFormPage(BasePage):
     """
     
     # Locators
-    PAGE_HEADER = (By.XPATH, "//h2[contains(text(), 'Employee')]")
+    PAGE_HEADER = compile_locator(By.XPATH, "//h2[contains(text(), 'Employee')]")
     NAME_INPUT = (By.ID, "id_name")
     EMAIL_INPUT = (By.ID, "id_email")
     DEPARTMENT_SELECT = (By.ID, "id_department")
     SALARY_INPUT = (By.ID, "id_salary")
     STATUS_ACTIVE_RADIO = (By.ID, "id_status_active")
     STATUS_INACTIVE_RADIO = (By.ID, "id_status_inactive")
-    SUBMIT_BUTTON = (By.XPATH, "//button[@type='submit']")
+    SUBMIT_BUTTON = compile_locator(By.XPATH, "//button[@type='submit']")
     
     # Validation error messages
-    NAME_ERROR = (By.XPATH, "//input[@id='id_name']/following-sibling::div[@class='invalid-feedback']")
-    EMAIL_ERROR = (By.XPATH, "//input[@id='id_email']/following-sibling::div[@class='invalid-feedback']")
-    DEPARTMENT_ERROR = (By.XPATH, "//select[@id='id_department']/following-sibling::div[@class='invalid-feedback']")
-    SALARY_ERROR = (By.XPATH, "//input[@id='id_salary']/following-sibling::div[@class='invalid-feedback']")
+    NAME_ERROR = compile_locator(By.XPATH, "//input[@id='id_name']/following-sibling::div[@class='invalid-feedback']")
+    EMAIL_ERROR = compile_locator(By.XPATH, "//input[@id='id_email']/following-sibling::div[@class='invalid-feedback']")
+    DEPARTMENT_ERROR = compile_locator(By.XPATH, "//select[@id='id_department']/following-sibling::div[@class='invalid-feedback']")
+    SALARY_ERROR = compile_locator(By.XPATH, "//input[@id='id_salary']/following-sibling::div[@class='invalid-feedback']")
     
     def __init__(self, driver):
         super().__init__(driver)
     
-    def fill_employee_form(self, employee_data):
+    def fill_employee_form(self, employee_data, strategy=None):
         """
         Fill the employee form with the given data.
         
         Args:
             employee_data (dict): Employee data with keys:
                                   name, email, department, salary, status
+            strategy (str, optional): Fill strategy ('keys', 'insertText' or 'js'),
+                                      defaults to the run's configured strategy
         """
+        fields = []
+        
         if 'name' in employee_data:
-            self.input_text(self.NAME_INPUT, employee_data['name'])
+            fields.append((self.NAME_INPUT, employee_data['name'], 'text'))
         
         if 'email' in employee_data:
-            self.input_text(self.EMAIL_INPUT, employee_data['email'])
+            fields.append((self.EMAIL_INPUT, employee_data['email'], 'text'))
         
         if 'department' in employee_data:
-            self.select_option_by_text(self.DEPARTMENT_SELECT, employee_data['department'])
+            fields.append((self.DEPARTMENT_SELECT, employee_data['department'], 'select'))
         
         if 'salary' in employee_data:
-            self.input_text(self.SALARY_INPUT, str(employee_data['salary']))
+            fields.append((self.SALARY_INPUT, str(employee_data['salary']), 'text'))
         
         if 'status' in employee_data:
             if employee_data['status'].lower() == 'active':
-                self.click(self.STATUS_ACTIVE_RADIO)
+                fields.append((self.STATUS_ACTIVE_RADIO, None, 'check'))
             else:
-                self.click(self.STATUS_INACTIVE_RADIO)
+                fields.append((self.STATUS_INACTIVE_RADIO, None, 'check'))
         
+        self.fill_fields(fields, strategy)
         return self
     
     def submit_form(self):
@@ -60,17 +66,9 @@ class EmployeeFormPage(BasePage):
         
         Returns:
             EmployeeListPage: Employee list page if submission successful
-            self: Current page if validation errors
+            EmployeeFormPage: The re-rendered form if there are validation errors
         """
-        self.click(self.SUBMIT_BUTTON)
-        
-        # Check if we were redirected to the employee list page
-        if "employees/" in self.get_current_url() and not "/create/" in self.get_current_url() and not "/update/" in self.get_current_url():
-            from .employee_list_page import EmployeeListPage
-            return EmployeeListPage(self.driver)
-        
-        # We're still on the form page (validation errors)
-        return self
+        return self.click_and_navigate(self.SUBMIT_BUTTON)
     
     def get_validation_errors(self):
         """
@@ -79,19 +77,21 @@ class EmployeeFormPage(BasePage):
         Returns:
             dict: Validation errors by field
         """
-        errors = {}
-        
-        if self.is_element_present(self.NAME_ERROR, 1):
-            errors['name'] = self.get_text(self.NAME_ERROR)
-        
-        if self.is_element_present(self.EMAIL_ERROR, 1):
-            errors['email'] = self.get_text(self.EMAIL_ERROR)
+        error_locators = {
+            'name': self.NAME_ERROR,
+            'email': self.EMAIL_ERROR,
+            'department': self.DEPARTMENT_ERROR,
+            'salary': self.SALARY_ERROR
+        }
         
-        if self.is_element_present(self.DEPARTMENT_ERROR, 1):
-            errors['department'] = self.get_text(self.DEPARTMENT_ERROR)
+        # The submit button is always rendered, so this settles as soon as the
+        # form is loaded and reports every error locator in the same pass
+        found = self.find_any_of([self.SUBMIT_BUTTON] + list(error_locators.values()))
         
-        if self.is_element_present(self.SALARY_ERROR, 1):
-            errors['salary'] = self.get_text(self.SALARY_ERROR)
+        errors = {}
+        for field, locator in error_locators.items():
+            if found[locator]:
+                errors[field] = found[locator][0].text
         
         return errors
     
@@ -122,15 +122,15 @@ class EmployeeFormPage(BasePage):
         Returns:
             dict: Current form values
         """
-        name = self.find_element(self.NAME_INPUT).get_attribute("value")
-        email = self.find_element(self.EMAIL_INPUT).get_attribute("value")
-        salary = self.find_element(self.SALARY_INPUT).get_attribute("value")
+        name = self.get_attribute(self.NAME_INPUT, "value")
+        email = self.get_attribute(self.EMAIL_INPUT, "value")
+        salary = self.get_attribute(self.SALARY_INPUT, "value")
         
         department_select = self.find_element(self.DEPARTMENT_SELECT)
         selected_option = department_select.find_element(By.XPATH, ".//option[@selected='selected']")
         department = selected_option.text if selected_option else ""
         
-        status = "Active" if self.find_element(self.STATUS_ACTIVE_RADIO).is_selected() else "Inactive"
+        status = "Active" if self.is_selected(self.STATUS_ACTIVE_RADIO) else "Inactive"
         
         return {
             "name": name,
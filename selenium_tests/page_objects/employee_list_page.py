@@ -1,5 +1,8 @@
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator, LocatorTemplate
+from .table_rows import EmployeeRow, TableSnapshot
 
 class EmployeeListPage(BasePage):
     """
@@ -7,21 +10,21 @@ class EmployeeListPage(BasePage):
     """
     
     # Locators
-    PAGE_HEADER = (By.XPATH, "//h2[text()='Employees']")
-    ADD_EMPLOYEE_BUTTON = (By.XPATH, "//a[contains(@class, 'btn-primary') and text()='Add New Employee']")
-    SEARCH_INPUT = (By.XPATH, "//input[@name='q']")
-    FILTER_BUTTON = (By.XPATH, "//button[text()='Filter']")
+    PAGE_HEADER = compile_locator(By.XPATH, "//h2[text()='Employees']")
+    ADD_EMPLOYEE_BUTTON = compile_locator(By.XPATH, "//a[contains(@class, 'btn-primary') and text()='Add New Employee']")
+    SEARCH_INPUT = compile_locator(By.XPATH, "//input[@name='q']")
+    FILTER_BUTTON = compile_locator(By.XPATH, "//button[text()='Filter']")
     STATUS_DROPDOWN = (By.NAME, "status")
     DEPARTMENT_DROPDOWN = (By.NAME, "department")
-    EMPLOYEE_TABLE = (By.XPATH, "//table[contains(@class, 'table')]")
-    TABLE_ROWS = (By.XPATH, "//table//tbody//tr")
-    EXPORT_CSV_BUTTON = (By.XPATH, "//a[contains(@class, 'btn-success') and text()='Export to CSV']")
-    NO_EMPLOYEES_MESSAGE = (By.XPATH, "//td[text()='No employees found']")
+    EMPLOYEE_TABLE = compile_locator(By.XPATH, "//table[contains(@class, 'table')]")
+    TABLE_ROWS = compile_locator(By.XPATH, "//table//tbody//tr")
+    EXPORT_CSV_BUTTON = compile_locator(By.XPATH, "//a[contains(@class, 'btn-success') and text()='Export to CSV']")
+    NO_EMPLOYEES_MESSAGE = compile_locator(By.XPATH, "//td[text()='No employees found']")
     
-    # Row-specific locators - to be used with format()
-    EMPLOYEE_ROW_BY_NAME = "//table//tbody//tr/td[text()='{}']/.."
-    EDIT_BUTTON_IN_ROW = "//table//tbody//tr/td[text()='{}']/../td//a[text()='Edit']"
-    DELETE_BUTTON_IN_ROW = "//table//tbody//tr/td[text()='{}']/../td//a[text()='Delete']"
+    # Row-specific locator templates - format() quotes and escapes the name
+    EMPLOYEE_ROW_BY_NAME = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]")
+    EDIT_BUTTON_IN_ROW = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]/td//a[text()='Edit']")
+    DELETE_BUTTON_IN_ROW = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]/td//a[text()='Delete']")
     
     def __init__(self, driver):
         super().__init__(driver)
@@ -38,9 +41,7 @@ class EmployeeListPage(BasePage):
         Returns:
             EmployeeFormPage: Employee form page object
         """
-        self.click(self.ADD_EMPLOYEE_BUTTON)
-        from .employee_form_page import EmployeeFormPage
-        return EmployeeFormPage(self.driver)
+        return self.click_and_navigate(self.ADD_EMPLOYEE_BUTTON)
     
     def search_employee(self, search_text):
         """
@@ -48,10 +49,12 @@ class EmployeeListPage(BasePage):
         
         Args:
             search_text (str): Text to search for
+            
+        Returns:
+            EmployeeListPage: The list with the search results
         """
         self.input_text(self.SEARCH_INPUT, search_text)
-        self.click(self.FILTER_BUTTON)
-        return self
+        return self.click_and_wait_for_change(self.FILTER_BUTTON, self.EMPLOYEE_TABLE)
     
     def filter_by_status(self, status):
         """
@@ -59,10 +62,12 @@ class EmployeeListPage(BasePage):
         
         Args:
             status (str): Status to filter by (Active/Inactive)
+            
+        Returns:
+            EmployeeListPage: The filtered list
         """
         self.select_option_by_text(self.STATUS_DROPDOWN, status)
-        self.click(self.FILTER_BUTTON)
-        return self
+        return self.click_and_wait_for_change(self.FILTER_BUTTON, self.EMPLOYEE_TABLE)
     
     def filter_by_department(self, department):
         """
@@ -70,10 +75,12 @@ class EmployeeListPage(BasePage):
         
         Args:
             department (str): Department name to filter by
+            
+        Returns:
+            EmployeeListPage: The filtered list
         """
         self.select_option_by_text(self.DEPARTMENT_DROPDOWN, department)
-        self.click(self.FILTER_BUTTON)
-        return self
+        return self.click_and_wait_for_change(self.FILTER_BUTTON, self.EMPLOYEE_TABLE)
     
     def get_employee_count(self):
         """
@@ -82,23 +89,33 @@ class EmployeeListPage(BasePage):
         Returns:
             int: Number of employee rows
         """
-        if self.is_element_present(self.NO_EMPLOYEES_MESSAGE, 1):
+        found = self.find_any_of([self.NO_EMPLOYEES_MESSAGE, self.TABLE_ROWS])
+        if found[self.NO_EMPLOYEES_MESSAGE]:
             return 0
-        rows = self.find_elements(self.TABLE_ROWS)
-        return len(rows)
+        return len(found[self.TABLE_ROWS])
     
-    def is_employee_displayed(self, name):
+    def is_employee_displayed(self, name, timeout=5):
         """
         Check if an employee is displayed in the table.
         
         Args:
             name (str): Employee name to check for
+            timeout (int, optional): Maximum time to wait for the employee's row
             
         Returns:
             bool: True if employee is displayed
         """
-        employee_row_locator = (By.XPATH, self.EMPLOYEE_ROW_BY_NAME.format(name))
-        return self.is_element_present(employee_row_locator)
+        def row_displayed(driver):
+            try:
+                return self.read_table(timeout=0).find_by_name(name) is not None
+            except TimeoutException:
+                # The table has no rows yet
+                return False
+        
+        try:
+            return self.wait(timeout).until(row_displayed)
+        except TimeoutException:
+            return False
     
     def edit_employee(self, name):
         """
@@ -110,10 +127,8 @@ class EmployeeListPage(BasePage):
         Returns:
             EmployeeFormPage: Employee form page object
         """
-        edit_button_locator = (By.XPATH, self.EDIT_BUTTON_IN_ROW.format(name))
-        self.click(edit_button_locator)
-        from .employee_form_page import EmployeeFormPage
-        return EmployeeFormPage(self.driver)
+        edit_button_locator = self.EDIT_BUTTON_IN_ROW.format(name)
+        return self.click_and_navigate(edit_button_locator)
     
     def delete_employee(self, name):
         """
@@ -125,15 +140,31 @@ class EmployeeListPage(BasePage):
         Returns:
             EmployeeDeletePage: Employee delete page object
         """
-        delete_button_locator = (By.XPATH, self.DELETE_BUTTON_IN_ROW.format(name))
-        self.click(delete_button_locator)
-        from .employee_delete_page import EmployeeDeletePage
-        return EmployeeDeletePage(self.driver)
+        delete_button_locator = self.DELETE_BUTTON_IN_ROW.format(name)
+        return self.click_and_navigate(delete_button_locator)
     
     def export_to_csv(self):
         """Click the Export to CSV button."""
         self.click(self.EXPORT_CSV_BUTTON)
     
+    def read_table(self, timeout=None):
+        """
+        Read the whole employee table in one round trip.
+        
+        Args:
+            timeout (int, optional): Maximum time to wait for the rows
+            
+        Returns:
+            TableSnapshot: EmployeeRow tuples indexed by name and email
+        """
+        rows = []
+        for cells in self.read_table_cells(self.TABLE_ROWS, timeout=timeout):
+            # Skips the 'No employees found' placeholder row
+            if len(cells) >= len(EmployeeRow._fields):
+                name, email, department, salary, status = cells[:5]
+                rows.append(EmployeeRow(name, email, department, salary.replace("$", ""), status))
+        return TableSnapshot(rows)
+    
     def get_employee_data(self, name):
         """
         Get employee data from the table.
@@ -144,17 +175,8 @@ class EmployeeListPage(BasePage):
         Returns:
             dict: Employee data (name, email, department, salary, status)
         """
-        row_locator = (By.XPATH, self.EMPLOYEE_ROW_BY_NAME.format(name))
-        if not self.is_element_present(row_locator):
+        row = self.read_table().find_by_name(name)
+        if row is None:
             return None
         
-        row = self.find_element(row_locator)
-        cells = row.find_elements(By.TAG_NAME, "td")
-        
-        return {
-            "name": cells[0].text,
-            "email": cells[1].text,
-            "department": cells[2].text,
-            "salary": cells[3].text.replace("$", ""),
-            "status": cells[4].text
-        }
+        return row._asdict()
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
+from .locators import compile_locator
 
 class HomePage(BasePage):
     """
@@ -8,9 +9,9 @@ class HomePage(BasePage):
     
     # Locators
     NAVBAR_BRAND = (By.CLASS_NAME, "navbar-brand")
-    HOME_NAV_LINK = (By.XPATH, "//a[@class='nav-link' and text()='Home']")
-    EMPLOYEES_NAV_LINK = (By.XPATH, "//a[@class='nav-link' and text()='Employees']")
-    DEPARTMENTS_NAV_LINK = (By.XPATH, "//a[@class='nav-link' and text()='Departments']")
+    HOME_NAV_LINK = compile_locator(By.XPATH, "//a[@class='nav-link' and text()='Home']")
+    EMPLOYEES_NAV_LINK = compile_locator(By.XPATH, "//a[@class='nav-link' and text()='Employees']")
+    DEPARTMENTS_NAV_LINK = compile_locator(By.XPATH, "//a[@class='nav-link' and text()='Departments']")
     FOOTER_TEXT = (By.CLASS_NAME, "text-muted")
     
     def __init__(self, driver):
@@ -21,6 +22,15 @@ class HomePage(BasePage):
         self.open("")
         return self
     
+    def navigate_to_home(self):
+        """
+        Navigate to the home page through the navbar.
+        
+        Returns:
+            HomePage: Home page object
+        """
+        return self.click_and_navigate(self.HOME_NAV_LINK)
+    
     def navigate_to_employees(self):
         """
         Navigate to the employees page.
@@ -28,9 +38,7 @@ class HomePage(BasePage):
         Returns:
             EmployeeListPage: Employee list page object
         """
-        self.click(self.EMPLOYEES_NAV_LINK)
-        from .employee_list_page import EmployeeListPage
-        return EmployeeListPage(self.driver)
+        return self.click_and_navigate(self.EMPLOYEES_NAV_LINK)
     
     def navigate_to_departments(self):
         """
@@ -39,9 +47,7 @@ class HomePage(BasePage):
         Returns:
             DepartmentListPage: Department list page object
         """
-        self.click(self.DEPARTMENTS_NAV_LINK)
-        from .department_list_page import DepartmentListPage
-        return DepartmentListPage(self.driver)
+        return self.click_and_navigate(self.DEPARTMENTS_NAV_LINK)
     
     def is_on_home_page(self):
         """
@@ -0,0 +1,178 @@
+import re
+import string
+from selenium.webdriver.common.by import By
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+_XPATH_STEP = re.compile(r"^(?P<axis>following-sibling::)?(?P<tag>[A-Za-z][A-Za-z0-9]*|\*)(?:\[(?P<predicates>[^\[\]]*)\])?$")
+_XPATH_ATTRIBUTE = re.compile(r"^@(?P<name>[A-Za-z_][A-Za-z0-9_-]*)\s*=\s*'(?P<value>[^']*)'$")
+
+def xpath_literal(value):
+    """
+    Quote a value as an XPath 1.0 string literal.
+    
+    XPath 1.0 has no escape character, so a value containing both quote
+    characters is built with concat().
+    
+    Args:
+        value (str): Text to quote
+        
+    Returns:
+        str: XPath expression evaluating to the value
+    """
+    value = str(value)
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+def css_literal(value):
+    """
+    Quote a value as a CSS string literal.
+    
+    Args:
+        value (str): Text to quote
+        
+    Returns:
+        str: Quoted CSS string
+    """
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\a ")
+    return f"'{escaped}'"
+
+def xpath_to_css(xpath):
+    """
+    Translate an XPath into an equivalent CSS selector where one exists.
+    
+    Only the subset with an exact CSS counterpart is translated: descendant
+    and child steps, following-sibling steps, tag names and attribute
+    equality predicates. Anything else (text(), contains(), positions,
+    parent steps) returns None.
+    
+    Args:
+        xpath (str): XPath expression
+        
+    Returns:
+        str: CSS selector, or None if there is no exact equivalent
+    """
+    if not xpath.startswith("//"):
+        return None
+    tokens = re.split(r"(//|/)", xpath[2:])
+    selector = ""
+    combinator = ""
+    for token in tokens:
+        if token == "//":
+            combinator = " "
+            continue
+        if token == "/":
+            combinator = " > "
+            continue
+        step = _XPATH_STEP.match(token)
+        if step is None:
+            return None
+        if step.group("axis"):
+            if combinator != " > ":
+                return None
+            combinator = " ~ "
+        compound = "" if step.group("tag") == "*" else step.group("tag")
+        predicates = step.group("predicates")
+        if predicates:
+            for predicate in predicates.split(" and "):
+                attribute = _XPATH_ATTRIBUTE.match(predicate.strip())
+                if attribute is None:
+                    return None
+                name, value = attribute.group("name"), attribute.group("value")
+                if name == "id" and _IDENTIFIER.match(value):
+                    compound += f"#{value}"
+                else:
+                    compound += f"[{name}={css_literal(value)}]"
+        selector += combinator + (compound or "*")
+        combinator = ""
+    return selector or None
+
+def compile_locator(by, value):
+    """
+    Build a locator, switching to the cheapest equivalent strategy.
+    
+    '//*[@id='x']' becomes By.ID and other XPaths with an exact CSS
+    counterpart become By.CSS_SELECTOR, which browsers match natively
+    instead of through the XPath evaluator. Locators that need XPath
+    (text matching, parent steps) are returned unchanged.
+    
+    Args:
+        by (str): Locator strategy
+        value (str): Locator value
+        
+    Returns:
+        tuple: Locator tuple (by, value)
+    """
+    if by != By.XPATH:
+        return (by, value)
+    css = xpath_to_css(value)
+    if css is None:
+        return (by, value)
+    if css.startswith("#") and _IDENTIFIER.match(css[1:]):
+        return (By.ID, css[1:])
+    return (By.CSS_SELECTOR, css)
+
+class LocatorTemplate:
+    """
+    A locator with placeholders for values, such as a table row by name.
+    
+    The template is parsed once. Each placeholder stands for a whole string
+    literal: values are quoted and escaped for the template's strategy, so
+    names containing quotes produce valid locators.
+    
+        ROW_BY_NAME = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]")
+        ROW_BY_NAME.format("O'Brien")  # (By.XPATH, "//table/tbody/tr[td[text()=\"O'Brien\"]]")
+    """
+    
+    __slots__ = ("by", "template", "_parts", "_quote", "_fields")
+    
+    def __init__(self, by, template):
+        """
+        Args:
+            by (str): Locator strategy, By.XPATH or By.CSS_SELECTOR
+            template (str): Locator value with '{}' placeholders for literals
+            
+        Raises:
+            ValueError: If the strategy does not support literals or the
+                        template uses named or indexed placeholders
+        """
+        if by not in (By.XPATH, By.CSS_SELECTOR):
+            raise ValueError(f"Locator templates need XPath or CSS, got {by}")
+        self.by = by
+        self.template = template
+        self._quote = xpath_literal if by == By.XPATH else css_literal
+        self._parts = []
+        for literal_text, field_name, format_spec, conversion in string.Formatter().parse(template):
+            if field_name or format_spec or conversion:
+                raise ValueError(f"Only '{{}}' placeholders are supported: {template}")
+            self._parts.append((literal_text, field_name is not None))
+        self._fields = sum(has_field for _, has_field in self._parts)
+    
+    def format(self, *values):
+        """
+        Fill the placeholders.
+        
+        Args:
+            *values: One value per placeholder, inserted as quoted literals
+            
+        Returns:
+            tuple: Locator tuple (by, value)
+            
+        Raises:
+            ValueError: If the number of values does not match the placeholders
+        """
+        if len(values) != self._fields:
+            raise ValueError(f"{self.template} has {self._fields} placeholders, got {len(values)} values")
+        values = iter(values)
+        pieces = []
+        for literal_text, has_field in self._parts:
+            pieces.append(literal_text)
+            if has_field:
+                pieces.append(self._quote(next(values)))
+        return (self.by, "".join(pieces))
+    
+    def __repr__(self):
+        return f"LocatorTemplate({self.by!r}, {self.template!r})"
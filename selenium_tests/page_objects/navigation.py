@@ -0,0 +1,148 @@
+from collections import namedtuple
+from .home_page import HomePage
+from .employee_list_page import EmployeeListPage
+from .employee_form_page import EmployeeFormPage
+from .department_list_page import DepartmentListPage
+from .department_form_page import DepartmentFormPage
+from .routes import page_class_for_url
+
+# A page object method that loads another page without needing arguments.
+# source None means the method is available on every page (the navbar
+# links, called through HomePage); method 'open' means loading the target's
+# URL directly.
+Transition = namedtuple("Transition", ["source", "method", "target"])
+
+TRANSITIONS = [
+    Transition(None, "navigate_to_home", HomePage),
+    Transition(None, "navigate_to_employees", EmployeeListPage),
+    Transition(None, "navigate_to_departments", DepartmentListPage),
+    Transition(EmployeeListPage, "click_add_new_employee", EmployeeFormPage),
+    Transition(DepartmentListPage, "click_add_new_department", DepartmentFormPage),
+]
+
+# Pages that can be opened by URL (relative to the base URL)
+DIRECT_PATHS = {
+    HomePage: "",
+    EmployeeListPage: "employees/",
+    EmployeeFormPage: "employees/create/",
+    DepartmentListPage: "departments/",
+    DepartmentFormPage: "departments/create/",
+}
+
+class Navigator:
+    """
+    Takes the browser to a page object with the fewest page loads.
+    
+    Every page object transition and every directly openable URL costs one
+    load. The planner starts from the page the browser is on (free) or from
+    any direct URL (one load) and does nothing when the browser already
+    shows the target's plain URL. With via_clicks the plan always ends with
+    a click into the target, even when the browser already shows it, so a
+    query string or form state is reset through the navbar. It does not know
+    whether the data has changed since that page was loaded, so use
+    reload=True after seeding.
+    """
+    
+    def __init__(self, driver):
+        """
+        Args:
+            driver (WebDriver): Driver with base_url set
+        """
+        self.driver = driver
+    
+    def current_page_class(self):
+        """
+        Returns:
+            type: Page object class for the current URL, None when the browser
+                  is not on the application
+        """
+        url = self.driver.current_url
+        if not url.startswith(self.driver.base_url):
+            return None
+        return page_class_for_url(url, self.driver.base_url)
+    
+    def is_at(self, page_class):
+        """
+        Check whether the browser shows a page, with no query string or form result.
+        
+        Args:
+            page_class (type): Page object class
+            
+        Returns:
+            bool: True if the current URL is the page's plain URL
+        """
+        path = DIRECT_PATHS.get(page_class)
+        if path is None:
+            return self.current_page_class() is page_class
+        return self.driver.current_url == f"{self.driver.base_url}/{path}"
+    
+    def plan(self, target, via_clicks=False, reload=False):
+        """
+        Plan the cheapest way to a page.
+        
+        Args:
+            target (type): Page object class to reach
+            via_clicks (bool): Reach the target through a transition instead
+                               of opening its URL, to exercise the click path,
+                               even if the browser already shows it
+            reload (bool): Load the target even if the browser already shows it
+            
+        Returns:
+            list: Transition steps, empty if the browser is already there
+                  and via_clicks is False
+            
+        Raises:
+            ValueError: If the target cannot be reached
+        """
+        if not reload and not via_clicks and self.is_at(target):
+            return []
+        
+        # (cost, steps) of the cheapest known way to each page
+        best = {}
+        current = self.current_page_class()
+        if current is not None and not reload:
+            # Showing the target with a query string or a form result, or
+            # when clicks are wanted, does not count as being there; None
+            # stands for the current page, where only the navbar applies
+            best[None if current is target else current] = (0, [])
+        for page_class in DIRECT_PATHS:
+            if via_clicks and page_class is target:
+                continue
+            if page_class not in best:
+                best[page_class] = (1, [Transition(None, "open", page_class)])
+        
+        # Relax every transition until nothing improves; the graph is tiny
+        changed = True
+        while changed:
+            changed = False
+            for page_class, (cost, steps) in list(best.items()):
+                for transition in TRANSITIONS:
+                    if transition.source not in (None, page_class):
+                        continue
+                    if transition.target in best and best[transition.target][0] <= cost + 1:
+                        continue
+                    best[transition.target] = (cost + 1, steps + [transition])
+                    changed = True
+        
+        if target not in best:
+            raise ValueError(f"No way to reach {target.__name__}")
+        return best[target][1]
+    
+    def go_to(self, target, via_clicks=False, reload=False):
+        """
+        Take the browser to a page.
+        
+        Args:
+            target (type): Page object class to reach
+            via_clicks (bool): Reach the target through a transition instead of its URL
+            reload (bool): Load the target even if the browser already shows it
+            
+        Returns:
+            BasePage: Page object of the target class
+        """
+        for transition in self.plan(target, via_clicks, reload):
+            if transition.method == "open":
+                transition.target(self.driver).open(DIRECT_PATHS[transition.target])
+            else:
+                getattr((transition.source or HomePage)(self.driver), transition.method)()
+        return target(self.driver)
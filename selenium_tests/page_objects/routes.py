@@ -0,0 +1,55 @@
+import re
+from urllib.parse import urlsplit
+from .base_page import BasePage
+from .home_page import HomePage
+from .employee_list_page import EmployeeListPage
+from .employee_form_page import EmployeeFormPage
+from .employee_delete_page import EmployeeDeletePage
+from .department_list_page import DepartmentListPage
+from .department_form_page import DepartmentFormPage
+from .department_delete_page import DepartmentDeletePage
+
+# URL path (relative to the base URL) and the page object that represents it
+ROUTES = [
+    (re.compile(r"^/$"), HomePage),
+    (re.compile(r"^/employees/$"), EmployeeListPage),
+    (re.compile(r"^/employees/create/$"), EmployeeFormPage),
+    (re.compile(r"^/employees/\d+/update/$"), EmployeeFormPage),
+    (re.compile(r"^/employees/\d+/delete/$"), EmployeeDeletePage),
+    (re.compile(r"^/departments/$"), DepartmentListPage),
+    (re.compile(r"^/departments/create/$"), DepartmentFormPage),
+    (re.compile(r"^/departments/\d+/update/$"), DepartmentFormPage),
+    (re.compile(r"^/departments/\d+/delete/$"), DepartmentDeletePage),
+]
+
+def page_class_for_url(url, base_url):
+    """
+    Find the page object class for a URL of the application.
+    
+    Args:
+        url (str): Absolute URL, query string allowed
+        base_url (str): Base URL of the application
+        
+    Returns:
+        type: Page object class, or BasePage if no route matches
+    """
+    path = urlsplit(url).path
+    base_path = urlsplit(base_url).path.rstrip("/")
+    if base_path and path.startswith(base_path):
+        path = path[len(base_path):]
+    for pattern, page_class in ROUTES:
+        if pattern.match(path or "/"):
+            return page_class
+    return BasePage
+
+def page_for_url(driver):
+    """
+    Create the page object for the page the driver is on.
+    
+    Args:
+        driver (WebDriver): Driver with base_url set
+        
+    Returns:
+        BasePage: Page object for the current URL
+    """
+    return page_class_for_url(driver.current_url, driver.base_url)(driver)
@@ -0,0 +1,59 @@
+from collections import namedtuple
+
+# Compact row types for the list page tables, in column order
+EmployeeRow = namedtuple("EmployeeRow", ["name", "email", "department", "salary", "status"])
+DepartmentRow = namedtuple("DepartmentRow", ["name"])
+
+class TableSnapshot:
+    """
+    Rows read from a list page table, indexed by name and email.
+    
+    The snapshot reflects the table at the time it was read; read the table
+    again after any action that reloads the page.
+    """
+    
+    __slots__ = ("rows", "by_name", "by_email")
+    
+    def __init__(self, rows):
+        """
+        Args:
+            rows (list): Row tuples in table order
+        """
+        self.rows = rows
+        self.by_name = {}
+        self.by_email = {}
+        for row in rows:
+            self.by_name.setdefault(row.name, row)
+            email = getattr(row, "email", None)
+            if email is not None:
+                self.by_email.setdefault(email, row)
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    def find_by_name(self, name):
+        """
+        Look up a row by name.
+        
+        Args:
+            name (str): Value of the name column
+            
+        Returns:
+            tuple: First matching row, or None
+        """
+        return self.by_name.get(name)
+    
+    def find_by_email(self, email):
+        """
+        Look up a row by email.
+        
+        Args:
+            email (str): Value of the email column
+            
+        Returns:
+            tuple: First matching row, or None
+        """
+        return self.by_email.get(email)
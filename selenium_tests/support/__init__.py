@@ -0,0 +1,6 @@
+"""
+Test harness support code for the Employee Management System tests.
+"""
+
+from .driver_factory import create_chrome_driver
+from .driver_pool import DriverPool
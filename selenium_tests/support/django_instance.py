@@ -0,0 +1,181 @@
+import os
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+# Settings module written next to the worker's database. It reuses the
+# project's settings unchanged except for the database file, so nothing in
+# the EMS project itself has to be modified.
+SETTINGS_TEMPLATE = """import os
+from {settings_module} import *  # noqa: F401,F403
+
+DATABASES = dict(DATABASES)
+DATABASES["default"] = dict(DATABASES["default"], NAME=os.environ["EMS_TEST_DB"])
+ALLOWED_HOSTS = ["127.0.0.1", "localhost"]
+"""
+
+def get_worker_id():
+    """
+    Get the pytest-xdist worker id of the current process.
+    
+    Returns:
+        str: Worker id such as 'gw0', or 'master' when not running under xdist
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+def find_free_port(host="127.0.0.1"):
+    """
+    Ask the OS for a currently unused TCP port.
+    
+    Args:
+        host (str): Interface the port will be bound on
+        
+    Returns:
+        int: Free port number
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+def _copy_database(source_path, target_path):
+    source = sqlite3.connect(source_path)
+    target = sqlite3.connect(target_path, timeout=30)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+class DjangoInstance:
+    """
+    A private EMS Django server for one pytest-xdist worker.
+    
+    Each instance runs `manage.py runserver` on its own port against its own
+    copy of a template SQLite database, so parallel workers neither share
+    data nor contend for SQLite's write lock.
+    """
+    
+    SETTINGS_MODULE_NAME = "ems_worker_settings"
+    
+    def __init__(self, project_dir, template_db, work_dir, settings_module="ems.settings",
+                 worker_id=None, host="127.0.0.1", port=None, startup_timeout=30):
+        """
+        Args:
+            project_dir (str): Directory of the EMS project containing manage.py
+            template_db (str): Migrated SQLite database copied for this worker
+            work_dir (str): Directory for the worker's database and settings module
+            settings_module (str): Dotted path of the project's settings module
+            worker_id (str, optional): xdist worker id, detected if not given
+            host (str): Interface to bind
+            port (int, optional): Port to bind, a free port if not given
+            startup_timeout (int): Seconds to wait for the server to respond
+        """
+        self.project_dir = os.path.abspath(project_dir)
+        self.template_db = os.path.abspath(template_db)
+        self.settings_module = settings_module
+        self.worker_id = worker_id or get_worker_id()
+        self.work_dir = os.path.join(os.path.abspath(work_dir), self.worker_id)
+        self.host = host
+        self.port = port or find_free_port(host)
+        self.startup_timeout = startup_timeout
+        self.db_path = os.path.join(self.work_dir, "db.sqlite3")
+        self.snapshot_path = os.path.join(self.work_dir, "snapshot.sqlite3")
+        self._process = None
+        self._log_path = os.path.join(self.work_dir, "server.log")
+    
+    @property
+    def url(self):
+        """
+        Returns:
+            str: Base URL of the instance, without trailing slash
+        """
+        return f"http://{self.host}:{self.port}"
+    
+    def start(self):
+        """
+        Copy the template database and start the server.
+        
+        Returns:
+            DjangoInstance: self
+            
+        Raises:
+            FileNotFoundError: If manage.py or the template database is missing
+            RuntimeError: If the server does not come up within startup_timeout
+        """
+        manage_py = os.path.join(self.project_dir, "manage.py")
+        if not os.path.isfile(manage_py):
+            raise FileNotFoundError(f"EMS project not found: {manage_py}")
+        if not os.path.isfile(self.template_db):
+            raise FileNotFoundError(
+                f"Template database not found: {self.template_db} (run 'python manage.py migrate' first)"
+            )
+        
+        os.makedirs(self.work_dir, exist_ok=True)
+        shutil.copyfile(self.template_db, self.db_path)
+        with open(os.path.join(self.work_dir, f"{self.SETTINGS_MODULE_NAME}.py"), 'w') as settings:
+            settings.write(SETTINGS_TEMPLATE.format(settings_module=self.settings_module))
+        
+        env = dict(os.environ)
+        env["EMS_TEST_DB"] = self.db_path
+        env["DJANGO_SETTINGS_MODULE"] = self.SETTINGS_MODULE_NAME
+        env["PYTHONPATH"] = os.pathsep.join(
+            [self.work_dir, self.project_dir] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+        )
+        
+        log = open(self._log_path, 'w')
+        self._process = subprocess.Popen(
+            [sys.executable, manage_py, "runserver", f"{self.host}:{self.port}", "--noreload"],
+            cwd=self.project_dir, env=env, stdout=log, stderr=subprocess.STDOUT,
+        )
+        log.close()
+        self._wait_until_ready()
+        return self
+    
+    def _wait_until_ready(self):
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"EMS server for {self.worker_id} exited; see {self._log_path}")
+            try:
+                with urllib.request.urlopen(f"{self.url}/", timeout=2):
+                    return
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"EMS server for {self.worker_id} did not start within "
+                           f"{self.startup_timeout}s; see {self._log_path}")
+    
+    def snapshot(self):
+        """
+        Save the worker's database as the state restore() returns to.
+        
+        Uses SQLite's online backup API, so the server can keep running.
+        """
+        _copy_database(self.db_path, self.snapshot_path)
+    
+    def restore(self):
+        """
+        Return the worker's database to the last snapshot.
+        
+        The backup API rewrites the live database in place under SQLite's own
+        locking, which is much cheaper than restarting the server on a fresh copy.
+        """
+        if os.path.isfile(self.snapshot_path):
+            _copy_database(self.snapshot_path, self.db_path)
+    
+    def stop(self):
+        """Stop the server process."""
+        if self._process is None:
+            return
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
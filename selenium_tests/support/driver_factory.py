@@ -0,0 +1,64 @@
+import os
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from .instrumentation import instrument_driver
+
+# Django development server default
+DEFAULT_BASE_URL = "http://127.0.0.1:8000"
+
+# Used when no resolved chromedriver path is passed in
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ems-test")
+
+def build_chrome_options():
+    """
+    Build the Chrome options used for every test browser.
+    
+    Returns:
+        Options: Chrome options
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")  # Run headless Chrome for CI/CD
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1920,1080")
+    return chrome_options
+
+def create_chrome_driver(base_url=DEFAULT_BASE_URL, driver_path=None, request_policy=None,
+                         page_load_strategy="normal"):
+    """
+    Launch a new headless Chrome WebDriver session.
+    
+    Args:
+        base_url (str): Base URL of the application under test
+        driver_path (str, optional): chromedriver executable, resolved once per
+                                     session by ChromeDriverResolver
+        request_policy (RequestPolicy, optional): Request blocking and asset
+                                                  caching for the browser
+        page_load_strategy (str): 'normal' (wait for the load event) or 'eager'
+                                  (wait for DOMContentLoaded only)
+        
+    Returns:
+        WebDriver: Chrome WebDriver instance with base_url set and its
+                   commands counted by instrument_driver
+    """
+    if driver_path is None:
+        from .driver_resolver import ChromeDriverResolver
+        driver_path = ChromeDriverResolver(DEFAULT_CACHE_DIR).resolve()
+    
+    chrome_options = build_chrome_options()
+    chrome_options.page_load_strategy = page_load_strategy
+    if request_policy is not None and request_policy.active:
+        request_policy.configure_options(chrome_options, base_url)
+    else:
+        request_policy = None
+    
+    service = Service(driver_path)
+    # No implicit wait: BasePage does all waiting explicitly
+    driver = webdriver.Chrome(service=service, options=chrome_options)
+    if request_policy is not None:
+        request_policy.apply(driver)
+    
+    driver.base_url = base_url
+    driver.request_policy = request_policy
+    return instrument_driver(driver)
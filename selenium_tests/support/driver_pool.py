@@ -0,0 +1,146 @@
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+class DriverPool:
+    """
+    Pool of long-lived WebDriver sessions.
+    
+    Launching Chrome is the most expensive part of a test, so browsers are
+    kept alive between tests and handed out again after their session state
+    has been reset. Each pytest(-xdist) worker process owns its own pool.
+    """
+    
+    # Storage is per origin, so it can only be cleared while the app is loaded
+    CLEAR_STORAGE_SCRIPT = """
+        try { window.localStorage.clear(); } catch (e) {}
+        try { window.sessionStorage.clear(); } catch (e) {}
+    """
+    
+    def __init__(self, driver_factory, size=1):
+        """
+        Args:
+            driver_factory (callable): Zero-argument callable returning a new WebDriver
+            size (int): Maximum number of idle browsers kept alive
+        """
+        self.driver_factory = driver_factory
+        self.size = size
+        self._idle = []
+        self._in_use = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """
+        Check out a browser with a clean session.
+        
+        Returns:
+            WebDriver: Idle pooled driver, or a newly launched one if none is idle
+        """
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        # Launch outside the lock so other threads are not held up by a browser start
+        if driver is None:
+            driver = self.driver_factory()
+        with self._lock:
+            self._in_use.append(driver)
+        return driver
+    
+    def release(self, driver):
+        """
+        Return a browser to the pool.
+        
+        The session is reset first; browsers that cannot be reset or that
+        exceed the pool size are shut down instead of being kept.
+        
+        Args:
+            driver (WebDriver): Driver previously returned by acquire()
+        """
+        with self._lock:
+            if driver in self._in_use:
+                self._in_use.remove(driver)
+        
+        if not self.reset_session(driver):
+            self.discard(driver)
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self.discard(driver)
+    
+    def reset_session(self, driver):
+        """
+        Reset browser state so the next test starts like a fresh browser.
+        
+        Closes extra windows, clears cookies and local/session storage and
+        leaves the remaining window on a blank page.
+        
+        Args:
+            driver (WebDriver): Driver to reset
+            
+        Returns:
+            bool: True if the session was reset, False if the browser is unusable
+        """
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            # The app only ever runs on base_url, so that is the only origin
+            # whose cookies and storage can have been touched by the test.
+            # They are cleared wherever the test left the browser.
+            self.clear_app_state(driver)
+            driver.get("about:blank")
+            return True
+        except WebDriverException:
+            return False
+    
+    def clear_app_state(self, driver):
+        """
+        Clear the application origin's cookies and local/session storage.
+        
+        Uses DevTools, which works from any page; drivers without DevTools
+        load the application first so its storage can be cleared by script.
+        
+        Args:
+            driver (WebDriver): Driver to clear
+        """
+        base = urlsplit(driver.base_url)
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+                "origin": f"{base.scheme}://{base.netloc}",
+                "storageTypes": "local_storage,session_storage",
+            })
+            return
+        except (WebDriverException, AttributeError):
+            pass
+        
+        if not driver.current_url.startswith(driver.base_url):
+            driver.get(driver.base_url)
+        driver.execute_script(self.CLEAR_STORAGE_SCRIPT)
+        driver.delete_all_cookies()
+    
+    def discard(self, driver):
+        """
+        Shut down a browser without returning it to the pool.
+        
+        Args:
+            driver (WebDriver): Driver to quit
+        """
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+    
+    def close(self):
+        """Shut down every browser owned by the pool."""
+        with self._lock:
+            drivers = self._idle + self._in_use
+            self._idle = []
+            self._in_use = []
+        for driver in drivers:
+            self.discard(driver)
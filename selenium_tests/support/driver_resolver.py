@@ -0,0 +1,152 @@
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+class ChromeDriverResolver:
+    """
+    Resolves the chromedriver binary once per test session.
+    
+    Resolution order:
+        1. Explicitly configured path (--chromedriver or CHROMEDRIVER_PATH)
+        2. chromedriver found on PATH
+        3. Path cached for the installed Chrome version
+        4. Download through webdriver-manager (the only step that uses the network)
+        
+    When the Chrome version cannot be detected the cache is bypassed, since
+    a path cached under an unknown version would outlive Chrome upgrades.
+        
+    The cache is a JSON file shared by all pytest-xdist workers; a lock file
+    makes sure only one worker downloads while the others wait for its result.
+    """
+    
+    CACHE_FILE_NAME = "chromedriver_cache.json"
+    LOCK_FILE_NAME = "chromedriver_cache.lock"
+    
+    def __init__(self, cache_dir, explicit_path=None, allow_download=True, lock_timeout=120):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache and lock files
+            explicit_path (str, optional): Configured chromedriver path
+            allow_download (bool): Whether webdriver-manager may be used as a last resort
+            lock_timeout (int): Seconds after which a lock file is considered stale
+        """
+        self.cache_dir = str(cache_dir)
+        self.explicit_path = explicit_path or os.environ.get("CHROMEDRIVER_PATH")
+        self.allow_download = allow_download
+        self.lock_timeout = lock_timeout
+        self.cache_file = os.path.join(self.cache_dir, self.CACHE_FILE_NAME)
+        self.lock_file = os.path.join(self.cache_dir, self.LOCK_FILE_NAME)
+    
+    def resolve(self):
+        """
+        Resolve the chromedriver path.
+        
+        Returns:
+            str: Path to the chromedriver executable
+            
+        Raises:
+            FileNotFoundError: If the configured path does not exist
+            RuntimeError: If no driver is available and downloads are disabled
+        """
+        if self.explicit_path:
+            if not os.path.isfile(self.explicit_path):
+                raise FileNotFoundError(f"Configured chromedriver not found: {self.explicit_path}")
+            return self.explicit_path
+        
+        path_driver = shutil.which("chromedriver")
+        if path_driver:
+            return path_driver
+        
+        browser_version = self.get_browser_version()
+        cached = self._cached_path(browser_version)
+        if cached:
+            return cached
+        
+        with self._locked():
+            # Another worker may have resolved it while we waited for the lock
+            cached = self._cached_path(browser_version)
+            if cached:
+                return cached
+            
+            if not self.allow_download:
+                detected = f"Chrome {browser_version}" if browser_version else "an undetected Chrome version"
+                raise RuntimeError(
+                    f"No cached chromedriver for {detected} and downloads are disabled. "
+                    "Use --chromedriver or put chromedriver on PATH."
+                )
+            
+            from webdriver_manager.chrome import ChromeDriverManager
+            driver_path = ChromeDriverManager().install()
+            if browser_version:
+                self._store_path(browser_version, driver_path)
+            return driver_path
+    
+    def get_browser_version(self):
+        """
+        Get the installed Chrome version without using the network.
+        
+        Returns:
+            str: Chrome version, or None if it cannot be determined
+        """
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE) or None
+    
+    def _read_cache(self):
+        try:
+            with open(self.cache_file, 'r') as cache:
+                return json.load(cache)
+        except (OSError, ValueError):
+            return {}
+    
+    def _cached_path(self, browser_version):
+        if not browser_version:
+            return None
+        driver_path = self._read_cache().get(browser_version)
+        if driver_path and os.path.isfile(driver_path):
+            return driver_path
+        return None
+    
+    def _store_path(self, browser_version, driver_path):
+        entries = self._read_cache()
+        entries[browser_version] = driver_path
+        temp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, 'w') as cache:
+            json.dump(entries, cache, indent=2)
+        os.replace(temp_file, self.cache_file)
+    
+    @contextmanager
+    def _locked(self):
+        """Hold the cross-process lock file for the duration of the block."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                if self._lock_is_stale():
+                    self._remove_lock()
+                elif time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.lock_file}")
+                else:
+                    time.sleep(0.1)
+        try:
+            os.write(fd, str(os.getpid()).encode())
+            os.close(fd)
+            yield
+        finally:
+            self._remove_lock()
+    
+    def _lock_is_stale(self):
+        try:
+            return time.time() - os.path.getmtime(self.lock_file) > self.lock_timeout
+        except OSError:
+            return False
+    
+    def _remove_lock(self):
+        try:
+            os.remove(self.lock_file)
+        except OSError:
+            pass
@@ -0,0 +1,57 @@
+class DurationHistory:
+    """
+    Per-test durations from earlier runs, kept in the pytest cache.
+    
+    Each new measurement is blended with the stored value so that a single
+    slow or fast run does not reorder the whole suite.
+    """
+    
+    CACHE_KEY = "ems/durations"
+    SMOOTHING = 0.5
+    
+    def __init__(self, cache):
+        """
+        Args:
+            cache: pytest cache (config.cache)
+        """
+        self.cache = cache
+        self.durations = dict(cache.get(self.CACHE_KEY, {}))
+        self._current = {}
+    
+    def __bool__(self):
+        return bool(self.durations)
+    
+    def add(self, nodeid, duration):
+        """
+        Add the duration of one test phase (setup, call or teardown) of this run.
+        
+        Args:
+            nodeid (str): Test id
+            duration (float): Seconds
+        """
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + duration
+    
+    def estimates(self, nodeids):
+        """
+        Estimate the duration of each test.
+        
+        Tests without history are assumed to take the mean known duration.
+        
+        Args:
+            nodeids (list): Test ids
+            
+        Returns:
+            list: Estimated seconds in the order of nodeids
+        """
+        default = sum(self.durations.values()) / len(self.durations) if self.durations else 0.0
+        return [self.durations.get(nodeid, default) for nodeid in nodeids]
+    
+    def save(self):
+        """Blend this run's durations into the history and write it to the cache."""
+        for nodeid, duration in self._current.items():
+            previous = self.durations.get(nodeid)
+            if previous is None:
+                self.durations[nodeid] = round(duration, 4)
+            else:
+                self.durations[nodeid] = round(previous + self.SMOOTHING * (duration - previous), 4)
+        self.cache.set(self.CACHE_KEY, self.durations)
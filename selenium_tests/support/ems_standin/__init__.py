@@ -0,0 +1,10 @@
+"""
+In-process stand-in for the Employee Management System.
+
+Implements the pages, forms and URLs the page objects rely on with an
+in-memory data store, so the suite can run without the Django application.
+"""
+
+from .store import EmsStore, ValidationError
+from .app import EmsApp
+from .server import StandinServer
@@ -0,0 +1,379 @@
+import csv
+import io
+import re
+import secrets
+from html import escape
+from http.cookies import SimpleCookie
+from urllib.parse import parse_qs, urlencode
+from .store import ValidationError
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Employee Management System</title>
+</head>
+<body>
+<nav class="navbar navbar-expand-lg navbar-dark bg-dark">
+<div class="container">
+<a class="navbar-brand" href="/">EMS</a>
+<ul class="navbar-nav">
+<li class="nav-item"><a class="nav-link" href="/">Home</a></li>
+<li class="nav-item"><a class="nav-link" href="/employees/">Employees</a></li>
+<li class="nav-item"><a class="nav-link" href="/departments/">Departments</a></li>
+</ul>
+</div>
+</nav>
+<div class="container mt-4">
+{messages}{content}
+</div>
+<footer class="footer mt-5 py-3"><div class="container"><span class="text-muted">Employee Management System</span></div></footer>
+</body>
+</html>
+"""
+
+HOME_CONTENT = """<h1>Welcome to the Employee Management System</h1>
+<p class="lead">Manage employees and departments.</p>
+"""
+
+class Request:
+    """Minimal view of a WSGI request."""
+    
+    def __init__(self, environ):
+        self.method = environ["REQUEST_METHOD"]
+        self.path = environ.get("PATH_INFO") or "/"
+        self.query = {key: values[0] for key, values in
+                      parse_qs(environ.get("QUERY_STRING", ""), keep_blank_values=True).items()}
+        self.form = {}
+        if self.method == "POST":
+            length = int(environ.get("CONTENT_LENGTH") or 0)
+            body = environ["wsgi.input"].read(length).decode("utf-8")
+            self.form = {key: values[0] for key, values in
+                         parse_qs(body, keep_blank_values=True).items()}
+        cookie = SimpleCookie(environ.get("HTTP_COOKIE", ""))
+        self.cookies = {key: morsel.value for key, morsel in cookie.items()}
+
+class Response:
+    """Minimal WSGI response."""
+    
+    def __init__(self, body="", status="200 OK", content_type="text/html; charset=utf-8", headers=None):
+        self.body = body.encode("utf-8") if isinstance(body, str) else body
+        self.status = status
+        self.headers = [("Content-Type", content_type)] + list(headers or [])
+
+def redirect(location):
+    return Response("", "302 Found", headers=[("Location", location)])
+
+class EmsApp:
+    """
+    WSGI application reproducing the EMS pages used by the page objects.
+    
+    URLs mirror the Django application: /employees/, /employees/create/,
+    /employees/<id>/update/, /employees/<id>/delete/, /employees/export/ and
+    the same set under /departments/. Forms are protected by a CSRF token
+    handled like Django's (csrftoken cookie + csrfmiddlewaretoken field).
+    """
+    
+    def __init__(self, store):
+        """
+        Args:
+            store (EmsStore): Data store backing the pages
+        """
+        self.store = store
+        self.routes = [
+            (re.compile(r"^/$"), self.home),
+            (re.compile(r"^/employees/$"), self.employee_list),
+            (re.compile(r"^/employees/export/$"), self.employee_export),
+            (re.compile(r"^/employees/create/$"), self.employee_form),
+            (re.compile(r"^/employees/(?P<pk>\d+)/update/$"), self.employee_form),
+            (re.compile(r"^/employees/(?P<pk>\d+)/delete/$"), self.employee_delete),
+            (re.compile(r"^/departments/$"), self.department_list),
+            (re.compile(r"^/departments/create/$"), self.department_form),
+            (re.compile(r"^/departments/(?P<pk>\d+)/update/$"), self.department_form),
+            (re.compile(r"^/departments/(?P<pk>\d+)/delete/$"), self.department_delete),
+        ]
+        self._messages = {}
+    
+    def __call__(self, environ, start_response):
+        request = Request(environ)
+        token = request.cookies.get("csrftoken")
+        new_token = None
+        if not token:
+            token = new_token = secrets.token_hex(16)
+        request.csrf_token = token
+        
+        response = self.dispatch(request)
+        if new_token:
+            response.headers.append(("Set-Cookie", f"csrftoken={new_token}; Path=/; SameSite=Lax"))
+        start_response(response.status, response.headers + [("Content-Length", str(len(response.body)))])
+        return [response.body]
+    
+    def dispatch(self, request):
+        for pattern, view in self.routes:
+            match = pattern.match(request.path)
+            if match:
+                if request.method == "POST" and not self.csrf_valid(request):
+                    return Response("<h1>403 Forbidden</h1><p>CSRF verification failed.</p>", "403 Forbidden")
+                kwargs = {key: int(value) for key, value in match.groupdict().items()}
+                return view(request, **kwargs)
+        return Response("<h1>Not Found</h1>", "404 Not Found")
+    
+    # Rendering helpers
+    
+    def render(self, request, content):
+        messages = self._messages.pop(request.csrf_token, [])
+        message_html = "".join(
+            f'<div class="alert alert-success alert-dismissible" role="alert">{escape(message)}</div>\n'
+            for message in messages
+        )
+        return Response(LAYOUT.format(messages=message_html, content=content))
+    
+    def flash(self, request, message):
+        self._messages.setdefault(request.csrf_token, []).append(message)
+    
+    def csrf_valid(self, request):
+        cookie_token = request.cookies.get("csrftoken")
+        return bool(cookie_token) and request.form.get("csrfmiddlewaretoken") == cookie_token
+    
+    def csrf_field(self, request):
+        return f'<input type="hidden" name="csrfmiddlewaretoken" value="{request.csrf_token}">'
+    
+    def field(self, field_id, control, errors, label):
+        error = errors.get(field_id)
+        if error:
+            control = control.replace('class="form-control"', 'class="form-control is-invalid"') \
+                             .replace('class="form-select"', 'class="form-select is-invalid"')
+            control += f'<div class="invalid-feedback">{escape(error)}</div>'
+        return (f'<div class="mb-3"><label for="id_{field_id}" class="form-label">{label}</label>'
+                f'{control}</div>\n')
+    
+    # Views
+    
+    def home(self, request):
+        return self.render(request, HOME_CONTENT)
+    
+    def _employee_filters(self, request):
+        try:
+            department_id = int(request.query.get("department") or 0) or None
+        except ValueError:
+            department_id = None
+        return request.query.get("q", ""), request.query.get("status", ""), department_id
+    
+    def employee_list(self, request):
+        query, status, department_id = self._employee_filters(request)
+        employees = self.store.list_employees(query, status, department_id)
+        
+        status_options = "".join(
+            f'<option value="{value}"{" selected" if value == status else ""}>{value}</option>'
+            for value in self.store.STATUSES
+        )
+        department_options = "".join(
+            f'<option value="{pk}"{" selected" if pk == department_id else ""}>{escape(name)}</option>'
+            for pk, name in self.store.list_departments()
+        )
+        
+        rows = []
+        for employee in employees:
+            rows.append(
+                "<tr>"
+                f"<td>{escape(employee['name'])}</td>"
+                f"<td>{escape(employee['email'])}</td>"
+                f"<td>{escape(employee['department'])}</td>"
+                f"<td>${employee['salary']:.2f}</td>"
+                f"<td>{employee['status']}</td>"
+                "<td>"
+                f'<a href="/employees/{employee["id"]}/update/" class="btn btn-sm btn-warning">Edit</a> '
+                f'<a href="/employees/{employee["id"]}/delete/" class="btn btn-sm btn-danger">Delete</a>'
+                "</td>"
+                "</tr>\n"
+            )
+        if not rows:
+            rows.append('<tr><td colspan="6" class="text-center">No employees found</td></tr>\n')
+        
+        export_query = urlencode({key: value for key, value in request.query.items() if value})
+        content = f"""<div class="d-flex justify-content-between mb-3">
+<h2>Employees</h2>
+<a href="/employees/create/" class="btn btn-primary">Add New Employee</a>
+</div>
+<form method="get" class="row g-2 mb-3">
+<div class="col"><input type="text" name="q" class="form-control" placeholder="Search" value="{escape(query)}"></div>
+<div class="col"><select name="status" class="form-select"><option value="">All Statuses</option>{status_options}</select></div>
+<div class="col"><select name="department" class="form-select"><option value="">All Departments</option>{department_options}</select></div>
+<div class="col"><button type="submit" class="btn btn-secondary">Filter</button></div>
+</form>
+<a href="/employees/export/{"?" + export_query if export_query else ""}" class="btn btn-success mb-3">Export to CSV</a>
+<table class="table table-striped">
+<thead><tr><th>Name</th><th>Email</th><th>Department</th><th>Salary</th><th>Status</th><th>Actions</th></tr></thead>
+<tbody>
+{"".join(rows)}</tbody>
+</table>
+"""
+        return self.render(request, content)
+    
+    def employee_export(self, request):
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerow(["Name", "Email", "Department", "Salary", "Status"])
+        for employee in self.store.list_employees(*self._employee_filters(request)):
+            writer.writerow([employee["name"], employee["email"], employee["department"],
+                             f"{employee['salary']:.2f}", employee["status"]])
+        return Response(output.getvalue(), content_type="text/csv",
+                        headers=[("Content-Disposition", 'attachment; filename="employees.csv"')])
+    
+    def employee_form(self, request, pk=None):
+        employee = None
+        if pk is not None:
+            employee = self.store.get_employee(pk)
+            if employee is None:
+                return Response("<h1>Not Found</h1>", "404 Not Found")
+        
+        errors = {}
+        values = {}
+        if employee:
+            values = {
+                "name": employee["name"],
+                "email": employee["email"],
+                "department": str(employee["department_id"]),
+                "salary": f"{employee['salary']:.2f}",
+                "status": employee["status"],
+            }
+        
+        if request.method == "POST":
+            values = request.form
+            try:
+                self.store.save_employee(values, pk)
+                self.flash(request, "Employee updated successfully." if pk else "Employee created successfully.")
+                return redirect("/employees/")
+            except ValidationError as error:
+                errors = error.errors
+        
+        status = values.get("status") or "Active"
+        department_options = '<option value="">---------</option>' + "".join(
+            f'<option value="{department_id}"{" selected" if str(department_id) == values.get("department") else ""}>'
+            f'{escape(name)}</option>'
+            for department_id, name in self.store.list_departments()
+        )
+        status_radios = "".join(
+            f'<div class="form-check"><input type="radio" name="status" value="{value}" '
+            f'id="id_status_{value.lower()}" class="form-check-input"{" checked" if value == status else ""}>'
+            f'<label for="id_status_{value.lower()}" class="form-check-label">{value}</label></div>'
+            for value in self.store.STATUSES
+        )
+        
+        fields = (
+            self.field("name", f'<input type="text" name="name" id="id_name" class="form-control" '
+                               f'maxlength="100" value="{escape(values.get("name", ""))}">', errors, "Name")
+            + self.field("email", f'<input type="email" name="email" id="id_email" class="form-control" '
+                                  f'value="{escape(values.get("email", ""))}">', errors, "Email")
+            + self.field("department", f'<select name="department" id="id_department" class="form-select">'
+                                       f'{department_options}</select>', errors, "Department")
+            + self.field("salary", f'<input type="number" step="0.01" name="salary" id="id_salary" '
+                                   f'class="form-control" value="{escape(values.get("salary", ""))}">',
+                         errors, "Salary")
+            + f'<div class="mb-3"><label class="form-label">Status</label>{status_radios}</div>\n'
+        )
+        
+        title = "Edit Employee" if pk else "Add New Employee"
+        content = f"""<h2>{title}</h2>
+<form method="post" novalidate>
+{self.csrf_field(request)}
+{fields}<button type="submit" class="btn btn-primary">Save</button>
+<a href="/employees/" class="btn btn-secondary">Cancel</a>
+</form>
+"""
+        return self.render(request, content)
+    
+    def employee_delete(self, request, pk):
+        employee = self.store.get_employee(pk)
+        if employee is None:
+            return Response("<h1>Not Found</h1>", "404 Not Found")
+        
+        if request.method == "POST":
+            self.store.delete_employee(pk)
+            self.flash(request, "Employee deleted successfully.")
+            return redirect("/employees/")
+        
+        content = f"""<h2>Delete Employee</h2>
+<p>Are you sure you want to delete <strong>{escape(employee['name'])}</strong>?</p>
+<form method="post">
+{self.csrf_field(request)}
+<button type="submit" class="btn btn-danger">Confirm</button>
+<a href="/employees/" class="btn btn-secondary">Cancel</a>
+</form>
+"""
+        return self.render(request, content)
+    
+    def department_list(self, request):
+        rows = [
+            "<tr>"
+            f"<td>{escape(name)}</td>"
+            "<td>"
+            f'<a href="/departments/{pk}/update/" class="btn btn-sm btn-warning">Edit</a> '
+            f'<a href="/departments/{pk}/delete/" class="btn btn-sm btn-danger">Delete</a>'
+            "</td>"
+            "</tr>\n"
+            for pk, name in self.store.list_departments()
+        ]
+        if not rows:
+            rows.append('<tr><td colspan="2" class="text-center">No departments found</td></tr>\n')
+        
+        content = f"""<div class="d-flex justify-content-between mb-3">
+<h2>Departments</h2>
+<a href="/departments/create/" class="btn btn-primary">Add New Department</a>
+</div>
+<table class="table table-striped">
+<thead><tr><th>Name</th><th>Actions</th></tr></thead>
+<tbody>
+{"".join(rows)}</tbody>
+</table>
+"""
+        return self.render(request, content)
+    
+    def department_form(self, request, pk=None):
+        name = ""
+        if pk is not None:
+            name = self.store.get_department(pk)
+            if name is None:
+                return Response("<h1>Not Found</h1>", "404 Not Found")
+        
+        errors = {}
+        if request.method == "POST":
+            name = request.form.get("name", "")
+            try:
+                self.store.create_department(name, pk)
+                self.flash(request, "Department updated successfully." if pk else "Department created successfully.")
+                return redirect("/departments/")
+            except ValidationError as error:
+                errors = error.errors
+        
+        title = "Edit Department" if pk else "Add New Department"
+        name_field = self.field("name", f'<input type="text" name="name" id="id_name" class="form-control" '
+                                        f'maxlength="100" value="{escape(name)}">', errors, "Name")
+        content = f"""<h2>{title}</h2>
+<form method="post" novalidate>
+{self.csrf_field(request)}
+{name_field}<button type="submit" class="btn btn-primary">Save</button>
+<a href="/departments/" class="btn btn-secondary">Cancel</a>
+</form>
+"""
+        return self.render(request, content)
+    
+    def department_delete(self, request, pk):
+        name = self.store.get_department(pk)
+        if name is None:
+            return Response("<h1>Not Found</h1>", "404 Not Found")
+        
+        if request.method == "POST":
+            self.store.delete_department(pk)
+            self.flash(request, "Department deleted successfully.")
+            return redirect("/departments/")
+        
+        content = f"""<h2>Delete Department</h2>
+<p>Are you sure you want to delete <strong>{escape(name)}</strong>?</p>
+<form method="post">
+{self.csrf_field(request)}
+<button type="submit" class="btn btn-danger">Confirm</button>
+<a href="/departments/" class="btn btn-secondary">Cancel</a>
+</form>
+"""
+        return self.render(request, content)
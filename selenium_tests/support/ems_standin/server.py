@@ -0,0 +1,74 @@
+import socketserver
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+from selenium_tests.test_data import TestDataLoader
+from .app import EmsApp
+from .store import EmsStore
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+class StandinServer:
+    """
+    Runs the stand-in EMS application on a free local port in a background thread.
+    
+    The store starts with the departments from departments.csv so that
+    randomly generated employees always reference an existing department.
+    """
+    
+    def __init__(self, host="127.0.0.1", port=0, store=None):
+        """
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind, 0 picks a free port
+            store (EmsStore, optional): Data store, defaults to one seeded from departments.csv
+        """
+        if store is None:
+            store = EmsStore(TestDataLoader.get_department_names())
+        self.store = store
+        self.app = EmsApp(store)
+        self._server = make_server(host, port, self.app,
+                                   server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+        self._thread = None
+        self._snapshot = None
+    
+    @property
+    def url(self):
+        """
+        Returns:
+            str: Base URL of the running server, without trailing slash
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        """
+        Start serving requests in a daemon thread.
+        
+        Returns:
+            StandinServer: self
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="ems-standin", daemon=True)
+        self._thread.start()
+        return self
+    
+    def snapshot(self):
+        """Remember the current data as the state restore() returns to."""
+        self._snapshot = self.store.snapshot()
+    
+    def restore(self):
+        """Return the data to the last snapshot."""
+        if self._snapshot is not None:
+            self.store.restore(self._snapshot)
+    
+    def stop(self):
+        """Stop the server and release its port."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
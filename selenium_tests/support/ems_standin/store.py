@@ -0,0 +1,239 @@
+import copy
+import math
+import re
+import threading
+
+class ValidationError(Exception):
+    """
+    Raised when submitted data fails validation.
+    
+    Attributes:
+        errors (dict): Error message by field name
+    """
+    
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+class EmsStore:
+    """
+    Thread-safe in-memory data store for employees and departments.
+    
+    Applies the same validation rules as the Django models and forms:
+    required fields, email format, unique email and department name and
+    non-negative salary.
+    """
+    
+    EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    STATUSES = ("Active", "Inactive")
+    
+    def __init__(self, department_names=()):
+        """
+        Args:
+            department_names (iterable): Departments to create up front
+        """
+        self._lock = threading.RLock()
+        self.departments = {}
+        self.employees = {}
+        self._next_id = 1
+        for name in department_names:
+            self.create_department(name)
+    
+    def snapshot(self):
+        """
+        Capture the current data.
+        
+        Returns:
+            tuple: Opaque snapshot to pass to restore()
+        """
+        with self._lock:
+            return copy.deepcopy((self.departments, self.employees, self._next_id))
+    
+    def restore(self, snapshot):
+        """
+        Replace the current data with a snapshot.
+        
+        Args:
+            snapshot (tuple): Snapshot returned by snapshot()
+        """
+        with self._lock:
+            self.departments, self.employees, self._next_id = copy.deepcopy(snapshot)
+    
+    def _new_id(self):
+        new_id = self._next_id
+        self._next_id += 1
+        return new_id
+    
+    # Departments
+    
+    def list_departments(self):
+        """
+        List all departments.
+        
+        Returns:
+            list: (id, name) tuples sorted by name
+        """
+        with self._lock:
+            return sorted(self.departments.items(), key=lambda item: item[1].lower())
+    
+    def get_department(self, department_id):
+        """Return the department name for an id, or None."""
+        with self._lock:
+            return self.departments.get(department_id)
+    
+    def find_department_id(self, name):
+        """Return the id of the department with the given name, or None."""
+        with self._lock:
+            return next((department_id for department_id, department_name in self.departments.items()
+                         if department_name == name), None)
+    
+    def create_department(self, name, department_id=None):
+        """
+        Create or update a department.
+        
+        Args:
+            name (str): Department name
+            department_id (int, optional): Department to update
+            
+        Returns:
+            int: Department id
+            
+        Raises:
+            ValidationError: If the name is missing or already used
+        """
+        name = (name or "").strip()
+        with self._lock:
+            if not name:
+                raise ValidationError({"name": "This field is required."})
+            existing = self.find_department_id(name)
+            if existing is not None and existing != department_id:
+                raise ValidationError({"name": "Department with this Name already exists."})
+            if department_id is None:
+                department_id = self._new_id()
+            self.departments[department_id] = name
+            return department_id
+    
+    def delete_department(self, department_id):
+        """Delete a department and the employees assigned to it."""
+        with self._lock:
+            self.departments.pop(department_id, None)
+            for employee_id in [employee_id for employee_id, employee in self.employees.items()
+                                if employee["department_id"] == department_id]:
+                del self.employees[employee_id]
+    
+    # Employees
+    
+    def list_employees(self, query="", status="", department_id=None):
+        """
+        List employees, optionally filtered.
+        
+        Args:
+            query (str): Case-insensitive text matched against name, email and department
+            status (str): 'Active' or 'Inactive' to filter by status
+            department_id (int, optional): Department to filter by
+            
+        Returns:
+            list: Employee dictionaries sorted by name
+        """
+        query = query.lower()
+        with self._lock:
+            result = []
+            for employee in self.employees.values():
+                department = self.departments.get(employee["department_id"], "")
+                if query and query not in employee["name"].lower() \
+                        and query not in employee["email"].lower() \
+                        and query not in department.lower():
+                    continue
+                if status and employee["status"] != status:
+                    continue
+                if department_id is not None and employee["department_id"] != department_id:
+                    continue
+                result.append(dict(employee, department=department))
+            return sorted(result, key=lambda employee: (employee["name"].lower(), employee["id"]))
+    
+    def get_employee(self, employee_id):
+        """Return a copy of the employee with its department name, or None."""
+        with self._lock:
+            employee = self.employees.get(employee_id)
+            if employee is None:
+                return None
+            return dict(employee, department=self.departments.get(employee["department_id"], ""))
+    
+    def save_employee(self, data, employee_id=None):
+        """
+        Validate and create or update an employee.
+        
+        Args:
+            data (dict): Form data with keys name, email, department (id), salary, status
+            employee_id (int, optional): Employee to update
+            
+        Returns:
+            int: Employee id
+            
+        Raises:
+            ValidationError: If any field is invalid
+        """
+        errors = {}
+        name = (data.get("name") or "").strip()
+        email = (data.get("email") or "").strip()
+        status = data.get("status") or "Active"
+        
+        if not name:
+            errors["name"] = "This field is required."
+        
+        if not email:
+            errors["email"] = "This field is required."
+        elif not self.EMAIL_PATTERN.match(email):
+            errors["email"] = "Enter a valid email address."
+        
+        try:
+            department_id = int(data.get("department") or 0)
+        except ValueError:
+            department_id = 0
+        
+        salary_text = (data.get("salary") or "").strip()
+        salary = None
+        if not salary_text:
+            errors["salary"] = "This field is required."
+        else:
+            try:
+                salary = round(float(salary_text), 2)
+                if not math.isfinite(salary):
+                    errors["salary"] = "Enter a number."
+                elif salary < 0:
+                    errors["salary"] = "Salary cannot be negative."
+            except ValueError:
+                errors["salary"] = "Enter a number."
+        
+        if status not in self.STATUSES:
+            errors["status"] = f"Select a valid choice. {status} is not one of the available choices."
+        
+        with self._lock:
+            if department_id not in self.departments:
+                errors["department"] = "This field is required." if not department_id else \
+                    "Select a valid choice. That choice is not one of the available choices."
+            
+            if "email" not in errors and any(employee["email"].lower() == email.lower()
+                                             for other_id, employee in self.employees.items()
+                                             if other_id != employee_id):
+                errors["email"] = "Employee with this Email already exists."
+            
+            if errors:
+                raise ValidationError(errors)
+            
+            if employee_id is None:
+                employee_id = self._new_id()
+            self.employees[employee_id] = {
+                "id": employee_id,
+                "name": name,
+                "email": email,
+                "department_id": department_id,
+                "salary": salary,
+                "status": status,
+            }
+            return employee_id
+    
+    def delete_employee(self, employee_id):
+        """Delete an employee."""
+        with self._lock:
+            self.employees.pop(employee_id, None)
@@ -0,0 +1,482 @@
+import time
+from urllib.parse import urldefrag, urlencode, urljoin
+import requests
+from lxml import html as lxml_html
+from cssselect import HTMLTranslator
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium_tests.page_objects.base_page import BasePage
+from selenium_tests.page_objects.locators import xpath_literal
+from .driver_pool import DriverPool
+
+BLANK_PAGE = "<html><head></head><body></body></html>"
+
+# Elements whose content a browser never renders
+HIDDEN_TAGS = {"head", "script", "style", "title", "meta", "link", "template", "noscript"}
+
+# Elements that start a new line in rendered text
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt", "fieldset", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li", "main", "nav", "ol",
+    "option", "p", "pre", "section", "table", "tbody", "thead", "tfoot", "tr", "ul",
+}
+
+# Keys that submit the form when typed into a field
+SUBMIT_KEYS = (Keys.ENTER, Keys.RETURN)
+
+# Selenium encodes special keys as private use characters from U+E000
+SPECIAL_KEYS_START = "\ue000"
+
+_css = HTMLTranslator()
+
+def _is_hidden(node):
+    if node.tag in HIDDEN_TAGS or node.get("hidden") is not None:
+        return True
+    if node.tag == "input" and (node.get("type") or "").lower() == "hidden":
+        return True
+    style = (node.get("style") or "").replace(" ", "").lower()
+    return "display:none" in style or "visibility:hidden" in style
+
+def _rendered_text(node):
+    parts = []
+    
+    def walk(element):
+        if not isinstance(element.tag, str) or _is_hidden(element):
+            return
+        if element.tag in BLOCK_TAGS:
+            parts.append("\n")
+        elif element.tag in ("td", "th"):
+            parts.append(" ")
+        parts.append(element.text or "")
+        for child in element:
+            walk(child)
+            parts.append(child.tail or "")
+        if element.tag in BLOCK_TAGS:
+            parts.append("\n")
+    
+    walk(node)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+class _SwitchTo:
+    """The single window of an HttpDriver."""
+    
+    def window(self, handle):
+        if handle != HttpDriver.WINDOW_HANDLE:
+            raise WebDriverException(f"No such window: {handle}")
+
+class HttpElement:
+    """
+    An element of the page an HttpDriver has loaded.
+    
+    Form state (values, checked radios, selected options) is kept in the
+    element's attributes, so reads and form submission see what was typed.
+    """
+    
+    def __init__(self, driver, node, page):
+        self._driver = driver
+        self._node = node
+        self._page = page
+    
+    def __eq__(self, other):
+        return isinstance(other, HttpElement) and other._node is self._node
+    
+    def __hash__(self):
+        return id(self._node)
+    
+    @property
+    def node(self):
+        """
+        Returns:
+            HtmlElement: lxml element, after checking it is still on the current page
+            
+        Raises:
+            StaleElementReferenceException: If the driver has navigated since it was found
+        """
+        if self._page is not self._driver._page:
+            raise StaleElementReferenceException(f"<{self._node.tag}> is no longer attached to the page")
+        return self._node
+    
+    @property
+    def tag_name(self):
+        return self.node.tag
+    
+    @property
+    def text(self):
+        return _rendered_text(self.node)
+    
+    @property
+    def id(self):
+        return str(id(self._node))
+    
+    def find_element(self, by=By.ID, value=None):
+        return self._driver._first(self._driver._query(self.node, by, value, relative=True), by, value)
+    
+    def find_elements(self, by=By.ID, value=None):
+        return [HttpElement(self._driver, node, self._page)
+                for node in self._driver._query(self.node, by, value, relative=True)]
+    
+    def get_dom_attribute(self, name):
+        return self.node.get(name)
+    
+    def get_attribute(self, name):
+        node = self.node
+        if name == "value":
+            return self._value()
+        if name in ("checked", "selected", "disabled", "multiple", "readonly", "required"):
+            return "true" if node.get(name) is not None else None
+        if name in ("href", "src", "action") and node.get(name) is not None:
+            return urljoin(self._driver.current_url, node.get(name))
+        if name == "outerHTML":
+            return lxml_html.tostring(node, encoding="unicode", with_tail=False)
+        if name in ("textContent", "innerText"):
+            return node.text_content() if name == "textContent" else self.text
+        return node.get(name)
+    
+    def get_property(self, name):
+        return self.get_attribute(name)
+    
+    def value_of_css_property(self, name):
+        return "none" if name == "display" and _is_hidden(self.node) else ""
+    
+    def is_displayed(self):
+        node = self.node
+        while node is not None:
+            if _is_hidden(node):
+                return False
+            node = node.getparent()
+        return True
+    
+    def is_enabled(self):
+        node = self.node
+        while node is not None:
+            if node.get("disabled") is not None and node.tag in ("input", "select", "textarea", "button",
+                                                                    "option", "optgroup", "fieldset"):
+                return False
+            node = node.getparent()
+        return True
+    
+    def is_selected(self):
+        node = self.node
+        return node.get("checked") is not None or node.get("selected") is not None
+    
+    def clear(self):
+        self._set_value("")
+    
+    def send_keys(self, *value):
+        text = "".join(str(part) for part in value)
+        submit = any(key in text for key in SUBMIT_KEYS)
+        self._set_value((self._value() or "") + "".join(char for char in text if char < SPECIAL_KEYS_START))
+        if submit:
+            self.submit()
+    
+    def submit(self):
+        form = self._form()
+        if form is None:
+            raise WebDriverException("Element is not in a form")
+        self._driver._submit(form, None)
+    
+    def click(self):
+        node = self.node
+        tag = node.tag
+        kind = (node.get("type") or "").lower()
+        if tag == "a" and node.get("href") is not None:
+            href = node.get("href")
+            if not href.startswith(("#", "javascript:")):
+                self._driver.get(urljoin(self._driver.current_url, href))
+        elif (tag == "button" and kind in ("", "submit")) or (tag == "input" and kind in ("submit", "image")):
+            form = self._form()
+            if form is not None:
+                self._driver._submit(form, node)
+        elif tag == "input" and kind == "checkbox":
+            self._set_flag(node, "checked", node.get("checked") is None)
+        elif tag == "input" and kind == "radio":
+            form = self._form()
+            scope = form if form is not None else node.getroottree().getroot()
+            for radio in scope.iter("input"):
+                if radio.get("name") == node.get("name") and (radio.get("type") or "").lower() == "radio":
+                    self._set_flag(radio, "checked", False)
+            self._set_flag(node, "checked", True)
+        elif tag == "option":
+            select = next(node.iterancestors("select"), None)
+            if select is not None and select.get("multiple") is None:
+                for option in select.iter("option"):
+                    self._set_flag(option, "selected", False)
+                self._set_flag(node, "selected", True)
+            else:
+                self._set_flag(node, "selected", node.get("selected") is None)
+        elif tag == "label" and node.get("for"):
+            target = node.getroottree().getroot().get_element_by_id(node.get("for"), None)
+            if target is not None:
+                HttpElement(self._driver, target, self._page).click()
+    
+    def _form(self):
+        node = self.node
+        if node.get("form"):
+            return node.getroottree().getroot().get_element_by_id(node.get("form"), None)
+        return next(node.iterancestors("form"), None)
+    
+    def _value(self):
+        node = self.node
+        if node.tag == "textarea":
+            return node.text or ""
+        if node.tag == "select":
+            options = list(node.iter("option"))
+            selected = [option for option in options if option.get("selected") is not None] or options[:1]
+            return (selected[0].get("value", selected[0].text_content().strip())) if selected else ""
+        if node.tag == "option":
+            return node.get("value", node.text_content().strip())
+        if node.tag in ("input", "button"):
+            return node.get("value", "")
+        return None
+    
+    def _set_value(self, text):
+        node = self.node
+        if node.tag == "textarea":
+            node.text = text
+        elif node.tag == "input":
+            node.set("value", text)
+    
+    @staticmethod
+    def _set_flag(node, name, on):
+        if on:
+            node.set(name, name)
+        elif name in node.attrib:
+            del node.attrib[name]
+
+class HttpDriver:
+    """
+    Browserless driver for server-rendered pages.
+    
+    Implements the part of the WebDriver API that BasePage and the page
+    objects use on top of requests and lxml: navigation and history, element
+    lookup by every locator strategy, text and attributes, typing, selects,
+    radios and checkboxes, and following links and submitting forms. The
+    BasePage scripts for table reads and the js fill strategy are run in
+    Python; any other JavaScript raises JavascriptException. Each HTTP
+    request counts as one command for the step recorder.
+    """
+    
+    WINDOW_HANDLE = "http-driver"
+    name = "http"
+    
+    def __init__(self, base_url, timeout=30):
+        """
+        Args:
+            base_url (str): Base URL of the application under test
+            timeout (float): HTTP request timeout in seconds
+        """
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.step_recorder = None
+        # Responses of links and forms that returned a file instead of a page
+        self.downloads = []
+        self.switch_to = _SwitchTo()
+        self._history = []
+        self._position = -1
+        self._page = None
+        self._url = "about:blank"
+        self._show("about:blank", BLANK_PAGE)
+        self._scripts = {
+            BasePage.READ_TABLE_SCRIPT: self._read_table,
+            BasePage.FILL_FIELDS_SCRIPT: self._fill_fields,
+            BasePage.FOCUS_FIELD_SCRIPT: lambda element: element.clear(),
+            # Pages are parsed completely before anything can look at them
+            BasePage.READY_STATE_SCRIPT: lambda: "complete",
+            DriverPool.CLEAR_STORAGE_SCRIPT: lambda: None,
+        }
+    
+    @property
+    def current_url(self):
+        return self._url
+    
+    @property
+    def title(self):
+        titles = self._page.xpath("//title")
+        return titles[0].text_content().strip() if titles else ""
+    
+    @property
+    def page_source(self):
+        return lxml_html.tostring(self._page, encoding="unicode")
+    
+    @property
+    def window_handles(self):
+        return [self.WINDOW_HANDLE]
+    
+    @property
+    def current_window_handle(self):
+        return self.WINDOW_HANDLE
+    
+    def get(self, url):
+        """
+        Load a page.
+        
+        Args:
+            url (str): Absolute URL, or about:blank
+        """
+        if url == "about:blank":
+            self._visit(url, BLANK_PAGE)
+            return
+        self._load("GET", url)
+    
+    def back(self):
+        if self._position > 0:
+            self._position -= 1
+            self._show(*self._history[self._position])
+    
+    def forward(self):
+        if self._position < len(self._history) - 1:
+            self._position += 1
+            self._show(*self._history[self._position])
+    
+    def refresh(self):
+        if self._url != "about:blank":
+            response = self._request("GET", self._url)
+            self._history[self._position] = (response.url, response.text)
+            self._show(response.url, response.text)
+    
+    def find_element(self, by=By.ID, value=None):
+        return self._first(self._query(self._page, by, value), by, value)
+    
+    def find_elements(self, by=By.ID, value=None):
+        return [HttpElement(self, node, self._page) for node in self._query(self._page, by, value)]
+    
+    def execute_script(self, script, *args):
+        """
+        Run one of the known BasePage/DriverPool scripts in Python.
+        
+        Raises:
+            JavascriptException: For any other script
+        """
+        handler = self._scripts.get(script)
+        if handler is not None:
+            return handler(*args)
+        if "scrollIntoView" in script:
+            return None
+        raise JavascriptException("HttpDriver cannot run JavaScript; run this test with --driver chrome")
+    
+    def execute_async_script(self, script, *args):
+        raise JavascriptException("HttpDriver cannot run JavaScript")
+    
+    def set_script_timeout(self, time_to_wait):
+        pass
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        raise WebDriverException(f"HttpDriver has no DevTools ({cmd}); use --fill-strategy keys or js")
+    
+    def delete_all_cookies(self):
+        self.session.cookies.clear()
+    
+    def close(self):
+        self._visit("about:blank", BLANK_PAGE)
+    
+    def quit(self):
+        self.session.close()
+    
+    def _request(self, method, url, data=None):
+        recorder = self.step_recorder
+        start = time.perf_counter()
+        try:
+            return self.session.request(method, url, data=data, timeout=self.timeout)
+        except requests.RequestException as error:
+            raise WebDriverException(f"{method} {url} failed: {error}")
+        finally:
+            if recorder is not None:
+                recorder.add_command(method, time.perf_counter() - start)
+    
+    def _load(self, method, url, data=None):
+        # Redirects (e.g. after a successful POST) are followed like a browser does
+        response = self._request(method, url, data)
+        if self._is_download(response):
+            # A browser saves the file and stays on the page
+            self.downloads.append(response)
+            return
+        self._visit(response.url, response.text)
+    
+    @staticmethod
+    def _is_download(response):
+        if response.headers.get("Content-Disposition", "").lower().startswith("attachment"):
+            return True
+        content_type = response.headers.get("Content-Type", "text/html").split(";")[0].strip().lower()
+        return content_type not in ("text/html", "application/xhtml+xml", "text/plain")
+    
+    def _visit(self, url, source):
+        del self._history[self._position + 1:]
+        self._history.append((url, source))
+        self._position = len(self._history) - 1
+        self._show(url, source)
+    
+    def _show(self, url, source):
+        # A new tree every time, so elements found on earlier pages go stale
+        self._url = url
+        self._page = lxml_html.document_fromstring(source or BLANK_PAGE)
+    
+    def _submit(self, form, submitter):
+        action = urljoin(self._url, form.get("action") or self._url)
+        values = list(form.form_values())
+        if submitter is not None and submitter.get("name"):
+            values.append((submitter.get("name"), submitter.get("value", "")))
+        if (form.get("method") or "get").lower() == "post":
+            self._load("POST", action, values)
+        else:
+            self._load("GET", f"{urldefrag(action)[0].split('?')[0]}?{urlencode(values)}")
+    
+    def _query(self, root, by, value, relative=False):
+        # Document-level queries are absolute so that <html> itself can match
+        axis = "descendant::" if relative else "//"
+        if by == By.XPATH:
+            expression = value
+        elif by == By.CSS_SELECTOR:
+            expression = _css.css_to_xpath(value, prefix="descendant::" if relative else "descendant-or-self::")
+        elif by == By.ID:
+            expression = f"{axis}*[@id={xpath_literal(value)}]"
+        elif by == By.NAME:
+            expression = f"{axis}*[@name={xpath_literal(value)}]"
+        elif by == By.TAG_NAME:
+            expression = f"{axis}{value}"
+        elif by == By.CLASS_NAME:
+            expression = f"{axis}*[contains(concat(' ', normalize-space(@class), ' '), ' {value} ')]"
+        elif by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+            links = root.iter("a")
+            if by == By.LINK_TEXT:
+                return [link for link in links if _rendered_text(link) == value]
+            return [link for link in links if value in _rendered_text(link)]
+        else:
+            raise WebDriverException(f"Unsupported locator strategy: {by}")
+        return [node for node in root.xpath(expression) if isinstance(getattr(node, "tag", None), str)]
+    
+    def _first(self, nodes, by, value):
+        if not nodes:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return HttpElement(self, nodes[0], self._page)
+    
+    def _read_table(self, by, value):
+        rows = self._query(self._page, by, value)
+        if not rows:
+            return None
+        return [[_rendered_text(cell) for cell in row if cell.tag in ("td", "th")] for row in rows]
+    
+    def _fill_fields(self, fields):
+        missing = []
+        for by, value, kind, text in fields:
+            nodes = self._query(self._page, by, value)
+            if not nodes:
+                missing.append(value)
+                continue
+            element = HttpElement(self, nodes[0], self._page)
+            if kind == "select":
+                options = [option for option in nodes[0].iter("option") if _rendered_text(option) == text]
+                if not options:
+                    missing.append(f"{value} option {text}")
+                    continue
+                HttpElement(self, options[0], self._page).click()
+            elif kind == "check":
+                element.click()
+            else:
+                element.clear()
+                element.send_keys(text)
+        return missing
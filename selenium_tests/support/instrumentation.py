@@ -0,0 +1,312 @@
+import html
+import json
+import time
+from contextlib import contextmanager
+import pytest
+
+class StepRecorder:
+    """
+    Collects step timings and WebDriver command counts for one test.
+    
+    Page object steps nest (a page method calls BasePage actions), so every
+    command and wait is added to all steps that are open at the time; each
+    step's numbers are therefore inclusive of its children.
+    """
+    
+    def __init__(self):
+        self.steps = []
+        self.commands = 0
+        self.command_time = 0.0
+        self.wait_time = 0.0
+        self._open = []
+    
+    @contextmanager
+    def step(self, name):
+        """
+        Record a step for the duration of the block.
+        
+        Args:
+            name (str): Step name, e.g. 'EmployeeListPage.read_table'
+        """
+        record = {"name": name, "depth": len(self._open), "wall": 0.0, "wait": 0.0,
+                  "commands": 0, "command_time": 0.0}
+        self.steps.append(record)
+        self._open.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall"] = time.perf_counter() - start
+            self._open.pop()
+    
+    def add_command(self, command, seconds):
+        """
+        Count one WebDriver command.
+        
+        Args:
+            command (str): WebDriver command name
+            seconds (float): Round trip time
+        """
+        self.commands += 1
+        self.command_time += seconds
+        for record in self._open:
+            record["commands"] += 1
+            record["command_time"] += seconds
+    
+    def add_wait(self, seconds):
+        """
+        Add time spent in an explicit wait.
+        
+        Args:
+            seconds (float): Time spent in WebDriverWait.until
+        """
+        self.wait_time += seconds
+        for record in self._open:
+            record["wait"] += seconds
+    
+    def to_dict(self):
+        """
+        Returns:
+            dict: Totals and steps with times rounded to milliseconds
+        """
+        return {
+            "commands": self.commands,
+            "command_time": round(self.command_time, 4),
+            "wait_time": round(self.wait_time, 4),
+            "steps": [dict(record, wall=round(record["wall"], 4), wait=round(record["wait"], 4),
+                           command_time=round(record["command_time"], 4))
+                      for record in self.steps],
+        }
+
+_current_recorder = None
+
+def get_recorder():
+    """
+    Get the step recorder of the running test.
+    
+    Returns:
+        StepRecorder: Recorder set by the driver fixture, or None outside a test
+    """
+    return _current_recorder
+
+def set_recorder(recorder):
+    """
+    Set the step recorder of the running test.
+    
+    Args:
+        recorder (StepRecorder): Recorder of the test's driver, or None
+    """
+    global _current_recorder
+    _current_recorder = recorder
+
+class CommandBudgetExceeded(AssertionError):
+    """Raised when a block issues more WebDriver commands or takes longer than its budget."""
+
+class CommandBudget:
+    """
+    Context manager asserting an upper bound on WebDriver round trips.
+    
+    Example:
+        with command_budget(5):
+            list_page.get_employee_count()
+    
+    After the block, commands and elapsed hold what it actually used.
+    """
+    
+    def __init__(self, commands=None, seconds=None, recorder=None, label=None):
+        """
+        Args:
+            commands (int, optional): Maximum number of WebDriver commands
+            seconds (float, optional): Maximum wall time in seconds
+            recorder (StepRecorder, optional): Recorder to count with, defaults
+                                               to the running test's
+            label (str, optional): Name used in the failure message
+        """
+        self.max_commands = commands
+        self.max_seconds = seconds
+        self.recorder = recorder
+        self.label = label or "command_budget"
+        self.commands = 0
+        self.elapsed = 0.0
+        self._start_commands = 0
+        self._start = 0.0
+    
+    def start(self):
+        """Start counting."""
+        if self.recorder is None:
+            self.recorder = get_recorder()
+        if self.recorder is None:
+            raise RuntimeError("command_budget needs a driver from the driver fixture")
+        self._start_commands = self.recorder.commands
+        self._start = time.perf_counter()
+        return self
+    
+    def stop(self):
+        """
+        Stop counting and check the budget.
+        
+        Raises:
+            CommandBudgetExceeded: If the block went over budget
+        """
+        self.elapsed = time.perf_counter() - self._start
+        self.commands = self.recorder.commands - self._start_commands
+        
+        problems = []
+        if self.max_commands is not None and self.commands > self.max_commands:
+            problems.append(f"{self.commands} WebDriver commands (budget {self.max_commands})")
+        if self.max_seconds is not None and self.elapsed > self.max_seconds:
+            problems.append(f"{self.elapsed:.3f}s (budget {self.max_seconds}s)")
+        if problems:
+            raise CommandBudgetExceeded(f"{self.label} exceeded: {', '.join(problems)}")
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        # An error inside the block is the more useful failure
+        if exc_type is None:
+            self.stop()
+        return False
+
+def command_budget(commands=None, seconds=None):
+    """
+    Fail the test if the block issues more WebDriver commands or takes longer than allowed.
+    
+    Args:
+        commands (int, optional): Maximum number of WebDriver commands
+        seconds (float, optional): Maximum wall time in seconds
+        
+    Returns:
+        CommandBudget: Context manager for the block
+    """
+    return CommandBudget(commands, seconds)
+
+def instrument_driver(driver):
+    """
+    Route a driver's WebDriver commands through its step recorder.
+    
+    The driver gets a step_recorder attribute (None until a test sets one);
+    while it is set, every command is counted and timed.
+    
+    Args:
+        driver (WebDriver): Driver to instrument
+        
+    Returns:
+        WebDriver: The same driver
+    """
+    execute = driver.execute
+    
+    def recorded_execute(driver_command, params=None):
+        recorder = driver.step_recorder
+        if recorder is None:
+            return execute(driver_command, params)
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            recorder.add_command(driver_command, time.perf_counter() - start)
+    
+    driver.step_recorder = None
+    driver.execute = recorded_execute
+    return driver
+
+def summarize_steps(tests):
+    """
+    Aggregate step records of many tests by step name.
+    
+    Args:
+        tests (dict): StepRecorder.to_dict() results by test id
+        
+    Returns:
+        dict: count, wall, wait and commands totals by step name, slowest first
+    """
+    summary = {}
+    for timing in tests.values():
+        for record in timing["steps"]:
+            totals = summary.setdefault(record["name"], {"count": 0, "wall": 0.0, "wait": 0.0, "commands": 0})
+            totals["count"] += 1
+            totals["wall"] += record["wall"]
+            totals["wait"] += record["wait"]
+            totals["commands"] += record["commands"]
+    return dict(sorted(((name, dict(totals, wall=round(totals["wall"], 4), wait=round(totals["wait"], 4)))
+                        for name, totals in summary.items()),
+                       key=lambda item: item[1]["wall"], reverse=True))
+
+def steps_table(timing):
+    """
+    Render a test's steps as an HTML table for the pytest-html report.
+    
+    Args:
+        timing (dict): StepRecorder.to_dict() result
+        
+    Returns:
+        str: HTML fragment
+    """
+    rows = "".join(
+        f"<tr><td style='padding-left:{record['depth']}em'>{html.escape(record['name'])}</td>"
+        f"<td>{record['wall'] * 1000:.0f}</td><td>{record['wait'] * 1000:.0f}</td>"
+        f"<td>{record['commands']}</td></tr>"
+        for record in timing["steps"]
+    )
+    return (f"<p>{timing['commands']} WebDriver commands ({timing['command_time'] * 1000:.0f} ms), "
+            f"{timing['wait_time'] * 1000:.0f} ms waiting</p>"
+            "<table><tr><th>Step</th><th>Wall ms</th><th>Wait ms</th><th>Commands</th></tr>"
+            f"{rows}</table>")
+
+class StepTimingPlugin:
+    """
+    Attaches each test's step timings to its report and enforces
+    command_budget markers.
+    
+    The timings travel on the report (so pytest-xdist brings them back to
+    the controller), are added to the pytest-html report as an extra and,
+    with --step-report, are written to one JSON file for the whole run.
+    """
+    
+    def __init__(self, config):
+        self.config = config
+        self.report_path = config.getoption("step_report")
+        self.tests = {}
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        marker = item.get_closest_marker("command_budget")
+        recorder = getattr(item, "step_recorder", None)
+        if marker is None or recorder is None:
+            yield
+            return
+        
+        budget = CommandBudget(*marker.args, recorder=recorder, label=f"{item.name} command budget",
+                               **marker.kwargs).start()
+        outcome = yield
+        if outcome.excinfo is None:
+            try:
+                budget.stop()
+            except CommandBudgetExceeded as error:
+                outcome.force_exception(error)
+    
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        recorder = getattr(item, "step_recorder", None)
+        if report.when != "call" or recorder is None:
+            return
+        
+        report.step_timing = recorder.to_dict()
+        if self.config.pluginmanager.hasplugin("html"):
+            import pytest_html
+            extras = getattr(report, "extras", [])
+            extras.append(pytest_html.extras.html(steps_table(report.step_timing)))
+            report.extras = extras
+    
+    def pytest_runtest_logreport(self, report):
+        timing = getattr(report, "step_timing", None)
+        if timing is not None:
+            self.tests[report.nodeid] = timing
+    
+    def pytest_sessionfinish(self, session):
+        if self.report_path is None or hasattr(session.config, "workerinput"):
+            return
+        with open(self.report_path, 'w') as report_file:
+            json.dump({"summary": summarize_steps(self.tests), "tests": self.tests}, report_file, indent=2)
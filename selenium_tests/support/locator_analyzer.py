@@ -0,0 +1,201 @@
+"""
+Time every page object locator against live pages and report the slowest.
+
+Usage:
+    python -m selenium_tests.support.locator_analyzer --standin
+    python -m selenium_tests.support.locator_analyzer --ems-url http://127.0.0.1:8000 --top 10
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from selenium.webdriver.common.by import By
+from selenium_tests.page_objects import (
+    DepartmentDeletePage, DepartmentFormPage, DepartmentListPage, EmployeeDeletePage,
+    EmployeeFormPage, EmployeeListPage, HomePage,
+)
+from selenium_tests.page_objects.locators import LocatorTemplate
+from .driver_factory import DEFAULT_BASE_URL, create_chrome_driver
+
+# Runs one locator query `repeat` times inside the page and returns the mean
+# time in milliseconds, so the browser's matching cost is measured without
+# the WebDriver round trip.
+BROWSER_TIMING_SCRIPT = """
+const [by, value, repeat] = arguments;
+const queries = {
+    'xpath': () => document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength,
+    'css selector': () => document.querySelectorAll(value).length,
+    'id': () => document.getElementById(value) ? 1 : 0,
+    'name': () => document.getElementsByName(value).length,
+    'class name': () => document.getElementsByClassName(value).length,
+    'tag name': () => document.getElementsByTagName(value).length,
+};
+const query = queries[by];
+if (!query) {
+    return null;
+}
+const start = performance.now();
+for (let i = 0; i < repeat; i++) {
+    query();
+}
+return (performance.now() - start) / repeat;
+"""
+
+def _first_row_name(list_page):
+    table = list_page.read_table()
+    return next(iter(table)).name if len(table) else None
+
+def _open_employee_delete(driver):
+    list_page = EmployeeListPage(driver).open_employee_list()
+    name = _first_row_name(list_page)
+    return list_page.delete_employee(name) if name else None
+
+def _open_department_delete(driver):
+    list_page = DepartmentListPage(driver).open_department_list()
+    name = _first_row_name(list_page)
+    return list_page.delete_department(name) if name else None
+
+# Page object class and how to reach a loaded instance of it
+PAGES = [
+    (HomePage, lambda driver: HomePage(driver).open_home_page()),
+    (EmployeeListPage, lambda driver: EmployeeListPage(driver).open_employee_list()),
+    (EmployeeFormPage, lambda driver: EmployeeListPage(driver).open_employee_list().click_add_new_employee()),
+    (EmployeeDeletePage, _open_employee_delete),
+    (DepartmentListPage, lambda driver: DepartmentListPage(driver).open_department_list()),
+    (DepartmentFormPage, lambda driver: DepartmentListPage(driver).open_department_list().click_add_new_department()),
+    (DepartmentDeletePage, _open_department_delete),
+]
+
+def collect_locators(page_class, sample_value):
+    """
+    Collect the locators declared on a page object class.
+    
+    Args:
+        page_class (type): Page object class
+        sample_value (str): Value used to fill locator templates
+        
+    Returns:
+        list: (attribute name, locator tuple) pairs
+    """
+    locators = []
+    for attribute in dir(page_class):
+        if not attribute.isupper():
+            continue
+        value = getattr(page_class, attribute)
+        if isinstance(value, LocatorTemplate):
+            locators.append((attribute, value.format(sample_value)))
+        elif isinstance(value, tuple) and len(value) == 2 and value[0] in vars(By).values():
+            locators.append((attribute, value))
+    return locators
+
+def time_locator(driver, locator, repeat):
+    """
+    Time one locator on the loaded page.
+    
+    Args:
+        driver (WebDriver): Driver with the page loaded
+        locator (tuple): Locator tuple (by, value)
+        repeat (int): Number of measurements
+        
+    Returns:
+        dict: matches, browser_ms (in-page query time) and round_trip_ms (find_elements)
+    """
+    by, value = locator
+    browser_ms = driver.execute_script(BROWSER_TIMING_SCRIPT, by, value, repeat)
+    
+    round_trips = []
+    matches = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        matches = len(driver.find_elements(by, value))
+        round_trips.append((time.perf_counter() - start) * 1000)
+    
+    return {
+        "matches": matches,
+        "browser_ms": browser_ms,
+        "round_trip_ms": statistics.median(round_trips),
+    }
+
+def analyze(driver, repeat=20, sample_value="Sample"):
+    """
+    Time every locator of every reachable page.
+    
+    Args:
+        driver (WebDriver): Driver whose base_url points at the application
+        repeat (int): Measurements per locator
+        sample_value (str): Value used to fill locator templates when a page has no rows
+        
+    Returns:
+        list: Result dictionaries, slowest in-browser query first
+    """
+    results = []
+    for page_class, load_page in PAGES:
+        page = load_page(driver)
+        if page is None:
+            print(f"Skipping {page_class.__name__}: no data to open it with", file=sys.stderr)
+            continue
+        
+        row_value = sample_value
+        if hasattr(page, "read_table"):
+            row_value = _first_row_name(page) or sample_value
+        
+        for attribute, locator in collect_locators(page_class, row_value):
+            result = time_locator(driver, locator, repeat)
+            result.update(page=page_class.__name__, attribute=attribute, by=locator[0], value=locator[1])
+            results.append(result)
+    
+    return sorted(results, key=lambda result: result["browser_ms"] or 0, reverse=True)
+
+def format_report(results, top=None):
+    """
+    Format analysis results as a text table.
+    
+    Args:
+        results (list): Results from analyze()
+        top (int, optional): Number of rows to include
+        
+    Returns:
+        str: Report text
+    """
+    lines = [f"{'browser ms':>10}  {'trip ms':>8}  {'hits':>4}  {'locator':<45}  strategy / value"]
+    for result in results[:top]:
+        browser_ms = "n/a" if result["browser_ms"] is None else f"{result['browser_ms']:.4f}"
+        name = f"{result['page']}.{result['attribute']}"
+        lines.append(f"{browser_ms:>10}  {result['round_trip_ms']:>8.2f}  {result['matches']:>4}  "
+                     f"{name:<45}  {result['by']}: {result['value']}")
+    return "\n".join(lines)
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ems-url", default=DEFAULT_BASE_URL, help="Base URL of a running EMS")
+    parser.add_argument("--standin", action="store_true",
+                        help="Start the stand-in EMS with sample data instead of using --ems-url")
+    parser.add_argument("--chromedriver", default=None, help="Path to the chromedriver executable")
+    parser.add_argument("--repeat", type=int, default=20, help="Measurements per locator")
+    parser.add_argument("--top", type=int, default=None, help="Only report the N slowest locators")
+    args = parser.parse_args(argv)
+    
+    server = None
+    base_url = args.ems_url.rstrip("/")
+    if args.standin:
+        from .ems_standin import StandinServer
+        from .seeding import SeedingClient
+        server = StandinServer().start()
+        base_url = server.url
+        seeder = SeedingClient(base_url)
+        seeder.create_employees(50)
+        seeder.close()
+    
+    driver = create_chrome_driver(base_url=base_url, driver_path=args.chromedriver)
+    try:
+        print(format_report(analyze(driver, repeat=args.repeat), top=args.top))
+    finally:
+        driver.quit()
+        if server is not None:
+            server.stop()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+"""
+Merge the reports of several --shard runs into one.
+
+Usage:
+    python -m selenium_tests.support.merge_reports junit merged.xml shard-*.xml --durations-out durations.json
+    python -m selenium_tests.support.merge_reports json merged.json shard-*.json
+    python -m selenium_tests.support.merge_reports html merged.html shard-*.html
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+def check_shards(tests_by_shard, expected_tests=None):
+    """
+    Make sure the shards ran every test exactly once.
+    
+    Args:
+        tests_by_shard (list): (report path, test ids) per shard
+        expected_tests (int, optional): Number of tests in the whole suite
+        
+    Raises:
+        ValueError: If a test ran in more than one shard or the total does
+                    not match expected_tests
+    """
+    seen = {}
+    overlaps = []
+    for path, test_ids in tests_by_shard:
+        for test_id in set(test_ids):
+            if test_id in seen:
+                overlaps.append(f"{test_id} ({seen[test_id]}, {path})")
+            else:
+                seen[test_id] = path
+    if overlaps:
+        raise ValueError(f"{len(overlaps)} tests ran in more than one shard: " + "; ".join(overlaps[:5]))
+    if expected_tests is not None and len(seen) != expected_tests:
+        raise ValueError(f"Shards ran {len(seen)} tests, expected {expected_tests}")
+
+def merge_junit(input_paths, expected_tests=None):
+    """
+    Merge pytest JUnit XML files.
+    
+    Every shard's <testsuite> is kept (named after its file) under one
+    <testsuites> root that carries the totals.
+    
+    Args:
+        input_paths (list): JUnit XML files
+        expected_tests (int, optional): Number of tests in the whole suite
+        
+    Returns:
+        ElementTree: Merged report
+        
+    Raises:
+        ValueError: If the shards overlap or miss tests (see check_shards)
+    """
+    root = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+    total_time = 0.0
+    tests_by_shard = []
+    for path in input_paths:
+        document = ET.parse(path).getroot()
+        suites = [document] if document.tag == "testsuite" else document.findall("testsuite")
+        tests_by_shard.append((path, [(testcase.get("classname"), testcase.get("name"))
+                                      for suite in suites for testcase in suite.iter("testcase")]))
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')} ({path})")
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            total_time += float(suite.get("time", 0))
+            root.append(suite)
+    check_shards(tests_by_shard, expected_tests)
+    for key, value in totals.items():
+        root.set(key, str(value))
+    root.set("time", f"{total_time:.3f}")
+    return ET.ElementTree(root)
+
+def junit_durations(tree):
+    """
+    Extract per-test durations from a (merged) JUnit report for --shard-durations.
+    
+    Test ids are rebuilt from the file attribute, which pytest only writes
+    with junit_family=xunit1.
+    
+    Args:
+        tree (ElementTree): JUnit report
+        
+    Returns:
+        dict: Seconds by pytest test id
+        
+    Raises:
+        ValueError: If a test case has no file attribute
+    """
+    durations = {}
+    for testcase in tree.iter("testcase"):
+        file_path = testcase.get("file")
+        if file_path is None:
+            raise ValueError("Test cases have no file attribute; run the shards with -o junit_family=xunit1")
+        # classname is the file's dotted module path followed by the classes
+        module = file_path[:-len(".py")].replace("/", ".").replace("\\", ".")
+        classes = testcase.get("classname", "")[len(module) + 1:]
+        nodeid = "::".join([file_path.replace("\\", "/")] + (classes.split(".") if classes else [])
+                           + [testcase.get("name")])
+        durations[nodeid] = durations.get(nodeid, 0.0) + float(testcase.get("time", 0))
+    return durations
+
+def merge_json(input_paths, expected_tests=None):
+    """
+    Merge pytest-json-report style JSON files.
+    
+    Test lists are concatenated, numeric summary fields are added up and the
+    run duration is the longest shard's, since shards run side by side.
+    
+    Args:
+        input_paths (list): JSON report files
+        expected_tests (int, optional): Number of tests in the whole suite
+        
+    Returns:
+        dict: Merged report
+        
+    Raises:
+        ValueError: If the shards overlap or miss tests (see check_shards)
+    """
+    merged = {"summary": {}, "tests": [], "duration": 0.0, "shards": []}
+    tests_by_shard = []
+    for path in input_paths:
+        with open(path, 'r') as report_file:
+            report = json.load(report_file)
+        merged["shards"].append(path)
+        tests_by_shard.append((path, [test.get("nodeid") for test in report.get("tests", [])]))
+        merged["tests"].extend(report.get("tests", []))
+        merged["duration"] = max(merged["duration"], report.get("duration", 0.0))
+        for key, value in report.get("summary", {}).items():
+            if isinstance(value, (int, float)):
+                merged["summary"][key] = merged["summary"].get(key, 0) + value
+        for key, value in report.items():
+            merged.setdefault(key, value)
+    check_shards(tests_by_shard, expected_tests)
+    return merged
+
+HTML_BLOB = re.compile(r'(<div id="data-container" data-jsonblob=")([^"]*)(")')
+HTML_RUN_COUNT = re.compile(r'<p class="run-count">(\d+) tests? took ([^<]*)\.</p>')
+HTML_OUTCOME = re.compile(
+    r'(<input [^>]*data-test-result="(?P<outcome>\w+)"[^>]*?)( disabled)?(/>\s*<span class="(?P=outcome)">)(\d+)'
+)
+
+def _parse_html_duration(text):
+    text = text.strip()
+    if text.endswith("ms"):
+        return float(text[:-2]) / 1000
+    hours, minutes, seconds = (float(part) for part in text.split(":"))
+    return hours * 3600 + minutes * 60 + seconds
+
+def _format_html_duration(seconds):
+    if seconds < 1:
+        return f"{round(seconds * 1000)} ms"
+    seconds = round(seconds)
+    return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+
+def merge_html(input_paths, expected_tests=None):
+    """
+    Merge self-contained pytest-html (4.x) reports.
+    
+    The first report is used as the page; its embedded test data is replaced
+    with the union of all reports' data and the summary counts are redone.
+    As in merge_json, the run duration is the longest shard's.
+    
+    Args:
+        input_paths (list): HTML report files
+        expected_tests (int, optional): Number of tests in the whole suite
+        
+    Returns:
+        str: Merged HTML page
+        
+    Raises:
+        ValueError: If the shards overlap or miss tests (see check_shards)
+    """
+    page = None
+    data = None
+    tests_by_shard = []
+    run_count = 0
+    run_seconds = 0.0
+    for path in input_paths:
+        with open(path, 'r', encoding='utf-8') as report_file:
+            content = report_file.read()
+        blob = HTML_BLOB.search(content)
+        if blob is None:
+            raise ValueError(f"{path} is not a pytest-html 4 report")
+        report_data = json.loads(html.unescape(blob.group(2)))
+        tests_by_shard.append((path, list(report_data["tests"])))
+        if page is None:
+            page, data = content, report_data
+        else:
+            data["tests"].update(report_data["tests"])
+        count = HTML_RUN_COUNT.search(content)
+        if count:
+            run_count += int(count.group(1))
+            run_seconds = max(run_seconds, _parse_html_duration(count.group(2)))
+    check_shards(tests_by_shard, expected_tests)
+    
+    outcomes = {}
+    for results in data["tests"].values():
+        for result in results:
+            outcome = result["result"].lower()
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+    
+    def replace_outcome(match):
+        number = outcomes.get(match.group("outcome"), 0)
+        return match.group(1).rstrip() + (" " if number else " disabled") + match.group(4) + str(number)
+    
+    page = HTML_BLOB.sub(lambda match: match.group(1) + html.escape(json.dumps(data)) + match.group(3), page)
+    page = HTML_RUN_COUNT.sub(
+        f'<p class="run-count">{run_count} tests took {_format_html_duration(run_seconds)} '
+        f'in {len(input_paths)} shards.</p>', page)
+    return HTML_OUTCOME.sub(replace_outcome, page)
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("format", choices=["junit", "json", "html"], help="Report format")
+    parser.add_argument("output", help="Merged report to write")
+    parser.add_argument("inputs", nargs="+", help="Shard reports")
+    parser.add_argument("--durations-out", default=None,
+                        help="(junit) also write per-test durations for --shard-durations")
+    parser.add_argument("--expected-tests", type=int, default=None,
+                        help="Fail unless the shards ran this many distinct tests (e.g. from --collect-only)")
+    args = parser.parse_args(argv)
+    
+    try:
+        if args.format == "junit":
+            tree = merge_junit(args.inputs, args.expected_tests)
+            durations = junit_durations(tree) if args.durations_out else None
+            tree.write(args.output, encoding="utf-8", xml_declaration=True)
+            if durations is not None:
+                with open(args.durations_out, 'w') as durations_file:
+                    json.dump(durations, durations_file, indent=2, sort_keys=True)
+        elif args.format == "json":
+            merged = merge_json(args.inputs, args.expected_tests)
+            with open(args.output, 'w') as output_file:
+                json.dump(merged, output_file, indent=2)
+        else:
+            merged = merge_html(args.inputs, args.expected_tests)
+            with open(args.output, 'w', encoding='utf-8') as output_file:
+                output_file.write(merged)
+    except ValueError as error:
+        print(f"merge_reports: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import json
+import os
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+# URL patterns for Network.setBlockedURLs by resource type; each is also
+# blocked with a query string (e.g. app.css?v=3)
+RESOURCE_PATTERNS = {
+    "font": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "image": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.webp", "*.ico"],
+    "media": ["*.mp3", "*.mp4", "*.webm", "*.ogg", "*.wav"],
+    "stylesheet": ["*.css"],
+    "script": ["*.js"],
+}
+
+class RequestPolicy:
+    """
+    Which requests test browsers may make.
+    
+    External hosts are resolved to "not found" inside Chrome, so CDN assets
+    fail at once instead of stalling until a timeout; hosts on the allow
+    list still load and, with a cache directory, are kept in a disk cache
+    that later runs reuse. Chrome does not support several browsers writing
+    to one cache directory, so every browser gets its own subdirectory,
+    named after the xdist worker and the browser's launch number in that
+    worker. Resource types are blocked by URL pattern through DevTools.
+    """
+    
+    def __init__(self, blocked_types=(), block_external=False, allowed_hosts=(), cache_dir=None):
+        """
+        Args:
+            blocked_types (iterable): Keys of RESOURCE_PATTERNS to block
+            block_external (bool): Block every host except the application's and allowed_hosts
+            allowed_hosts (iterable): Host names that stay reachable with block_external
+            cache_dir (str, optional): Disk cache directory for the browsers
+            
+        Raises:
+            ValueError: If a resource type is unknown
+        """
+        unknown = set(blocked_types) - set(RESOURCE_PATTERNS)
+        if unknown:
+            raise ValueError(f"Unknown resource types {sorted(unknown)}, expected {sorted(RESOURCE_PATTERNS)}")
+        self.blocked_types = list(blocked_types)
+        self.block_external = block_external
+        self.allowed_hosts = list(allowed_hosts)
+        self.cache_dir = cache_dir
+        self._launches = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def active(self):
+        """
+        Returns:
+            bool: True if the policy changes anything about the browser
+        """
+        return bool(self.blocked_types or self.block_external or self.cache_dir)
+    
+    def blocked_url_patterns(self):
+        """
+        Returns:
+            list: URL patterns for Network.setBlockedURLs
+        """
+        return [variant for kind in self.blocked_types for pattern in RESOURCE_PATTERNS[kind]
+                for variant in (pattern, f"{pattern}?*")]
+    
+    def session_cache_dir(self):
+        """
+        Reserve the disk cache directory of the next browser launched in this process.
+        
+        Returns:
+            str: Subdirectory of cache_dir
+        """
+        with self._lock:
+            self._launches += 1
+            launch = self._launches
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        return os.path.join(self.cache_dir, f"{worker}-{launch}")
+    
+    def chrome_arguments(self, base_url):
+        """
+        Chrome command line arguments implementing the policy for one browser.
+        
+        Args:
+            base_url (str): Base URL of the application under test
+            
+        Returns:
+            list: Arguments for Options.add_argument
+        """
+        arguments = []
+        if self.block_external:
+            hosts = [urlsplit(base_url).hostname] + self.allowed_hosts
+            rules = ", ".join(["MAP * ~NOTFOUND"] + [f"EXCLUDE {host}" for host in hosts])
+            arguments.append(f"--host-resolver-rules={rules}")
+        if self.cache_dir:
+            arguments.append(f"--disk-cache-dir={self.session_cache_dir()}")
+        return arguments
+    
+    def configure_options(self, chrome_options, base_url):
+        """
+        Add the policy's arguments and the performance log used for counting.
+        
+        Args:
+            chrome_options (Options): Options of the browser being launched
+            base_url (str): Base URL of the application under test
+        """
+        for argument in self.chrome_arguments(base_url):
+            chrome_options.add_argument(argument)
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
+    def apply(self, driver):
+        """
+        Install the URL blocking on a launched browser.
+        
+        Args:
+            driver (WebDriver): Chrome driver
+        """
+        patterns = self.blocked_url_patterns()
+        if patterns:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+def collect_request_counts(driver):
+    """
+    Count the requests a browser made since the last call.
+    
+    Reads (and so empties) Chrome's performance log, which the browser only
+    keeps when it was launched with a RequestPolicy.
+    
+    Args:
+        driver (WebDriver): Chrome driver
+        
+    Returns:
+        dict: requests, blocked and cached counts
+    """
+    counts = {"requests": 0, "blocked": 0, "cached": 0}
+    try:
+        entries = driver.get_log("performance")
+    except (WebDriverException, AttributeError):
+        return counts
+    
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            counts["requests"] += 1
+        elif method == "Network.loadingFailed" and (
+                params.get("blockedReason") or params.get("errorText") == "net::ERR_NAME_NOT_RESOLVED"):
+            counts["blocked"] += 1
+        elif method == "Network.responseReceived" and params.get("response", {}).get("fromDiskCache"):
+            counts["cached"] += 1
+    return counts
+
+class RequestCountPlugin:
+    """
+    Adds up the request counts of all tests and reports them at the end of the run.
+    
+    The counts travel as a user property of each test, so pytest-xdist brings
+    them back to the controller.
+    """
+    
+    PROPERTY = "request_counts"
+    
+    def __init__(self):
+        self.totals = {"requests": 0, "blocked": 0, "cached": 0}
+    
+    def pytest_runtest_logreport(self, report):
+        for name, counts in report.user_properties:
+            if name == self.PROPERTY:
+                for key, value in counts.items():
+                    self.totals[key] = self.totals.get(key, 0) + value
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        terminalreporter.write_sep("-", "browser requests")
+        terminalreporter.write_line(
+            f"{self.totals['requests']} requests, {self.totals['blocked']} blocked, "
+            f"{self.totals['cached']} served from the asset cache"
+        )
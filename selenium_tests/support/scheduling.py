@@ -0,0 +1,96 @@
+from xdist.scheduler import LoadScheduling
+from .durations import DurationHistory
+
+class LongestFirstScheduling(LoadScheduling):
+    """
+    xdist load scheduling that hands out the longest tests first.
+    
+    Tests are sorted by their duration history and given to workers one at a
+    time as they become free (keeping a small prefetch queue per worker), the
+    classic longest-processing-time heuristic, so long tests cannot pile up on
+    one worker at the end of the run. Without history this is plain
+    LoadScheduling.
+    """
+    
+    PREFETCH = 2
+    
+    def __init__(self, config, history, log=None):
+        """
+        Args:
+            config: pytest config
+            history (DurationHistory): Durations from earlier runs
+            log: xdist log producer
+        """
+        super().__init__(config, log)
+        self.history = history
+        self.longest_first = bool(history)
+    
+    def schedule(self):
+        """Distribute the collection longest test first."""
+        assert self.collection_is_completed
+        if not self.longest_first or self.collection is not None:
+            super().schedule()
+            return
+        
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        
+        self.collection = list(self.node2collection.values())[0]
+        estimates = self.history.estimates(self.collection)
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda index: estimates[index], reverse=True)
+        if not self.collection:
+            return
+        
+        for node in self.nodes:
+            self._send_tests(node, self.PREFETCH)
+        
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
+    
+    def check_schedule(self, node, duration=0):
+        """Top the node's queue back up to PREFETCH tests."""
+        if not self.longest_first:
+            super().check_schedule(node, duration)
+            return
+        
+        if node.shutting_down:
+            return
+        
+        if self.pending:
+            missing = self.PREFETCH - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+        
+        self.log("num items waiting for node:", len(self.pending))
+
+class DurationSchedulingPlugin:
+    """
+    Records test durations and schedules xdist runs from them.
+    
+    Only registered when pytest-xdist is installed, because it implements an
+    xdist hook. Shard runs only see part of the suite, so they read the
+    history but do not record into it.
+    """
+    
+    def __init__(self, config):
+        self.config = config
+        self.history = DurationHistory(config.cache)
+        self.record = not config.getoption("shard", None)
+    
+    def pytest_xdist_make_scheduler(self, config, log):
+        if config.getoption("dist") != "load":
+            return None
+        return LongestFirstScheduling(config, self.history, log)
+    
+    def pytest_runtest_logreport(self, report):
+        # In an xdist run the controller receives every worker's reports here
+        if self.record:
+            self.history.add(report.nodeid, report.duration)
+    
+    def pytest_sessionfinish(self, session):
+        if self.record and not hasattr(session.config, "workerinput"):
+            self.history.save()
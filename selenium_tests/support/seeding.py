@@ -0,0 +1,312 @@
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+import requests
+from requests.adapters import HTTPAdapter
+from selenium_tests.test_data import TestDataLoader
+
+class SeedingError(Exception):
+    """Raised when the application rejects seeded data."""
+
+class _PageParser(HTMLParser):
+    """
+    Collects the parts of an EMS page the seeding client needs:
+    form inputs, select options, links, table rows and validation errors.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.inputs = []
+        self.options = {}
+        self.links = []
+        self.rows = []
+        self.errors = []
+        self._select = None
+        self._option = None
+        self._link = None
+        self._row = None
+        self._cell = None
+        self._error = None
+    
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "input":
+            self.inputs.append(attrs)
+        elif tag == "select":
+            self._select = attrs.get("name")
+            self.options.setdefault(self._select, [])
+        elif tag == "option":
+            self._option = [attrs.get("value", ""), ""]
+        elif tag == "a":
+            self._link = [attrs.get("href", ""), ""]
+        elif tag == "tr":
+            self._row = {"cells": [], "links": []}
+        elif tag == "td" and self._row is not None:
+            self._cell = []
+        elif tag == "div" and attrs.get("class") == "invalid-feedback":
+            self._error = []
+    
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._select = None
+        elif tag == "option" and self._option is not None:
+            if self._select is not None:
+                self.options[self._select].append((self._option[0], self._option[1].strip()))
+            self._option = None
+        elif tag == "a" and self._link is not None:
+            link = (self._link[0], self._link[1].strip())
+            self.links.append(link)
+            if self._row is not None:
+                self._row["links"].append(link)
+            self._link = None
+        elif tag == "td" and self._cell is not None:
+            self._row["cells"].append("".join(self._cell).strip())
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+        elif tag == "div" and self._error is not None:
+            self.errors.append("".join(self._error).strip())
+            self._error = None
+    
+    def handle_data(self, data):
+        for buffer in (self._cell, self._error):
+            if buffer is not None:
+                buffer.append(data)
+        if self._option is not None:
+            self._option[1] += data
+        if self._link is not None:
+            self._link[1] += data
+
+class SeedingClient:
+    """
+    Creates and deletes EMS data over HTTP, without a browser.
+    
+    Posts to the same create/delete views the page objects drive through the
+    UI, so tests can set up preconditions in milliseconds and spend browser
+    time only on the behaviour under test. A single pooled session keeps the
+    connection and Django's CSRF cookie alive between requests.
+    """
+    
+    EMPLOYEES_PATH = "employees/"
+    DEPARTMENTS_PATH = "departments/"
+    ADD_EMPLOYEE_LINK_TEXT = "Add New Employee"
+    ADD_DEPARTMENT_LINK_TEXT = "Add New Department"
+    
+    def __init__(self, base_url, timeout=10, pool_size=4):
+        """
+        Args:
+            base_url (str): Base URL of the application under test
+            timeout (int): Timeout in seconds for each request
+            pool_size (int): Number of pooled HTTP connections
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._create_urls = {}
+        self._employee_form = None
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def reset(self):
+        """Forget cached form state, e.g. after the database was restored."""
+        self._employee_form = None
+    
+    def create_department(self, name):
+        """
+        Create a department.
+        
+        Args:
+            name (str): Department name
+            
+        Raises:
+            SeedingError: If the application rejects the department
+        """
+        form_url = self._create_url(self.DEPARTMENTS_PATH, self.ADD_DEPARTMENT_LINK_TEXT)
+        page = self._get(form_url)
+        self._post(form_url, {"name": name}, page)
+        # Department choices on the employee form are now out of date
+        self._employee_form = None
+    
+    def create_departments(self, names):
+        """
+        Create several departments.
+        
+        Args:
+            names (list): Department names
+        """
+        for name in names:
+            self.create_department(name)
+    
+    def ensure_departments(self, names):
+        """
+        Create the given departments unless they already exist.
+        
+        Args:
+            names (list): Department names
+        """
+        existing = set(self.get_department_names())
+        for name in names:
+            if name not in existing:
+                self.create_department(name)
+                existing.add(name)
+    
+    def get_department_names(self):
+        """
+        Get all department names from the department list.
+        
+        Returns:
+            list: Department names
+        """
+        page = self._get(urljoin(self.base_url, self.DEPARTMENTS_PATH))
+        return [row["cells"][0] for row in page.rows if row["links"]]
+    
+    def create_employee(self, employee_data):
+        """
+        Create an employee.
+        
+        Args:
+            employee_data (dict): Employee data with keys:
+                                  name, email, department, salary, status
+                                  
+        Returns:
+            dict: The employee data that was posted
+            
+        Raises:
+            SeedingError: If the department does not exist or the data is rejected
+        """
+        form_url = self._create_url(self.EMPLOYEES_PATH, self.ADD_EMPLOYEE_LINK_TEXT)
+        form = self._get_employee_form(form_url)
+        
+        departments = dict((text, value) for value, text in form.options.get("department", []))
+        if employee_data["department"] not in departments:
+            raise SeedingError(f"Department '{employee_data['department']}' does not exist")
+        
+        data = {
+            "name": employee_data["name"],
+            "email": employee_data["email"],
+            "department": departments[employee_data["department"]],
+            "salary": str(employee_data["salary"]),
+            "status": self._status_value(form, employee_data.get("status", "Active")),
+        }
+        self._post(form_url, data, form)
+        return employee_data
+    
+    def create_employees(self, count=None, records=None, **overrides):
+        """
+        Create many employees in one call.
+        
+        Args:
+            count (int, optional): Number of random employees to generate
+            records (list, optional): Explicit employee data dictionaries
+            **overrides: Values applied to every generated record
+                         (e.g. department='Engineering')
+                         
+        Returns:
+            list: The employee data dictionaries that were created
+        """
+        if records is None:
+            records = TestDataLoader.generate_random_employees(count or 0, overrides.get("department"))
+            for employee_data in records:
+                employee_data.update(overrides)
+        return [self.create_employee(employee_data) for employee_data in records]
+    
+    def get_employee_names(self):
+        """
+        Get all employee names from the employee list.
+        
+        Returns:
+            list: Employee names
+        """
+        page = self._get(urljoin(self.base_url, self.EMPLOYEES_PATH))
+        return [row["cells"][0] for row in page.rows if row["links"]]
+    
+    def delete_employee(self, name):
+        """
+        Delete an employee by name.
+        
+        Args:
+            name (str): Employee name
+            
+        Returns:
+            bool: True if the employee was found and deleted
+        """
+        return self._delete_row(self.EMPLOYEES_PATH, name, {"q": name})
+    
+    def delete_department(self, name):
+        """
+        Delete a department by name.
+        
+        Args:
+            name (str): Department name
+            
+        Returns:
+            bool: True if the department was found and deleted
+        """
+        deleted = self._delete_row(self.DEPARTMENTS_PATH, name)
+        self._employee_form = None
+        return deleted
+    
+    def _get(self, url, params=None):
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        parser = _PageParser()
+        parser.feed(response.text)
+        return parser
+    
+    def _post(self, url, data, page):
+        """Post a form with the CSRF token taken from an already parsed page."""
+        token = next((field.get("value") for field in page.inputs
+                      if field.get("name") == "csrfmiddlewaretoken"), None)
+        if token:
+            data = dict(data, csrfmiddlewaretoken=token)
+        response = self.session.post(url, data=data, headers={"Referer": url},
+                                     timeout=self.timeout, allow_redirects=False)
+        # Django answers a successful form post with a redirect and
+        # re-renders the form (200) when validation fails
+        if response.status_code not in (301, 302, 303):
+            parser = _PageParser()
+            parser.feed(response.text)
+            details = "; ".join(parser.errors) or f"HTTP {response.status_code}"
+            raise SeedingError(f"POST {url} was rejected: {details}")
+        return response
+    
+    def _create_url(self, list_path, link_text):
+        """Find the create view by following the list page's 'Add New' link once."""
+        if list_path not in self._create_urls:
+            list_url = urljoin(self.base_url, list_path)
+            page = self._get(list_url)
+            href = next((href for href, text in page.links if text == link_text), None)
+            if href is None:
+                raise SeedingError(f"No '{link_text}' link on {list_url}")
+            self._create_urls[list_path] = urljoin(list_url, href)
+        return self._create_urls[list_path]
+    
+    def _get_employee_form(self, form_url):
+        # The form is only re-read after departments change; the CSRF token
+        # stays valid for as long as the session's csrftoken cookie does
+        if self._employee_form is None:
+            self._employee_form = self._get(form_url)
+        return self._employee_form
+    
+    def _status_value(self, form, status):
+        radio_id = "id_status_active" if status.lower() == "active" else "id_status_inactive"
+        radio = next((field for field in form.inputs if field.get("id") == radio_id), None)
+        return radio.get("value", status) if radio else status
+    
+    def _delete_row(self, list_path, name, params=None):
+        list_url = urljoin(self.base_url, list_path)
+        page = self._get(list_url, params)
+        for row in page.rows:
+            if row["cells"] and row["cells"][0] == name:
+                href = next((href for href, text in row["links"] if text == "Delete"), None)
+                if href is None:
+                    return False
+                delete_url = urljoin(list_url, href)
+                self._post(delete_url, {}, self._get(delete_url))
+                return True
+        return False
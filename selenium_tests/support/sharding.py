@@ -0,0 +1,63 @@
+import json
+
+def parse_shard(text):
+    """
+    Parse a '--shard i/N' value.
+    
+    Args:
+        text (str): Shard such as '2/4' (1-based)
+        
+    Returns:
+        tuple: (index, count) with a 1-based index
+        
+    Raises:
+        ValueError: If the value is malformed or the index is out of range
+    """
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"Expected --shard i/N, got '{text}'")
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Shard index must be between 1 and {count}, got '{text}'")
+    return index, count
+
+def load_durations(file_path):
+    """
+    Load a durations file written by merge_reports or copied from a pytest cache.
+    
+    Args:
+        file_path (str): JSON file mapping test ids to seconds
+        
+    Returns:
+        dict: Seconds by test id
+    """
+    with open(file_path, 'r') as durations_file:
+        return json.load(durations_file)
+
+def plan_shards(nodeids, durations, count):
+    """
+    Split tests into shards of similar total duration.
+    
+    Longest-processing-time first: tests are taken longest first and each
+    goes to the shard with the least total so far. Ties are broken by test id
+    and shard number, so every node that has the same collection and the same
+    durations computes the same plan without talking to the others.
+    
+    Args:
+        nodeids (list): Collected test ids
+        durations (dict): Seconds by test id; unknown tests count as the mean
+        count (int): Number of shards
+        
+    Returns:
+        list: One list of test ids per shard
+    """
+    known = [durations[nodeid] for nodeid in nodeids if nodeid in durations]
+    default = sum(known) / len(known) if known else 1.0
+    
+    shards = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-durations.get(nodeid, default), nodeid)):
+        target = min(range(count), key=lambda shard: (loads[shard], shard))
+        shards[target].append(nodeid)
+        loads[target] += durations.get(nodeid, default)
+    return shards
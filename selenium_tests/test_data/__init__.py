@@ -2,4 +2,7 @@
 Test data for the Employee Management System tests.
 """
 
+from .data_files import DataTable, load_table
+from .data_stream import DataSource, RowRef, get_data_source
 from .test_data_loader import TestDataLoader
+from .unique_data import UniqueDataGenerator, get_generator, set_generator
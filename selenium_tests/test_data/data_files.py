@@ -0,0 +1,134 @@
+import csv
+import json
+import os
+import threading
+
+class DataTable:
+    """
+    Rows of a test data file stored as tuples that share one header.
+    
+    A table costs one tuple per row instead of one dictionary per row; the
+    dictionaries callers expect are only built on access.
+    """
+    
+    __slots__ = ("header", "rows", "_index")
+    
+    def __init__(self, header, rows):
+        """
+        Args:
+            header (tuple): Column names
+            rows (list): Row tuples in header order
+        """
+        self.header = tuple(header)
+        self.rows = rows
+        self._index = dict((name, position) for position, name in enumerate(self.header))
+    
+    def __len__(self):
+        return len(self.rows)
+    
+    def __iter__(self):
+        for row in self.rows:
+            yield dict(zip(self.header, row))
+    
+    def row(self, position):
+        """
+        Get one row as a dictionary.
+        
+        Args:
+            position (int): Row number
+            
+        Returns:
+            dict: Row data
+        """
+        return dict(zip(self.header, self.rows[position]))
+    
+    def column(self, name):
+        """
+        Get all values of one column.
+        
+        Args:
+            name (str): Column name
+            
+        Returns:
+            list: Column values in row order
+        """
+        position = self._index[name]
+        return [row[position] for row in self.rows]
+    
+    def as_dicts(self):
+        """
+        Returns:
+            list: New dictionaries for all rows, safe for the caller to modify
+        """
+        return list(self)
+
+def _table_from_records(records):
+    header = []
+    for record in records:
+        for key in record:
+            if key not in header:
+                header.append(key)
+    return DataTable(header, [tuple(record.get(key) for key in header) for record in records])
+
+def _parse_csv(data_file):
+    reader = csv.reader(data_file)
+    header = next(reader, [])
+    return DataTable(header, [tuple(row) for row in reader if row])
+
+def _parse_json(data_file):
+    # Either a list of objects or {"header": [...], "rows": [[...], ...]}
+    content = json.load(data_file)
+    if isinstance(content, dict):
+        return DataTable(content["header"], [tuple(row) for row in content["rows"]])
+    return _table_from_records(content)
+
+def _parse_jsonl(data_file):
+    return _table_from_records([json.loads(line) for line in data_file if line.strip()])
+
+PARSERS = {
+    ".csv": _parse_csv,
+    ".json": _parse_json,
+    ".jsonl": _parse_jsonl,
+}
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+def load_table(file_path):
+    """
+    Load a CSV, JSON or JSONL data file, parsing it at most once per change.
+    
+    Parsed tables are cached per process and keyed by path; a cached table is
+    reused for as long as the file's modification time and size are unchanged.
+    
+    Args:
+        file_path (str): Path to the data file
+        
+    Returns:
+        DataTable: Parsed rows
+        
+    Raises:
+        ValueError: If the file extension is not supported
+    """
+    file_path = os.path.abspath(file_path)
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in PARSERS:
+        raise ValueError(f"Unsupported data file format: {file_path}")
+    
+    stat = os.stat(file_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _cache_lock:
+        cached = _cache.get(file_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+    
+    with open(file_path, 'r', newline='', encoding='utf-8') as data_file:
+        table = PARSERS[extension](data_file)
+    with _cache_lock:
+        _cache[file_path] = (version, table)
+    return table
+
+def clear_cache():
+    """Forget all parsed data files."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,207 @@
+import csv
+import io
+import json
+import os
+import random
+import threading
+from array import array
+
+class DataSource:
+    """
+    A large CSV or JSONL data file read one row at a time.
+    
+    Collection only needs the number of rows, which is counted without
+    parsing anything: the byte offset of every row is indexed once, in a
+    compact array, so any row can then be loaded with a single seek. A slice
+    with a stop bound only indexes the file up to that row. Blank lines are
+    not rows. Rows must be one per line (no newlines inside quoted
+    CSV fields).
+    """
+    
+    def __init__(self, file_path):
+        """
+        Args:
+            file_path (str): Path to a .csv or .jsonl file
+            
+        Raises:
+            ValueError: If the file is neither CSV nor JSONL
+        """
+        self.file_path = os.path.abspath(file_path)
+        self.format = os.path.splitext(self.file_path)[1].lower()
+        if self.format not in (".csv", ".jsonl"):
+            raise ValueError(f"Only CSV and JSONL files can be streamed: {self.file_path}")
+        self.name = os.path.splitext(os.path.basename(self.file_path))[0]
+        self._header = None
+        self._offsets = None
+        # Byte position the index stops at, None once the whole file is indexed
+        self._resume_at = None
+        self._lock = threading.Lock()
+    
+    def count(self):
+        """
+        Count the data rows without parsing them.
+        
+        Returns:
+            int: Number of rows, excluding a CSV header and blank lines
+        """
+        self._build_index()
+        return len(self._offsets)
+    
+    def select(self, data_slice=None, sample=None, seed=None):
+        """
+        Choose the row numbers to run.
+        
+        Args:
+            data_slice (slice, optional): Rows to keep, applied first
+            sample (int, optional): Number of rows to pick at random from the slice
+            seed (optional): Seed for sampling; must be the same in every
+                             xdist worker so that all workers collect the same tests
+                             
+        Returns:
+            list: Selected row numbers in file order
+        """
+        if data_slice is not None and sample is None and _is_bounded(data_slice):
+            # The rows past the stop bound are never needed, so they are not indexed
+            self._build_index(limit=data_slice.stop)
+            numbers = range(len(self._offsets))
+        else:
+            numbers = range(self.count())
+        if data_slice is not None:
+            numbers = numbers[data_slice]
+        if sample is not None and sample < len(numbers):
+            return sorted(random.Random(seed).sample(numbers, sample))
+        return list(numbers)
+    
+    def load(self, number):
+        """
+        Read and parse one row.
+        
+        Args:
+            number (int): Row number
+            
+        Returns:
+            dict: Row data
+        """
+        self._build_index(limit=number + 1)
+        with open(self.file_path, 'rb') as data_file:
+            data_file.seek(self._offsets[number])
+            line = data_file.readline().decode('utf-8')
+        if self.format == ".jsonl":
+            return json.loads(line)
+        return dict(zip(self._header, next(csv.reader(io.StringIO(line)))))
+    
+    def _build_index(self, limit=None):
+        with self._lock:
+            if self._offsets is not None:
+                if self._resume_at is None or (limit is not None and len(self._offsets) >= limit):
+                    return
+            resume_at = None
+            with open(self.file_path, 'rb') as data_file:
+                if self._offsets is None:
+                    offsets = array('q')
+                    if self.format == ".csv":
+                        self._header = next(csv.reader([data_file.readline().decode('utf-8')]))
+                    position = data_file.tell()
+                else:
+                    # Continue a partial index
+                    offsets = self._offsets
+                    position = self._resume_at
+                    data_file.seek(position)
+                for line in data_file:
+                    if limit is not None and len(offsets) >= limit:
+                        resume_at = position
+                        break
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+            self._offsets = offsets
+            self._resume_at = resume_at
+
+def _is_bounded(data_slice):
+    """
+    Check whether a slice selects rows without knowing how many rows there are.
+    
+    Args:
+        data_slice (slice): Row slice
+        
+    Returns:
+        bool: True if the slice has a non-negative stop, start and step
+    """
+    return (data_slice.stop is not None and data_slice.stop >= 0
+            and (data_slice.start is None or data_slice.start >= 0)
+            and (data_slice.step is None or data_slice.step > 0))
+
+class RowRef:
+    """
+    Lightweight parameter standing for one row of a DataSource.
+    
+    Only the source and the row number are kept at collection time; the row
+    itself is read when the test asks for it.
+    """
+    
+    __slots__ = ("source", "number")
+    
+    def __init__(self, source, number):
+        """
+        Args:
+            source (DataSource): Data file
+            number (int): Row number
+        """
+        self.source = source
+        self.number = number
+    
+    @property
+    def id(self):
+        """
+        Returns:
+            str: Test id such as 'employees-42'
+        """
+        return f"{self.source.name}-{self.number}"
+    
+    def load(self):
+        """
+        Returns:
+            dict: Row data
+        """
+        return self.source.load(self.number)
+
+_sources = {}
+
+def get_data_source(file_path):
+    """
+    Get the shared DataSource for a file, so its index is built once per process.
+    
+    Args:
+        file_path (str): Path to a .csv or .jsonl file
+        
+    Returns:
+        DataSource: Data source
+    """
+    file_path = os.path.abspath(file_path)
+    if file_path not in _sources:
+        _sources[file_path] = DataSource(file_path)
+    return _sources[file_path]
+
+def parse_slice(text):
+    """
+    Parse a 'start:stop[:step]' option value.
+    
+    Args:
+        text (str): Slice such as '0:1000' or '::10'
+        
+    Returns:
+        slice: Parsed slice
+        
+    Raises:
+        ValueError: If the value is not a valid slice
+    """
+    parts = text.split(":")
+    if not 2 <= len(parts) <= 3:
+        raise ValueError(f"Expected start:stop[:step], got '{text}'")
+    try:
+        data_slice = slice(*(int(part) if part else None for part in parts))
+    except ValueError:
+        raise ValueError(f"Expected integers in start:stop[:step], got '{text}'")
+    if data_slice.step == 0:
+        raise ValueError(f"Slice step cannot be zero, got '{text}'")
+    return data_slice
@@ -1,14 +1,42 @@
-import csv
 import os
-import random
-import string
-from datetime import datetime
+from .data_files import load_table
+from .unique_data import get_generator
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class TestDataLoader:
     """
     Utility class for loading and generating test data.
+    
+    Data files are parsed once per process and re-read only when they change.
     """
     
+    @staticmethod
+    def load_table(file_name):
+        """
+        Load a data file as a cached table of row tuples.
+        
+        Args:
+            file_name (str): Path to a CSV, JSON or JSONL file, or a file name in test_data/
+            
+        Returns:
+            DataTable: Parsed rows
+        """
+        return load_table(os.path.join(DATA_DIR, file_name))
+    
+    @staticmethod
+    def load_data(file_path):
+        """
+        Load data from a CSV, JSON or JSONL file.
+        
+        Args:
+            file_path (str): Path to the data file
+            
+        Returns:
+            list: List of dictionaries with the file's rows
+        """
+        return TestDataLoader.load_table(file_path).as_dicts()
+    
     @staticmethod
     def load_csv_data(file_path):
         """
@@ -20,12 +48,7 @@ class TestDataLoader:
         Returns:
             list: List of dictionaries with CSV data
         """
-        data = []
-        with open(file_path, 'r') as csv_file:
-            reader = csv.DictReader(csv_file)
-            for row in reader:
-                data.append(row)
-        return data
+        return TestDataLoader.load_data(file_path)
     
     @staticmethod
     def get_employees_data():
@@ -35,9 +58,7 @@ class TestDataLoader:
         Returns:
             list: List of employee dictionaries
         """
-        file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                'test_data', 'employees.csv')
-        return TestDataLoader.load_csv_data(file_path)
+        return TestDataLoader.load_data('employees.csv')
     
     @staticmethod
     def get_departments_data():
@@ -47,9 +68,27 @@ class TestDataLoader:
         Returns:
             list: List of department dictionaries
         """
-        file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 
-                                'test_data', 'departments.csv')
-        return TestDataLoader.load_csv_data(file_path)
+        return TestDataLoader.load_data('departments.csv')
+    
+    @staticmethod
+    def get_department_names():
+        """
+        Get the names of all test departments.
+        
+        Returns:
+            list: Department names
+        """
+        return TestDataLoader.load_table('departments.csv').column('name')
+    
+    @staticmethod
+    def get_invalid_employees_data():
+        """
+        Get employee form validation cases from JSONL.
+        
+        Returns:
+            list: Dictionaries with employee fields plus the 'field' expected to fail
+        """
+        return TestDataLoader.load_data('invalid_employees.jsonl')
     
     @staticmethod
     def get_random_employee():
@@ -59,8 +98,8 @@ class TestDataLoader:
         Returns:
             dict: Random employee data
         """
-        employees = TestDataLoader.get_employees_data()
-        return random.choice(employees)
+        employees = TestDataLoader.load_table('employees.csv')
+        return employees.row(get_generator().random.randrange(len(employees)))
     
     @staticmethod
     def get_random_department():
@@ -70,28 +109,23 @@ class TestDataLoader:
         Returns:
             dict: Random department data
         """
-        departments = TestDataLoader.get_departments_data()
-        return random.choice(departments)
+        departments = TestDataLoader.load_table('departments.csv')
+        return departments.row(get_generator().random.randrange(len(departments)))
     
     @staticmethod
     def generate_random_name():
         """
-        Generate a random person name.
+        Generate a random person name that is unique across the test run.
         
         Returns:
             str: Random name
         """
-        first_names = ["John", "Jane", "Michael", "Emily", "David", "Sarah", 
-                      "Robert", "Lisa", "William", "Elizabeth", "Richard", "Jennifer"]
-        last_names = ["Smith", "Johnson", "Williams", "Jones", "Brown", "Davis", 
-                     "Miller", "Wilson", "Moore", "Taylor", "Anderson", "Thomas"]
-        
-        return f"{random.choice(first_names)} {random.choice(last_names)}"
+        return get_generator().name()
     
     @staticmethod
     def generate_random_email(name=None):
         """
-        Generate a random email based on name or random characters.
+        Generate a random email that is unique across the test run.
         
         Args:
             name (str, optional): Name to base email on
@@ -99,18 +133,7 @@ class TestDataLoader:
         Returns:
             str: Random email
         """
-        if name:
-            # Convert name to lowercase, replace spaces with dots
-            email_base = name.lower().replace(" ", ".")
-        else:
-            # Generate random string
-            chars = string.ascii_lowercase + string.digits
-            email_base = ''.join(random.choice(chars) for _ in range(8))
-        
-        domains = ["example.com", "test.com", "email.com", "domain.com", "company.com"]
-        timestamp = datetime.now().strftime("%H%M%S")
-        
-        return f"{email_base}.{timestamp}@{random.choice(domains)}"
+        return get_generator().email(name)
     
     @staticmethod
     def generate_random_salary():
@@ -120,7 +143,7 @@ class TestDataLoader:
         Returns:
             float: Random salary
         """
-        return round(random.uniform(30000, 150000), 2)
+        return get_generator().salary()
     
     @staticmethod
     def generate_random_status():
@@ -130,7 +153,7 @@ class TestDataLoader:
         Returns:
             str: 'Active' or 'Inactive'
         """
-        return random.choice(["Active", "Inactive"])
+        return get_generator().status()
     
     @staticmethod
     def generate_random_employee_data(department=None):
@@ -143,33 +166,30 @@ class TestDataLoader:
         Returns:
             dict: Random employee data
         """
-        name = TestDataLoader.generate_random_name()
-        
-        if not department:
-            department_data = TestDataLoader.get_random_department()
-            department = department_data['name']
+        return TestDataLoader.generate_random_employees(1, department)[0]
+    
+    @staticmethod
+    def generate_random_employees(count, department=None):
+        """
+        Generate many employees with unique names and emails in one call.
         
-        return {
-            "name": name,
-            "email": TestDataLoader.generate_random_email(name),
-            "department": department,
-            "salary": TestDataLoader.generate_random_salary(),
-            "status": TestDataLoader.generate_random_status()
-        }
+        Args:
+            count (int): Number of employees
+            department (str, optional): Department name for all employees,
+                                        random departments if not given
+                                        
+        Returns:
+            list: Random employee data dictionaries
+        """
+        departments = [department] if department else TestDataLoader.get_department_names()
+        return get_generator().employees(count, departments)
     
     @staticmethod
     def generate_random_department_name():
         """
-        Generate a random department name.
+        Generate a random department name that is unique across the test run.
         
         Returns:
             str: Random department name
         """
-        departments = ["Accounting", "Business Development", "Data Science", 
-                      "Design", "Engineering", "Finance", "Human Resources", 
-                      "Legal", "Marketing", "Operations", "Product Management", 
-                      "Quality Assurance", "Research", "Sales", "Support"]
-        
-        # Add a random suffix to make it unique
-        suffix = ''.join(random.choice(string.digits) for _ in range(3))
-        return f"{random.choice(departments)}-{suffix}"
+        return get_generator().department_name()
@@ -0,0 +1,228 @@
+import itertools
+import os
+import random
+import threading
+import uuid
+
+FIRST_NAMES = ["John", "Jane", "Michael", "Emily", "David", "Sarah",
+               "Robert", "Lisa", "William", "Elizabeth", "Richard", "Jennifer"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Jones", "Brown", "Davis",
+              "Miller", "Wilson", "Moore", "Taylor", "Anderson", "Thomas"]
+EMAIL_DOMAINS = ["example.com", "test.com", "email.com", "domain.com", "company.com"]
+DEPARTMENT_NAMES = ["Accounting", "Business Development", "Data Science",
+                    "Design", "Engineering", "Finance", "Human Resources",
+                    "Legal", "Marketing", "Operations", "Product Management",
+                    "Quality Assurance", "Research", "Sales", "Support"]
+STATUSES = ["Active", "Inactive"]
+
+def _default_worker_id():
+    return os.environ.get("PYTEST_XDIST_WORKER", "master")
+
+def _default_run_id():
+    # pytest-xdist gives every worker of a run the same test run uid
+    return os.environ.get("PYTEST_XDIST_TESTRUNUID", uuid.uuid4().hex)[:6]
+
+class _Sequence:
+    """Process-wide counter shared by a generator and its per-test children."""
+    
+    def __init__(self):
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def take(self, count=1):
+        with self._lock:
+            return [next(self._counter) for _ in range(count)]
+
+class UniqueDataGenerator:
+    """
+    Generates employee and department data that is unique across a test run.
+    
+    Every unique value carries a tag built from the run id, the pytest-xdist
+    worker id and a monotonic counter, e.g. 'a1b2c3-gw0-17'. Values from
+    different workers, different runs or different calls in the same process
+    therefore never collide with the application's unique email and
+    department name rules, no matter how random the rest of the value is.
+    
+    The random parts (names, salaries, statuses) come from a private RNG.
+    Generators derived with for_test() seed it from the base seed and the
+    test id, so a test sees the same data on every run with the same seed.
+    """
+    
+    def __init__(self, seed=None, worker_id=None, run_id=None, sequence=None):
+        """
+        Args:
+            seed (optional): Seed for the random parts, None for system entropy
+            worker_id (str, optional): xdist worker id, detected if not given
+            run_id (str, optional): Id shared by all workers of a run, detected if not given
+            sequence (_Sequence, optional): Counter to share with a parent generator
+        """
+        self.seed = seed
+        self.worker_id = worker_id or _default_worker_id()
+        self.run_id = run_id or _default_run_id()
+        self.random = random.Random(seed)
+        self._sequence = sequence or _Sequence()
+    
+    def for_test(self, test_id):
+        """
+        Derive a generator for one test.
+        
+        The child shares this generator's run id, worker id and counter, so
+        its values stay unique, but has its own RNG seeded from the test id.
+        
+        Args:
+            test_id (str): pytest node id of the test
+            
+        Returns:
+            UniqueDataGenerator: Generator for the test
+        """
+        seed = None if self.seed is None else f"{self.seed}:{test_id}"
+        return UniqueDataGenerator(seed, self.worker_id, self.run_id, self._sequence)
+    
+    def tags(self, count):
+        """
+        Reserve unique tags in one step.
+        
+        Args:
+            count (int): Number of tags
+            
+        Returns:
+            list: Tags such as 'a1b2c3-gw0-17'
+        """
+        prefix = f"{self.run_id}-{self.worker_id}-"
+        return [f"{prefix}{number}" for number in self._sequence.take(count)]
+    
+    def tag(self):
+        """
+        Returns:
+            str: A new unique tag
+        """
+        return self.tags(1)[0]
+    
+    def name(self, tag=None):
+        """
+        Generate a unique person name.
+        
+        Args:
+            tag (str, optional): Unique tag to use, a new one if not given
+            
+        Returns:
+            str: Name such as 'Jane Smith a1b2c3-gw0-17'
+        """
+        return f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)} {tag or self.tag()}"
+    
+    def email(self, name=None, tag=None):
+        """
+        Generate a unique email address.
+        
+        Args:
+            name (str, optional): Name to base the address on
+            tag (str, optional): Unique tag to use, a new one if not given
+            
+        Returns:
+            str: Email address
+        """
+        tag = tag or self.tag()
+        if name:
+            # A unique name already contains its tag
+            local_part = name.lower().replace(" ", ".")
+            if not local_part.endswith(tag):
+                local_part = f"{local_part}.{tag}"
+        else:
+            local_part = f"user.{tag}"
+        return f"{local_part}@{self.random.choice(EMAIL_DOMAINS)}"
+    
+    def department_name(self, tag=None):
+        """
+        Generate a unique department name.
+        
+        Args:
+            tag (str, optional): Unique tag to use, a new one if not given
+            
+        Returns:
+            str: Department name such as 'Design-a1b2c3-gw0-17'
+        """
+        return f"{self.random.choice(DEPARTMENT_NAMES)}-{tag or self.tag()}"
+    
+    def salary(self):
+        """
+        Returns:
+            float: Random salary between 30000 and 150000
+        """
+        return round(self.random.uniform(30000, 150000), 2)
+    
+    def status(self):
+        """
+        Returns:
+            str: 'Active' or 'Inactive'
+        """
+        return self.random.choice(STATUSES)
+    
+    def employee(self, departments):
+        """
+        Generate one employee.
+        
+        Args:
+            departments (list): Department names to choose from
+            
+        Returns:
+            dict: Employee data with keys name, email, department, salary, status
+        """
+        return self.employees(1, departments)[0]
+    
+    def employees(self, count, departments):
+        """
+        Generate many employees at once.
+        
+        All tags are reserved under a single lock acquisition and the RNG
+        draws are batched, so large data sets cost little more than a loop
+        of string formatting.
+        
+        Args:
+            count (int): Number of employees
+            departments (list): Department names to choose from
+            
+        Returns:
+            list: Employee data dictionaries
+        """
+        rng = self.random
+        first_names = rng.choices(FIRST_NAMES, k=count)
+        last_names = rng.choices(LAST_NAMES, k=count)
+        domains = rng.choices(EMAIL_DOMAINS, k=count)
+        chosen_departments = rng.choices(departments, k=count)
+        statuses = rng.choices(STATUSES, k=count)
+        
+        employees = []
+        for index, tag in enumerate(self.tags(count)):
+            first, last = first_names[index], last_names[index]
+            employees.append({
+                "name": f"{first} {last} {tag}",
+                "email": f"{first.lower()}.{last.lower()}.{tag}@{domains[index]}",
+                "department": chosen_departments[index],
+                "salary": round(rng.uniform(30000, 150000), 2),
+                "status": statuses[index],
+            })
+        return employees
+
+_default_generator = None
+
+def get_generator():
+    """
+    Get the generator used by TestDataLoader.
+    
+    Returns:
+        UniqueDataGenerator: Current default generator
+    """
+    global _default_generator
+    if _default_generator is None:
+        _default_generator = UniqueDataGenerator()
+    return _default_generator
+
+def set_generator(generator):
+    """
+    Replace the generator used by TestDataLoader, e.g. with a per-test one.
+    
+    Args:
+        generator (UniqueDataGenerator): New default generator
+    """
+    global _default_generator
+    _default_generator = generator
@@ -1,27 +1,50 @@
 import pytest
-from selenium_tests.page_objects import HomePage
+from selenium_tests.page_objects import HomePage, Navigator
 from selenium_tests.test_data import TestDataLoader
 
 class BaseTest:
     """
     Base class for all test classes.
     Contains common setup and utility methods.
+    
+    Each test starts on start_page. Classes whose tests go straight to
+    another page (usually after seeding data) set it to None and call
+    navigate_to(), so no page is loaded only to be left again.
     """
     
+    start_page = HomePage
+    
     @pytest.fixture(autouse=True)
-    def setup(self, driver):
+    def setup(self, driver, seeder):
         """
         Setup method that runs before each test.
         
         Args:
             driver: WebDriver instance from conftest.py
+            seeder: SeedingClient from conftest.py for creating data over HTTP
         """
         self.driver = driver
         self.home_page = HomePage(self.driver)
         self.test_data_loader = TestDataLoader
+        self.seeder = seeder
+        self.navigator = Navigator(self.driver)
         
-        # Navigate to the home page
-        self.home_page.open_home_page()
+        # Navigate to the start page
+        if self.start_page is not None:
+            self.navigator.go_to(self.start_page, reload=True)
+    
+    def navigate_to(self, page_class, via_clicks=False):
+        """
+        Go to a page with the fewest page loads.
+        
+        Args:
+            page_class (type): Page object class, e.g. EmployeeListPage
+            via_clicks (bool): Arrive through links and buttons instead of the page URL
+            
+        Returns:
+            BasePage: Page object of page_class
+        """
+        return self.navigator.go_to(page_class, via_clicks)
         
     def teardown_method(self, method):
         """Teardown method that runs after each test."""
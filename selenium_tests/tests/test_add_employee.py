@@ -1,4 +1,5 @@
 import pytest
+from selenium_tests.page_objects import EmployeeFormPage, EmployeeListPage
 from selenium_tests.tests.base_test import BaseTest
 
 class TestAddEmployee(BaseTest):
@@ -6,13 +7,15 @@ class TestAddEmployee(BaseTest):
     Tests for adding new employees.
     """
     
+    start_page = None
+    
     def test_add_valid_employee(self):
         """Test adding a new employee with valid data."""
         # Generate random employee data
         employee_data = self.test_data_loader.generate_random_employee_data()
         
         # Navigate to the employee list page
-        employee_list_page = self.home_page.navigate_to_employees()
+        employee_list_page = self.navigate_to(EmployeeListPage)
         
         # Click on Add New Employee button
         employee_form_page = employee_list_page.click_add_new_employee()
@@ -29,13 +32,11 @@ class TestAddEmployee(BaseTest):
         # Verify the employee was added successfully
         assert result_page.is_employee_displayed(employee_data['name']), f"Employee {employee_data['name']} not found in list"
     
+    @pytest.mark.read_only
     def test_add_employee_missing_required_fields(self):
         """Test form validation for required fields."""
-        # Navigate to the employee list page
-        employee_list_page = self.home_page.navigate_to_employees()
-        
-        # Click on Add New Employee button
-        employee_form_page = employee_list_page.click_add_new_employee()
+        # Navigate to the employee form
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Submit the form without filling any fields
         result_page = employee_form_page.submit_form()
@@ -48,17 +49,15 @@ class TestAddEmployee(BaseTest):
         assert 'name' in validation_errors, "No validation error for name field"
         assert 'email' in validation_errors, "No validation error for email field"
     
+    @pytest.mark.read_only
     def test_add_employee_invalid_email(self):
         """Test form validation for invalid email."""
         # Generate random employee data with invalid email
         employee_data = self.test_data_loader.generate_random_employee_data()
         employee_data['email'] = "invalid-email"
         
-        # Navigate to the employee list page
-        employee_list_page = self.home_page.navigate_to_employees()
-        
-        # Click on Add New Employee button
-        employee_form_page = employee_list_page.click_add_new_employee()
+        # Navigate to the employee form
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Fill the form with invalid email and submit
         result_page = employee_form_page.fill_employee_form(employee_data).submit_form()
@@ -70,17 +69,15 @@ class TestAddEmployee(BaseTest):
         validation_errors = result_page.get_validation_errors()
         assert 'email' in validation_errors, "No validation error for invalid email"
     
+    @pytest.mark.read_only
     def test_add_employee_negative_salary(self):
         """Test form validation for negative salary."""
         # Generate random employee data with negative salary
         employee_data = self.test_data_loader.generate_random_employee_data()
         employee_data['salary'] = -1000
         
-        # Navigate to the employee list page
-        employee_list_page = self.home_page.navigate_to_employees()
-        
-        # Click on Add New Employee button
-        employee_form_page = employee_list_page.click_add_new_employee()
+        # Navigate to the employee form
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Fill the form with negative salary and submit
         result_page = employee_form_page.fill_employee_form(employee_data).submit_form()
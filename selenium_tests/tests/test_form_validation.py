@@ -1,4 +1,5 @@
 import pytest
+from selenium_tests.page_objects import DepartmentFormPage, EmployeeFormPage
 from selenium_tests.tests.base_test import BaseTest
 
 class TestFormValidation(BaseTest):
@@ -6,11 +7,13 @@ class TestFormValidation(BaseTest):
     Tests for form validation in the application.
     """
     
+    start_page = None
+    
+    @pytest.mark.read_only
     def test_employee_form_required_fields(self):
         """Test validation of required fields in employee form."""
         # Navigate to the employee form
-        employee_list_page = self.home_page.navigate_to_employees()
-        employee_form_page = employee_list_page.click_add_new_employee()
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Submit the form without filling any fields
         result_page = employee_form_page.submit_form()
@@ -20,11 +23,11 @@ class TestFormValidation(BaseTest):
         assert 'name' in validation_errors, "No validation error for name field"
         assert 'email' in validation_errors, "No validation error for email field"
     
+    @pytest.mark.read_only
     def test_employee_form_email_validation(self):
         """Test email format validation in employee form."""
         # Navigate to the employee form
-        employee_list_page = self.home_page.navigate_to_employees()
-        employee_form_page = employee_list_page.click_add_new_employee()
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Fill the form with invalid email
         employee_data = self.test_data_loader.generate_random_employee_data()
@@ -37,11 +40,11 @@ class TestFormValidation(BaseTest):
         validation_errors = result_page.get_validation_errors()
         assert 'email' in validation_errors, "No validation error for invalid email"
     
+    @pytest.mark.read_only
     def test_employee_form_salary_validation(self):
         """Test salary validation in employee form."""
         # Navigate to the employee form
-        employee_list_page = self.home_page.navigate_to_employees()
-        employee_form_page = employee_list_page.click_add_new_employee()
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Fill the form with negative salary
         employee_data = self.test_data_loader.generate_random_employee_data()
@@ -54,11 +57,25 @@ class TestFormValidation(BaseTest):
         validation_errors = result_page.get_validation_errors()
         assert 'salary' in validation_errors, "No validation error for negative salary"
     
+    @pytest.mark.read_only
+    @pytest.mark.data_source("invalid_employees.jsonl")
+    def test_employee_form_invalid_data(self, data_row):
+        """Test employee form validation for each case in invalid_employees.jsonl."""
+        # Navigate to the employee form
+        employee_form_page = self.navigate_to(EmployeeFormPage)
+        
+        # Fill the form with the invalid data and submit
+        result_page = employee_form_page.fill_employee_form(data_row).submit_form()
+        
+        # Verify the expected field is reported
+        validation_errors = result_page.get_validation_errors()
+        assert data_row['field'] in validation_errors, f"No validation error for {data_row['case']}"
+    
+    @pytest.mark.read_only
     def test_department_form_required_fields(self):
         """Test validation of required fields in department form."""
         # Navigate to the department form
-        department_list_page = self.home_page.navigate_to_departments()
-        department_form_page = department_list_page.click_add_new_department()
+        department_form_page = self.navigate_to(DepartmentFormPage)
         
         # Submit the form without filling any fields
         result_page = department_form_page.submit_form()
@@ -70,15 +87,10 @@ class TestFormValidation(BaseTest):
     def test_employee_form_unique_email(self):
         """Test validation of unique email in employee form."""
         # First add an employee
-        employee_data = self.test_data_loader.generate_random_employee_data()
-        
-        # Navigate to employee list and add new employee
-        employee_list_page = self.home_page.navigate_to_employees()
-        employee_form_page = employee_list_page.click_add_new_employee()
-        employee_form_page.fill_employee_form(employee_data).submit_form()
+        employee_data = self.seeder.create_employees(1)[0]
         
         # Try to add another employee with the same email
-        employee_form_page = employee_list_page.click_add_new_employee()
+        employee_form_page = self.navigate_to(EmployeeFormPage)
         
         # Use a different name but same email
         duplicate_employee_data = self.test_data_loader.generate_random_employee_data()
@@ -94,14 +106,10 @@ class TestFormValidation(BaseTest):
         """Test validation of unique name in department form."""
         # First add a department
         department_name = self.test_data_loader.generate_random_department_name()
-        
-        # Navigate to department list and add new department
-        department_list_page = self.home_page.navigate_to_departments()
-        department_form_page = department_list_page.click_add_new_department()
-        department_form_page.fill_department_form(department_name).submit_form()
+        self.seeder.create_department(department_name)
         
         # Try to add another department with the same name
-        department_form_page = department_list_page.click_add_new_department()
+        department_form_page = self.navigate_to(DepartmentFormPage)
         
         # Fill the form with the same name and submit
         result_page = department_form_page.fill_department_form(department_name).submit_form()
@@ -6,6 +6,7 @@ class TestNavigation(BaseTest):
     Tests for navigation between pages in the application.
     """
     
+    @pytest.mark.read_only
     def test_navigation_from_home(self):
         """Test navigation from home page to other pages."""
         # Verify we're on the home page
@@ -88,6 +89,7 @@ class TestNavigation(BaseTest):
         # Verify we're on the delete confirmation page
         assert "delete" in self.driver.current_url, "Not on delete confirmation page"
     
+    @pytest.mark.read_only
     def test_navigation_using_browser_controls(self):
         """Test navigation using browser back/forward buttons."""
         # Navigate to the employee list page
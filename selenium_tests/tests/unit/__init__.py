@@ -0,0 +1,3 @@
+"""
+Unit tests of the test support code; they need neither a browser nor an EMS.
+"""
@@ -0,0 +1,12 @@
+import pytest
+
+# The unit tests never touch EMS data, so the database restore fixtures of
+# the browser suite are replaced and no server is started for them.
+
+@pytest.fixture(scope="module", autouse=True)
+def _restore_database_per_module():
+    yield
+
+@pytest.fixture(autouse=True)
+def _restore_database_per_test():
+    yield
@@ -0,0 +1,99 @@
+import json
+import os
+import pytest
+from selenium_tests.test_data.data_files import DataTable, clear_cache, load_table
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+class TestDataTable:
+    """
+    Tests for the tuple-backed data table.
+    """
+    
+    def test_rows_are_built_as_dictionaries(self):
+        """Test that rows are returned as dictionaries keyed by the header."""
+        table = DataTable(["name", "salary"], [("Ann", "10"), ("Bob", "20")])
+        assert len(table) == 2
+        assert table.row(1) == {"name": "Bob", "salary": "20"}
+        assert list(table) == [{"name": "Ann", "salary": "10"}, {"name": "Bob", "salary": "20"}]
+    
+    def test_column(self):
+        """Test reading one column in row order."""
+        table = DataTable(["name", "salary"], [("Ann", "10"), ("Bob", "20")])
+        assert table.column("salary") == ["10", "20"]
+    
+    def test_as_dicts_returns_copies(self):
+        """Test that modifying the returned dictionaries leaves the table unchanged."""
+        table = DataTable(["name"], [("Ann",)])
+        table.as_dicts()[0]["name"] = "Changed"
+        assert table.row(0) == {"name": "Ann"}
+
+class TestLoadTable:
+    """
+    Tests for loading and caching data files.
+    """
+    
+    def test_csv(self, tmp_path):
+        """Test that CSV files are parsed with their header and blank lines are skipped."""
+        path = tmp_path / "people.csv"
+        path.write_text("name,salary\nAnn,10\n\nBob,20\n", encoding="utf-8")
+        table = load_table(str(path))
+        assert table.header == ("name", "salary")
+        assert table.as_dicts() == [{"name": "Ann", "salary": "10"}, {"name": "Bob", "salary": "20"}]
+    
+    def test_json_records(self, tmp_path):
+        """Test that a JSON list of objects gets the union of their keys as header."""
+        path = tmp_path / "people.json"
+        path.write_text(json.dumps([{"name": "Ann"}, {"name": "Bob", "salary": 20}]), encoding="utf-8")
+        table = load_table(str(path))
+        assert table.header == ("name", "salary")
+        assert table.as_dicts() == [{"name": "Ann", "salary": None}, {"name": "Bob", "salary": 20}]
+    
+    def test_json_header_and_rows(self, tmp_path):
+        """Test the compact JSON format with a header and row lists."""
+        path = tmp_path / "people.json"
+        path.write_text(json.dumps({"header": ["name"], "rows": [["Ann"], ["Bob"]]}), encoding="utf-8")
+        assert load_table(str(path)).column("name") == ["Ann", "Bob"]
+    
+    def test_jsonl(self, tmp_path):
+        """Test that JSONL files are parsed one object per line, skipping blank lines."""
+        path = tmp_path / "people.jsonl"
+        path.write_text('{"name": "Ann"}\n\n{"name": "Bob"}\n', encoding="utf-8")
+        assert load_table(str(path)).column("name") == ["Ann", "Bob"]
+    
+    def test_unsupported_format(self, tmp_path):
+        """Test that unknown file extensions are rejected."""
+        path = tmp_path / "people.txt"
+        path.write_text("Ann\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_table(str(path))
+    
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test that loading an unchanged file returns the cached table."""
+        path = tmp_path / "people.csv"
+        path.write_text("name\nAnn\n", encoding="utf-8")
+        assert load_table(str(path)) is load_table(str(path))
+    
+    def test_changed_file_is_parsed_again(self, tmp_path):
+        """Test that a modified file is not served from the cache."""
+        path = tmp_path / "people.csv"
+        path.write_text("name\nAnn\n", encoding="utf-8")
+        first = load_table(str(path))
+        path.write_text("name\nAnn\nBob\n", encoding="utf-8")
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = load_table(str(path))
+        assert second is not first
+        assert second.column("name") == ["Ann", "Bob"]
+    
+    def test_clear_cache(self, tmp_path):
+        """Test that clear_cache forces the next load to parse the file."""
+        path = tmp_path / "people.csv"
+        path.write_text("name\nAnn\n", encoding="utf-8")
+        first = load_table(str(path))
+        clear_cache()
+        assert load_table(str(path)) is not first
@@ -0,0 +1,105 @@
+import json
+import pytest
+from selenium_tests.test_data.data_stream import DataSource, RowRef, parse_slice
+
+@pytest.fixture
+def csv_source(tmp_path):
+    path = tmp_path / "employees.csv"
+    lines = ["name,salary"]
+    for number in range(20):
+        lines.append(f"Employee {number},{number * 1000}")
+        if number % 5 == 0:
+            lines.append("")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return DataSource(str(path))
+
+class TestParseSlice:
+    """
+    Tests for parsing --data-slice values.
+    """
+    
+    @pytest.mark.parametrize("text, expected", [
+        ("0:10", slice(0, 10)),
+        (":5", slice(None, 5)),
+        ("5:", slice(5, None)),
+        ("::10", slice(None, None, 10)),
+        ("-3:", slice(-3, None)),
+        ("1:9:2", slice(1, 9, 2)),
+    ])
+    def test_valid(self, text, expected):
+        """Test that start:stop[:step] values are parsed into slices."""
+        assert parse_slice(text) == expected
+    
+    @pytest.mark.parametrize("text", ["10", "1:2:3:4", "a:b", "1.5:2", "::0"])
+    def test_invalid(self, text):
+        """Test that malformed values, non-integers and a zero step are rejected."""
+        with pytest.raises(ValueError):
+            parse_slice(text)
+
+class TestDataSource:
+    """
+    Tests for streaming rows out of large data files.
+    """
+    
+    def test_count_skips_header_and_blank_lines(self, csv_source):
+        """Test that only data rows are counted."""
+        assert csv_source.count() == 20
+    
+    def test_load_reads_one_row(self, csv_source):
+        """Test that rows are loaded by number, past blank lines."""
+        assert csv_source.load(0) == {"name": "Employee 0", "salary": "0"}
+        assert csv_source.load(6) == {"name": "Employee 6", "salary": "6000"}
+        assert csv_source.load(19) == {"name": "Employee 19", "salary": "19000"}
+    
+    def test_jsonl(self, tmp_path):
+        """Test that JSONL rows are counted and loaded, skipping blank lines."""
+        path = tmp_path / "invalid.jsonl"
+        path.write_text("\n".join([json.dumps({"number": 0}), "", json.dumps({"number": 1}), ""]),
+                        encoding="utf-8")
+        source = DataSource(str(path))
+        assert source.count() == 2
+        assert source.load(1) == {"number": 1}
+    
+    def test_unsupported_format(self, tmp_path):
+        """Test that only CSV and JSONL files can be streamed."""
+        with pytest.raises(ValueError):
+            DataSource(str(tmp_path / "employees.json"))
+    
+    @pytest.mark.parametrize("data_slice", [
+        None, slice(0, 5), slice(3, 12, 2), slice(15, 100), slice(-4, None), slice(None, -15), slice(None, None, -5),
+    ])
+    def test_select_slice(self, csv_source, data_slice):
+        """Test that the selected row numbers match slicing all rows."""
+        expected = list(range(20)) if data_slice is None else list(range(20))[data_slice]
+        assert csv_source.select(data_slice) == expected
+    
+    def test_bounded_slice_indexes_only_up_to_its_stop(self, csv_source):
+        """Test that a slice with a stop bound does not index the rest of the file."""
+        assert csv_source.select(slice(0, 3)) == [0, 1, 2]
+        assert len(csv_source._offsets) == 3
+        # The partial index is extended on demand
+        assert csv_source.load(10) == {"name": "Employee 10", "salary": "10000"}
+        assert csv_source.count() == 20
+    
+    def test_sample_is_seeded(self, csv_source):
+        """Test that sampling with the same seed selects the same rows in file order."""
+        first = csv_source.select(sample=5, seed="run")
+        assert first == csv_source.select(sample=5, seed="run")
+        assert first == sorted(first)
+        assert len(set(first)) == 5
+    
+    def test_sample_is_taken_from_the_slice(self, csv_source):
+        """Test that sampling picks from the sliced rows only."""
+        selected = csv_source.select(slice(10, 20), sample=4, seed=1)
+        assert len(selected) == 4
+        assert all(10 <= number < 20 for number in selected)
+    
+    def test_sample_larger_than_the_slice(self, csv_source):
+        """Test that asking for more rows than there are selects them all."""
+        assert csv_source.select(slice(0, 3), sample=10, seed=1) == [0, 1, 2]
+    
+    def test_row_ref(self, csv_source):
+        """Test that a row reference names its test and loads its row lazily."""
+        row = RowRef(csv_source, 4)
+        assert row.id == "employees-4"
+        assert row.load() == {"name": "Employee 4", "salary": "4000"}
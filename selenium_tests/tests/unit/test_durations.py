@@ -0,0 +1,65 @@
+import json
+import pytest
+from selenium_tests.support.durations import DurationHistory
+
+class FakeCache:
+    """Stands in for config.cache: values are stored as JSON like pytest does."""
+    
+    def __init__(self, values=None):
+        self.values = {key: json.dumps(value) for key, value in (values or {}).items()}
+    
+    def get(self, key, default):
+        return json.loads(self.values[key]) if key in self.values else default
+    
+    def set(self, key, value):
+        self.values[key] = json.dumps(value)
+
+class TestDurationHistory:
+    """
+    Tests for the per-test duration history.
+    """
+    
+    def test_empty_history(self):
+        """Test that a new cache gives an empty, falsy history with zero estimates."""
+        history = DurationHistory(FakeCache())
+        assert not history
+        assert history.estimates(["test_a"]) == [0.0]
+    
+    def test_phases_add_up(self):
+        """Test that setup, call and teardown durations are summed per test."""
+        cache = FakeCache()
+        history = DurationHistory(cache)
+        for duration in (0.5, 1.0, 0.25):
+            history.add("test_a", duration)
+        history.save()
+        assert DurationHistory(cache).durations == {"test_a": 1.75}
+    
+    def test_new_measurement_is_blended(self):
+        """Test that a known duration moves halfway to the new measurement."""
+        cache = FakeCache({DurationHistory.CACHE_KEY: {"test_a": 2.0}})
+        history = DurationHistory(cache)
+        history.add("test_a", 4.0)
+        history.save()
+        assert DurationHistory(cache).durations == {"test_a": 3.0}
+    
+    def test_tests_not_run_keep_their_history(self):
+        """Test that deselected tests are not forgotten."""
+        cache = FakeCache({DurationHistory.CACHE_KEY: {"test_a": 2.0, "test_b": 1.0}})
+        history = DurationHistory(cache)
+        history.add("test_a", 2.0)
+        history.save()
+        assert DurationHistory(cache).durations == {"test_a": 2.0, "test_b": 1.0}
+    
+    def test_unknown_tests_are_estimated_as_the_mean(self):
+        """Test that tests without history get the mean known duration."""
+        history = DurationHistory(FakeCache({DurationHistory.CACHE_KEY: {"test_a": 1.0, "test_b": 3.0}}))
+        assert bool(history)
+        assert history.estimates(["test_b", "test_new", "test_a"]) == [3.0, 2.0, 1.0]
+    
+    def test_durations_are_rounded(self):
+        """Test that saved durations are rounded to keep the cache file small."""
+        cache = FakeCache()
+        history = DurationHistory(cache)
+        history.add("test_a", 0.123456789)
+        history.save()
+        assert DurationHistory(cache).durations["test_a"] == pytest.approx(0.1235)
@@ -0,0 +1,213 @@
+import pytest
+from selenium.common.exceptions import (
+    JavascriptException, NoSuchElementException, StaleElementReferenceException, WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from selenium_tests.page_objects.base_page import BasePage
+from selenium_tests.support.ems_standin import StandinServer
+from selenium_tests.support.http_driver import HttpDriver
+from selenium_tests.support.instrumentation import StepRecorder
+
+@pytest.fixture(scope="module")
+def standin():
+    server = StandinServer().start()
+    server.store.save_employee({"name": "Jane Smith", "email": "jane@example.com", "salary": "50000",
+                                "department": str(server.store.find_department_id("Engineering")),
+                                "status": "Active"})
+    server.snapshot()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def http_driver(standin):
+    driver = HttpDriver(standin.url)
+    yield driver
+    driver.quit()
+    standin.restore()
+
+class TestHttpDriverNavigation:
+    """
+    Tests for loading pages, following links and history.
+    """
+    
+    def test_starts_blank(self, http_driver):
+        """Test that a new driver shows about:blank."""
+        assert http_driver.current_url == "about:blank"
+        assert http_driver.find_elements(By.TAG_NAME, "a") == []
+    
+    def test_get(self, standin, http_driver):
+        """Test that a page is loaded with its URL and title."""
+        http_driver.get(f"{standin.url}/")
+        assert http_driver.current_url == f"{standin.url}/"
+        assert http_driver.title == "Employee Management System"
+    
+    def test_click_link_and_history(self, standin, http_driver):
+        """Test that links are followed and back/forward move through the history."""
+        http_driver.get(f"{standin.url}/")
+        http_driver.find_element(By.LINK_TEXT, "Employees").click()
+        assert http_driver.current_url == f"{standin.url}/employees/"
+        http_driver.back()
+        assert http_driver.current_url == f"{standin.url}/"
+        http_driver.forward()
+        assert http_driver.current_url == f"{standin.url}/employees/"
+    
+    def test_elements_go_stale_after_navigation(self, standin, http_driver):
+        """Test that elements of an earlier page raise StaleElementReferenceException."""
+        http_driver.get(f"{standin.url}/")
+        heading = http_driver.find_element(By.TAG_NAME, "h1")
+        http_driver.refresh()
+        with pytest.raises(StaleElementReferenceException):
+            heading.text
+    
+    def test_download_keeps_the_page(self, standin, http_driver):
+        """Test that a link returning a file is saved instead of shown."""
+        http_driver.get(f"{standin.url}/employees/")
+        http_driver.find_element(By.PARTIAL_LINK_TEXT, "Export").click()
+        assert http_driver.current_url == f"{standin.url}/employees/"
+        assert len(http_driver.downloads) == 1
+        assert "Jane Smith" in http_driver.downloads[0].text
+    
+    def test_requests_are_recorded_as_commands(self, standin, http_driver):
+        """Test that every HTTP request counts as one command."""
+        recorder = http_driver.step_recorder = StepRecorder()
+        http_driver.get(f"{standin.url}/")
+        http_driver.find_element(By.LINK_TEXT, "Departments").click()
+        assert recorder.commands == 2
+
+class TestHttpDriverElements:
+    """
+    Tests for finding elements and reading them.
+    """
+    
+    @pytest.mark.parametrize("by, value", [
+        (By.ID, "id_name"),
+        (By.NAME, "name"),
+        (By.CSS_SELECTOR, "form input#id_name"),
+        (By.XPATH, "//input[@id='id_name']"),
+        (By.CLASS_NAME, "form-control"),
+        (By.TAG_NAME, "input"),
+    ])
+    def test_locator_strategies(self, standin, http_driver, by, value):
+        """Test that every locator strategy finds the form's first text field."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        found = http_driver.find_element(by, value)
+        if by == By.TAG_NAME:
+            # The hidden CSRF field comes first
+            found = http_driver.find_elements(by, value)[1]
+        assert found == http_driver.find_element(By.ID, "id_name")
+    
+    def test_missing_element(self, standin, http_driver):
+        """Test that a missing element raises NoSuchElementException."""
+        http_driver.get(f"{standin.url}/")
+        with pytest.raises(NoSuchElementException):
+            http_driver.find_element(By.ID, "missing")
+    
+    def test_relative_find(self, standin, http_driver):
+        """Test that element searches are limited to the element's subtree."""
+        http_driver.get(f"{standin.url}/employees/")
+        row = http_driver.find_element(By.XPATH, "//table/tbody/tr")
+        assert [cell.text for cell in row.find_elements(By.TAG_NAME, "td")][:2] == ["Jane Smith", "jane@example.com"]
+    
+    def test_rendered_text(self, standin, http_driver):
+        """Test that text is rendered like a browser's innerText, without hidden content."""
+        http_driver.get(f"{standin.url}/")
+        body = http_driver.find_element(By.TAG_NAME, "body").text
+        assert "Welcome to the Employee Management System" in body
+        assert "\n" in body
+    
+    def test_hidden_input_is_not_displayed(self, standin, http_driver):
+        """Test that hidden inputs are reported as not displayed."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        assert not http_driver.find_element(By.NAME, "csrfmiddlewaretoken").is_displayed()
+        assert http_driver.find_element(By.ID, "id_name").is_displayed()
+    
+    def test_href_is_absolute(self, standin, http_driver):
+        """Test that link targets are resolved against the current URL."""
+        http_driver.get(f"{standin.url}/")
+        link = http_driver.find_element(By.LINK_TEXT, "Departments")
+        assert link.get_attribute("href") == f"{standin.url}/departments/"
+
+class TestHttpDriverForms:
+    """
+    Tests for typing into forms and submitting them.
+    """
+    
+    def fill_employee(self, http_driver, name):
+        """Fill the employee form the way the page objects' keys strategy does."""
+        http_driver.find_element(By.ID, "id_name").send_keys(name)
+        http_driver.find_element(By.ID, "id_email").send_keys("new.person@example.com")
+        http_driver.find_element(By.XPATH, "//select[@id='id_department']/option[text()='Engineering']").click()
+        http_driver.find_element(By.ID, "id_salary").send_keys("60000")
+        http_driver.find_element(By.ID, "id_status_inactive").click()
+    
+    def test_field_values(self, standin, http_driver):
+        """Test that typed text, selected options and checked radios are read back."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        self.fill_employee(http_driver, "New Person")
+        assert http_driver.find_element(By.ID, "id_name").get_attribute("value") == "New Person"
+        department = http_driver.find_element(By.ID, "id_department").get_attribute("value")
+        assert department == str(standin.store.find_department_id("Engineering"))
+        assert http_driver.find_element(By.ID, "id_status_inactive").is_selected()
+        assert not http_driver.find_element(By.ID, "id_status_active").is_selected()
+        http_driver.find_element(By.ID, "id_name").clear()
+        assert http_driver.find_element(By.ID, "id_name").get_attribute("value") == ""
+    
+    def test_post_form(self, standin, http_driver):
+        """Test that submitting a form posts it and follows the redirect."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        self.fill_employee(http_driver, "New Person")
+        http_driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        assert http_driver.current_url == f"{standin.url}/employees/"
+        assert "Employee created successfully." in http_driver.find_element(By.CLASS_NAME, "alert").text
+        employee = next(employee for employee in standin.store.list_employees() if employee["name"] == "New Person")
+        assert employee["status"] == "Inactive"
+    
+    def test_invalid_form_stays_on_the_page(self, standin, http_driver):
+        """Test that rejected form data is shown with its validation errors."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        http_driver.find_element(By.XPATH, "//button[@type='submit']").click()
+        assert http_driver.current_url == f"{standin.url}/employees/create/"
+        errors = [error.text for error in http_driver.find_elements(By.CLASS_NAME, "invalid-feedback")]
+        assert "This field is required." in errors
+    
+    def test_enter_submits_get_form(self, standin, http_driver):
+        """Test that pressing Enter in a field submits its GET form as a query string."""
+        http_driver.get(f"{standin.url}/employees/")
+        http_driver.find_element(By.NAME, "q").send_keys("Nobody", Keys.ENTER)
+        assert http_driver.current_url.startswith(f"{standin.url}/employees/?q=Nobody")
+        assert "No employees found" in http_driver.find_element(By.TAG_NAME, "tbody").text
+    
+    def test_delete_all_cookies(self, standin, http_driver):
+        """Test that the session cookies can be cleared."""
+        http_driver.get(f"{standin.url}/employees/create/")
+        assert http_driver.session.cookies
+        http_driver.delete_all_cookies()
+        assert not http_driver.session.cookies
+
+class TestHttpDriverScripts:
+    """
+    Tests for the BasePage scripts HttpDriver runs in Python.
+    """
+    
+    def test_read_table_script(self, standin, http_driver):
+        """Test that the table read script returns every row's cell texts."""
+        http_driver.get(f"{standin.url}/employees/")
+        rows = http_driver.execute_script(BasePage.READ_TABLE_SCRIPT, By.XPATH, "//table/tbody/tr")
+        assert rows == [["Jane Smith", "jane@example.com", "Engineering", "$50000.00", "Active", "Edit Delete"]]
+    
+    def test_read_table_script_without_rows(self, standin, http_driver):
+        """Test that the table read script returns None when no row matches, like the browser version."""
+        http_driver.get(f"{standin.url}/")
+        assert http_driver.execute_script(BasePage.READ_TABLE_SCRIPT, By.CSS_SELECTOR, "table tr") is None
+    
+    def test_ready_state(self, standin, http_driver):
+        """Test that pages are always complete."""
+        assert http_driver.execute_script(BasePage.READY_STATE_SCRIPT) == "complete"
+    
+    def test_other_javascript(self, http_driver):
+        """Test that arbitrary JavaScript and DevTools commands are rejected."""
+        with pytest.raises(JavascriptException):
+            http_driver.execute_script("return document.title;")
+        with pytest.raises(WebDriverException):
+            http_driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
@@ -0,0 +1,147 @@
+import pytest
+from lxml import html
+from lxml.cssselect import CSSSelector
+from selenium.webdriver.common.by import By
+from selenium_tests.page_objects.locators import (
+    LocatorTemplate, compile_locator, css_literal, xpath_literal, xpath_to_css,
+)
+
+PAGE = html.fromstring("""
+<html><body>
+  <form id="employee-form">
+    <label for="name">Name</label><input id="name" name="name">
+    <label for="email">Email</label><input id="email" name="email" class="wide field">
+    <button type="submit" class="btn btn-primary">Save</button>
+  </form>
+  <table class="table">
+    <tbody>
+      <tr><td>Jane Smith</td><td><a href="/employees/1/edit/">Edit</a></td></tr>
+      <tr><td>O'Brien "Bob"</td><td><a href="/employees/2/edit/">Edit</a></td></tr>
+    </tbody>
+  </table>
+</body></html>
+""")
+
+class TestXpathToCss:
+    """
+    Tests for translating XPath locators into CSS selectors.
+    """
+    
+    @pytest.mark.parametrize("xpath, css", [
+        ("//input[@id='name']", "input#name"),
+        ("//*[@id='name']", "#name"),
+        ("//table/tbody/tr", "table > tbody > tr"),
+        ("//form//input", "form input"),
+        ("//button[@type='submit' and @class='btn btn-primary']", "button[type='submit'][class='btn btn-primary']"),
+        ("//label/following-sibling::input", "label ~ input"),
+        ("//*[@id='1x']", "[id='1x']"),
+    ])
+    def test_translated(self, xpath, css):
+        """Test the XPath subset that has an exact CSS counterpart."""
+        assert xpath_to_css(xpath) == css
+    
+    @pytest.mark.parametrize("xpath", [
+        "//td[text()='Jane Smith']",
+        "//tr[2]",
+        "//a/..",
+        "/html/body",
+        "//input[contains(@class, 'wide')]",
+        "//label//following-sibling::input",
+    ])
+    def test_not_translated(self, xpath):
+        """Test that XPaths needing XPath features are left alone."""
+        assert xpath_to_css(xpath) is None
+    
+    @pytest.mark.parametrize("xpath", [
+        "//input[@id='name']",
+        "//table/tbody/tr",
+        "//form//input",
+        "//input[@class='wide field']",
+        "//label/following-sibling::input",
+        "//button[@type='submit' and @class='btn btn-primary']",
+    ])
+    def test_translation_matches_the_same_elements(self, xpath):
+        """Test that the CSS selector matches exactly the elements the XPath matches."""
+        assert CSSSelector(xpath_to_css(xpath))(PAGE) == PAGE.xpath(xpath)
+
+class TestCompileLocator:
+    """
+    Tests for choosing the cheapest locator strategy.
+    """
+    
+    def test_id(self):
+        """Test that an XPath by id becomes By.ID."""
+        assert compile_locator(By.XPATH, "//*[@id='save']") == (By.ID, "save")
+    
+    def test_css(self):
+        """Test that a translatable XPath becomes a CSS selector."""
+        assert compile_locator(By.XPATH, "//table/tbody/tr") == (By.CSS_SELECTOR, "table > tbody > tr")
+    
+    def test_xpath_kept(self):
+        """Test that XPaths without a CSS counterpart and other strategies are unchanged."""
+        assert compile_locator(By.XPATH, "//td[text()='a']") == (By.XPATH, "//td[text()='a']")
+        assert compile_locator(By.NAME, "email") == (By.NAME, "email")
+
+class TestLiterals:
+    """
+    Tests for quoting values inside locators.
+    """
+    
+    @pytest.mark.parametrize("value, literal", [
+        ("Jane", "'Jane'"),
+        ("O'Brien", "\"O'Brien\""),
+        ('Say "hi"', "'Say \"hi\"'"),
+        ("O'Brien \"Bob\"", "concat('O', \"'\", 'Brien \"Bob\"')"),
+    ])
+    def test_xpath_literal(self, value, literal):
+        """Test that values are quoted with whichever quote they do not contain."""
+        assert xpath_literal(value) == literal
+    
+    @pytest.mark.parametrize("value", ["Jane Smith", "O'Brien \"Bob\"", "a'b'c\"d"])
+    def test_xpath_literal_evaluates_to_the_value(self, value):
+        """Test that the quoted literal evaluates to the original text."""
+        assert PAGE.xpath(f"string({xpath_literal(value)})") == value
+    
+    def test_css_literal(self):
+        """Test that quotes and backslashes are escaped in CSS strings."""
+        assert css_literal("O'Brien \\") == "'O\\'Brien \\\\'"
+
+class TestLocatorTemplate:
+    """
+    Tests for locator templates.
+    """
+    
+    def test_xpath_format_finds_names_with_quotes(self):
+        """Test that a formatted XPath template matches a name containing both quotes."""
+        template = LocatorTemplate(By.XPATH, "//table/tbody/tr[td[text()={}]]")
+        by, value = template.format("O'Brien \"Bob\"")
+        assert by == By.XPATH
+        assert len(PAGE.xpath(value)) == 1
+    
+    def test_css_format(self):
+        """Test that CSS templates quote their values as CSS strings."""
+        template = LocatorTemplate(By.CSS_SELECTOR, "input[name={}]")
+        assert template.format("email") == (By.CSS_SELECTOR, "input[name='email']")
+    
+    def test_several_placeholders(self):
+        """Test that values fill the placeholders in order."""
+        template = LocatorTemplate(By.XPATH, "//tr[td[text()={}] and td[text()={}]]")
+        assert template.format("a", "b") == (By.XPATH, "//tr[td[text()='a'] and td[text()='b']]")
+    
+    @pytest.mark.parametrize("values", [(), ("a", "b")])
+    def test_wrong_number_of_values(self, values):
+        """Test that the number of values must match the placeholders."""
+        template = LocatorTemplate(By.XPATH, "//td[text()={}]")
+        with pytest.raises(ValueError):
+            template.format(*values)
+    
+    @pytest.mark.parametrize("by, template", [
+        (By.ID, "{}"),
+        (By.XPATH, "//td[text()={name}]"),
+        (By.XPATH, "//td[text()={0}]"),
+        (By.XPATH, "//td[text()={!r}]"),
+    ])
+    def test_invalid_templates(self, by, template):
+        """Test that only XPath and CSS templates with '{}' placeholders are accepted."""
+        with pytest.raises(ValueError):
+            LocatorTemplate(by, template)
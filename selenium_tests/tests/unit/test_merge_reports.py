@@ -0,0 +1,163 @@
+import html
+import json
+import xml.etree.ElementTree as ET
+import pytest
+from selenium_tests.support.merge_reports import (
+    HTML_BLOB, check_shards, junit_durations, merge_html, merge_json, merge_junit,
+)
+
+def write_junit(path, cases, time):
+    """Write a pytest (xunit1) JUnit report with (name, outcome) test cases."""
+    suite = ET.Element("testsuite", name="pytest", tests=str(len(cases)), time=str(time),
+                       failures=str(sum(outcome == "failed" for _, outcome in cases)), errors="0", skipped="0")
+    for name, outcome in cases:
+        testcase = ET.SubElement(suite, "testcase", classname="selenium_tests.tests.test_x.TestX", name=name,
+                                 file="selenium_tests/tests/test_x.py", time="1.5")
+        if outcome == "failed":
+            ET.SubElement(testcase, "failure", message="assert 0")
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.ElementTree(root).write(path)
+    return str(path)
+
+def write_json(path, nodeids, duration):
+    """Write a pytest-json-report style report in which every test passed."""
+    path.write_text(json.dumps({
+        "created": 1.0,
+        "duration": duration,
+        "summary": {"passed": len(nodeids), "total": len(nodeids)},
+        "tests": [{"nodeid": nodeid, "outcome": "passed"} for nodeid in nodeids],
+    }))
+    return str(path)
+
+OUTCOMES = ("failed", "passed", "skipped", "xfailed", "xpassed", "error", "rerun")
+
+def write_html(path, results, took):
+    """Write the parts of a pytest-html 4 report that merge_html reads and rewrites."""
+    tests = {nodeid: [{"testId": nodeid, "result": result}] for nodeid, result in results.items()}
+    counts = {outcome: list(results.values()).count(outcome.capitalize()) for outcome in OUTCOMES}
+    filters = "\n".join(
+        f'<input checked="true" class="filter" type="checkbox" data-test-result="{outcome}"'
+        f'{"" if counts[outcome] else " disabled"}/>\n<span class="{outcome}">{counts[outcome]} {outcome},</span>'
+        for outcome in OUTCOMES)
+    path.write_text(
+        f'<html><body>\n<p class="run-count">{len(results)} tests took {took}.</p>\n{filters}\n'
+        f'<div id="data-container" data-jsonblob="{html.escape(json.dumps({"tests": tests}))}"></div>\n'
+        f'</body></html>', encoding="utf-8")
+    return str(path)
+
+class TestCheckShards:
+    """
+    Tests for the shard completeness check.
+    """
+    
+    def test_disjoint_shards(self):
+        """Test that shards with distinct tests and the expected total pass."""
+        check_shards([("a.xml", ["t1", "t2"]), ("b.xml", ["t3"])], expected_tests=3)
+    
+    def test_overlap(self):
+        """Test that a test run by two shards is reported."""
+        with pytest.raises(ValueError, match="more than one shard"):
+            check_shards([("a.xml", ["t1", "t2"]), ("b.xml", ["t2"])])
+    
+    def test_same_path_given_twice(self):
+        """Test that passing one report twice counts as an overlap."""
+        with pytest.raises(ValueError, match="more than one shard"):
+            check_shards([("a.xml", ["t1"]), ("a.xml", ["t1"])])
+    
+    def test_missing_tests(self):
+        """Test that a total below expected_tests is reported."""
+        with pytest.raises(ValueError, match="expected 3"):
+            check_shards([("a.xml", ["t1"]), ("b.xml", ["t2"])], expected_tests=3)
+
+class TestMergeJunit:
+    """
+    Tests for merging JUnit XML reports.
+    """
+    
+    def test_totals(self, tmp_path):
+        """Test that shard suites are kept and their counts and times added up."""
+        first = write_junit(tmp_path / "shard-1.xml", [("test_a", "passed"), ("test_b", "failed")], 3.0)
+        second = write_junit(tmp_path / "shard-2.xml", [("test_c", "passed")], 1.5)
+        root = merge_junit([first, second], expected_tests=3).getroot()
+        assert root.get("tests") == "3"
+        assert root.get("failures") == "1"
+        assert root.get("time") == "4.500"
+        assert len(root.findall("testsuite")) == 2
+    
+    def test_overlapping_shards(self, tmp_path):
+        """Test that the same test in two shard reports is rejected."""
+        first = write_junit(tmp_path / "shard-1.xml", [("test_a", "passed")], 1.0)
+        second = write_junit(tmp_path / "shard-2.xml", [("test_a", "passed")], 1.0)
+        with pytest.raises(ValueError):
+            merge_junit([first, second])
+    
+    def test_durations(self, tmp_path):
+        """Test that per-test durations are keyed by pytest node id."""
+        report = write_junit(tmp_path / "shard-1.xml", [("test_a", "passed")], 1.5)
+        assert junit_durations(merge_junit([report])) == {
+            "selenium_tests/tests/test_x.py::TestX::test_a": 1.5,
+        }
+    
+    def test_durations_need_the_file_attribute(self):
+        """Test that xunit2 reports, which have no file attribute, are rejected."""
+        tree = ET.ElementTree(ET.fromstring('<testsuite><testcase classname="a" name="b"/></testsuite>'))
+        with pytest.raises(ValueError, match="xunit1"):
+            junit_durations(tree)
+
+class TestMergeJson:
+    """
+    Tests for merging JSON reports.
+    """
+    
+    def test_merge(self, tmp_path):
+        """Test that tests are concatenated, counts added and the longest duration kept."""
+        first = write_json(tmp_path / "shard-1.json", ["t1", "t2"], 4.0)
+        second = write_json(tmp_path / "shard-2.json", ["t3"], 6.0)
+        merged = merge_json([first, second], expected_tests=3)
+        assert [test["nodeid"] for test in merged["tests"]] == ["t1", "t2", "t3"]
+        assert merged["summary"] == {"passed": 3, "total": 3}
+        assert merged["duration"] == 6.0
+        assert merged["shards"] == [first, second]
+    
+    def test_missing_tests(self, tmp_path):
+        """Test that a shard missing from the merge is reported."""
+        first = write_json(tmp_path / "shard-1.json", ["t1"], 1.0)
+        with pytest.raises(ValueError):
+            merge_json([first], expected_tests=2)
+
+class TestMergeHtml:
+    """
+    Tests for merging pytest-html reports.
+    """
+    
+    def test_merge(self, tmp_path):
+        """Test that test data is united and the summary counts are redone."""
+        first = write_html(tmp_path / "shard-1.html", {"t1": "Passed", "t2": "Failed"}, "00:00:04")
+        second = write_html(tmp_path / "shard-2.html", {"t3": "Passed"}, "00:00:06")
+        page = merge_html([first, second], expected_tests=3)
+        data = json.loads(html.unescape(HTML_BLOB.search(page).group(2)))
+        assert sorted(data["tests"]) == ["t1", "t2", "t3"]
+        assert '<span class="passed">2' in page
+        assert '<span class="failed">1' in page
+        assert 'data-test-result="skipped" disabled/>' in page
+    
+    def test_duration_is_the_longest_shard(self, tmp_path):
+        """Test that the run time is the longest shard's, as in merge_json."""
+        first = write_html(tmp_path / "shard-1.html", {"t1": "Passed"}, "00:01:00")
+        second = write_html(tmp_path / "shard-2.html", {"t2": "Passed"}, "00:00:30")
+        page = merge_html([first, second])
+        assert '<p class="run-count">2 tests took 00:01:00 in 2 shards.</p>' in page
+    
+    def test_millisecond_durations(self, tmp_path):
+        """Test that short runs keep the millisecond format."""
+        first = write_html(tmp_path / "shard-1.html", {"t1": "Passed"}, "250 ms")
+        second = write_html(tmp_path / "shard-2.html", {"t2": "Passed"}, "400 ms")
+        assert "2 tests took 400 ms in 2 shards." in merge_html([first, second])
+    
+    def test_not_a_pytest_html_report(self, tmp_path):
+        """Test that other HTML files are rejected."""
+        path = tmp_path / "other.html"
+        path.write_text("<html></html>")
+        with pytest.raises(ValueError, match="pytest-html 4"):
+            merge_html([str(path)])
@@ -0,0 +1,73 @@
+import json
+import random
+import pytest
+from selenium_tests.support.sharding import load_durations, parse_shard, plan_shards
+
+class TestParseShard:
+    """
+    Tests for parsing --shard values.
+    """
+    
+    @pytest.mark.parametrize("text, expected", [("1/1", (1, 1)), ("2/4", (2, 4)), ("4/4", (4, 4))])
+    def test_valid(self, text, expected):
+        """Test that i/N values are parsed with a 1-based index."""
+        assert parse_shard(text) == expected
+    
+    @pytest.mark.parametrize("text", ["0/4", "5/4", "1/0", "2", "a/b", "1/2/3"])
+    def test_invalid(self, text):
+        """Test that malformed values and out-of-range indexes are rejected."""
+        with pytest.raises(ValueError):
+            parse_shard(text)
+
+class TestPlanShards:
+    """
+    Tests for the offline shard planner.
+    """
+    
+    NODEIDS = [f"selenium_tests/tests/test_module_{number % 5}.py::test_{number}" for number in range(40)]
+    
+    def test_every_test_in_exactly_one_shard(self):
+        """Test that the shards partition the collected tests."""
+        shards = plan_shards(self.NODEIDS, {}, 3)
+        planned = [nodeid for shard in shards for nodeid in shard]
+        assert sorted(planned) == sorted(self.NODEIDS)
+    
+    def test_same_input_in_any_order_gives_the_same_plan(self):
+        """Test that every node computes the same plan regardless of collection order."""
+        durations = {nodeid: (index * 7 % 11) / 10 for index, nodeid in enumerate(self.NODEIDS)}
+        expected = plan_shards(self.NODEIDS, durations, 4)
+        shuffled = list(self.NODEIDS)
+        random.Random(3).shuffle(shuffled)
+        assert plan_shards(shuffled, dict(reversed(list(durations.items()))), 4) == expected
+    
+    def test_ties_are_broken_by_test_id(self):
+        """Test that equal durations still produce a stable plan."""
+        assert plan_shards(["b", "a", "d", "c"], {}, 2) == [["a", "c"], ["b", "d"]]
+    
+    def test_shards_are_balanced_by_duration(self):
+        """Test that the longest tests are spread over the shards first."""
+        durations = {"slow": 10.0, "medium": 6.0, "fast_1": 2.0, "fast_2": 2.0}
+        shards = plan_shards(list(durations), durations, 2)
+        assert shards == [["slow"], ["medium", "fast_1", "fast_2"]]
+    
+    def test_unknown_tests_count_as_the_mean(self):
+        """Test that tests without a duration weigh the mean known duration."""
+        durations = {"known_slow": 9.0, "known_fast": 1.0}
+        shards = plan_shards(["known_slow", "known_fast", "new"], durations, 2)
+        # 'new' weighs 5.0, so it goes before 'known_fast'
+        assert shards == [["known_slow"], ["new", "known_fast"]]
+    
+    def test_more_shards_than_tests(self):
+        """Test that surplus shards are empty."""
+        assert plan_shards(["a"], {}, 3) == [["a"], [], []]
+
+class TestLoadDurations:
+    """
+    Tests for reading frozen durations files.
+    """
+    
+    def test_load(self, tmp_path):
+        """Test that a durations file is read as seconds by test id."""
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({"test_a": 1.5}))
+        assert load_durations(str(path)) == {"test_a": 1.5}
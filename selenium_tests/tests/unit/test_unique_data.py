@@ -0,0 +1,100 @@
+import threading
+from selenium_tests.test_data.unique_data import (
+    DEPARTMENT_NAMES, STATUSES, UniqueDataGenerator, get_generator, set_generator,
+)
+
+class TestUniqueDataGenerator:
+    """
+    Tests for the run-unique test data generator.
+    """
+    
+    def test_tags_carry_run_worker_and_counter(self):
+        """Test that tags are built from the run id, the worker id and a counter."""
+        generator = UniqueDataGenerator(worker_id="gw1", run_id="abc123")
+        assert generator.tags(3) == ["abc123-gw1-1", "abc123-gw1-2", "abc123-gw1-3"]
+        assert generator.tag() == "abc123-gw1-4"
+    
+    def test_children_share_the_counter(self):
+        """Test that per-test generators never reuse their parent's tags."""
+        base = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        first = base.for_test("test_a")
+        second = base.for_test("test_b")
+        tags = first.tags(2) + second.tags(2) + base.tags(2)
+        assert len(set(tags)) == 6
+    
+    def test_tags_are_unique_across_threads(self):
+        """Test that concurrent tag reservations do not collide."""
+        generator = UniqueDataGenerator(worker_id="gw0", run_id="run")
+        tags = []
+        
+        def reserve():
+            tags.extend(generator.tags(100))
+        
+        threads = [threading.Thread(target=reserve) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(tags)) == 800
+    
+    def test_same_seed_and_test_id_give_the_same_data(self):
+        """Test that a test sees the same random values on every run with the same seed."""
+        first = UniqueDataGenerator(seed="s", worker_id="gw0", run_id="run").for_test("test_x")
+        second = UniqueDataGenerator(seed="s", worker_id="gw0", run_id="run").for_test("test_x")
+        assert first.employees(5, DEPARTMENT_NAMES) == second.employees(5, DEPARTMENT_NAMES)
+    
+    def test_different_test_ids_give_different_data(self):
+        """Test that each test gets its own random stream."""
+        base = UniqueDataGenerator(seed="s", worker_id="gw0", run_id="run")
+        first = [employee["salary"] for employee in base.for_test("test_x").employees(5, DEPARTMENT_NAMES)]
+        second = [employee["salary"] for employee in base.for_test("test_y").employees(5, DEPARTMENT_NAMES)]
+        assert first != second
+    
+    def test_email_contains_the_name_tag_once(self):
+        """Test that an email based on a unique name does not repeat its tag."""
+        generator = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        tag = generator.tag()
+        name = generator.name(tag)
+        local_part = generator.email(name, tag).split("@")[0]
+        assert local_part == name.lower().replace(" ", ".")
+        assert local_part.count(tag) == 1
+    
+    def test_email_without_name(self):
+        """Test that an email without a name still carries a unique tag."""
+        generator = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        assert generator.email().startswith("user.run-gw0-1@")
+    
+    def test_department_name_is_tagged(self):
+        """Test that department names end with a unique tag."""
+        generator = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        prefix, _, tag = generator.department_name().partition("-")
+        assert prefix in DEPARTMENT_NAMES
+        assert tag == "run-gw0-1"
+    
+    def test_employees_are_valid_and_unique(self):
+        """Test that batch generated employees are complete and distinct."""
+        generator = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        employees = generator.employees(50, ["Engineering", "Sales"])
+        assert len({employee["name"] for employee in employees}) == 50
+        assert len({employee["email"] for employee in employees}) == 50
+        for employee in employees:
+            assert employee["department"] in ("Engineering", "Sales")
+            assert employee["status"] in STATUSES
+            assert 30000 <= employee["salary"] <= 150000
+    
+    def test_employee_is_one_of_employees(self):
+        """Test that employee() generates one record in the employees() format."""
+        generator = UniqueDataGenerator(seed=1, worker_id="gw0", run_id="run")
+        employee = generator.employee(["Engineering"])
+        assert set(employee) == {"name", "email", "department", "salary", "status"}
+        assert employee["name"].endswith("run-gw0-1")
+    
+    def test_set_generator_replaces_the_default(self):
+        """Test that set_generator changes the generator get_generator returns."""
+        previous = get_generator()
+        replacement = UniqueDataGenerator(worker_id="gw0", run_id="run")
+        try:
+            set_generator(replacement)
+            assert get_generator() is replacement
+        finally:
+            set_generator(previous)